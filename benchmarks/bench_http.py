@@ -0,0 +1,76 @@
+"""Microbenchmark of the per-request overhead in HTTPClient.
+
+Compares building a Route and the request headers the current way (cached
+route templates, headers rebuilt only when the token or client version
+changes) against the previous way (format every base URL and rebuild every
+header on each call).
+
+Usage: python benchmarks/bench_http.py [iterations]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import timeit
+from typing import Any, Dict
+from urllib.parse import quote as _uriquote
+
+from valorantx.enums import Region
+from valorantx.http import EndpointType, HTTPClient, Route
+
+PUUID = '4b3c7e4a-4d3e-5b0a-9d8e-0f1b2c3d4e5f'
+
+
+def legacy_route(method: str, path: str, region: Region, endpoint: EndpointType, **parameters: Any) -> str:
+    url = ''
+    if endpoint == EndpointType.pd:
+        url = Route.BASE_PD_URL.format(shard=str(region.shard)) + path
+    elif endpoint == EndpointType.glz:
+        url = Route.BASE_GLZ_URL.format(region=str(region), shard=str(region)) + path
+    elif endpoint == EndpointType.shard:
+        url = Route.BASE_SHARD_URL.format(shard=str(region.shard)) + path
+    elif endpoint == EndpointType.play_valorant:
+        url = Route.BASE_PLAY_VALORANT_URL + path
+    if parameters:
+        url = url.format_map({k: _uriquote(v) if isinstance(v, str) else v for k, v in parameters.items()})
+    _ = (endpoint, region, f'{method} {path}')
+    return url
+
+
+def legacy_headers(http: HTTPClient) -> Dict[str, Any]:
+    return {
+        'Authorization': 'Bearer %s' % http.riot_auth.access_token,
+        'X-Riot-Entitlements-JWT': http.riot_auth.entitlements_token,
+        'X-Riot-ClientPlatform': HTTPClient.RIOT_CLIENT_PLATFORM,
+        'X-Riot-ClientVersion': HTTPClient.RIOT_CLIENT_VERSION,
+    }
+
+
+async def main(iterations: int) -> None:
+    http = HTTPClient(asyncio.get_running_loop(), region=Region.AP, re_authorize=False)
+    http.riot_auth.access_token = 'a' * 1200
+    http.riot_auth.entitlements_token = 'e' * 900
+    http._update_auth_headers()
+    build_headers = http._HTTPClient__build_headers  # type: ignore
+
+    cases = {
+        'route (legacy)': lambda: legacy_route(
+            'GET', '/match-history/v1/history/{puuid}', Region.AP, EndpointType.pd, puuid=PUUID
+        ),
+        'route (cached)': lambda: Route(
+            'GET', '/match-history/v1/history/{puuid}', Region.AP, EndpointType.pd, puuid=PUUID
+        ),
+        'headers (legacy)': lambda: legacy_headers(http),
+        'headers (cached)': build_headers,
+    }
+
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=iterations, repeat=5))
+        print(f'{name:<18} {best / iterations * 1e9:8.0f} ns/call')
+
+    await http.connection_pool.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
@@ -0,0 +1,94 @@
+"""Memory benchmark of the match models over a corpus of stored match payloads.
+
+Builds a MatchDetails (round results included) for every payload and reports
+the memory it keeps alive, measured with tracemalloc, and the size of one
+instance of each high-cardinality model class.
+
+The corpus is either a directory of match details JSON files or the SQLite
+file of a SQLiteMatchStoreBackend.
+
+Usage: python benchmarks/bench_models_memory.py <corpus> [limit]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import gc
+import os
+import sqlite3
+import sys
+import tracemalloc
+import zlib
+from typing import Any, Dict, Iterator, Optional
+
+from valorantx import Client, utils
+from valorantx.models.match import MatchDetails
+
+
+def iter_corpus(path: str, limit: Optional[int]) -> Iterator[Dict[str, Any]]:
+    count = 0
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if not name.endswith('.json'):
+                continue
+            with open(os.path.join(path, name), 'rb') as fp:
+                yield utils._from_json(fp.read())
+            count += 1
+            if limit is not None and count >= limit:
+                return
+    else:
+        conn = sqlite3.connect(path)
+        try:
+            for (blob,) in conn.execute('SELECT data FROM match_details'):
+                yield utils._from_json(zlib.decompress(blob))
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+        finally:
+            conn.close()
+
+
+def instance_size(obj: Any) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+async def main(path: str, limit: Optional[int]) -> None:
+    client = Client()
+    payloads = list(iter_corpus(path, limit))
+    if not payloads:
+        raise SystemExit(f'no match payloads found in {path!r}')
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    matches = [MatchDetails(client, data) for data in payloads]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    counts: Dict[str, int] = collections.Counter()
+    sizes: Dict[str, int] = {}
+    module = MatchDetails.__module__
+    for obj in gc.get_objects():
+        cls = type(obj)
+        if cls.__module__ in (module, 'valorantx.models.party'):
+            counts[cls.__name__] += 1
+            sizes.setdefault(cls.__name__, instance_size(obj))
+
+    print(f'matches           {len(matches)}')
+    print(f'retained          {retained / 1024 / 1024:.2f} MiB ({retained / len(matches) / 1024:.1f} KiB per match)')
+    print(f'{"class":<22}{"instances":>10}{"bytes each":>12}')
+    for name, count in counts.most_common(15):
+        print(f'{name:<22}{count:>10}{sizes[name]:>12}')
+
+    await client.close()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        raise SystemExit(__doc__)
+    asyncio.run(main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else None))
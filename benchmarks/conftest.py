@@ -0,0 +1,106 @@
+"""Fixtures of the offline benchmark suite.
+
+Run with ``pytest benchmarks``. Every benchmark replays a cassette, the
+synthetic one by default or a recorded one with ``--cassette``:
+
+    pytest benchmarks --cassette recorded.json.gz --auth-data auth.json
+
+``auth.json`` is the :meth:`RiotAuth.to_data` of the recorded account, the
+in-game URLs carry its puuid and region.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Callable, Coroutine, Dict, Iterator, List
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from synthetic import AUTH_DATA, build_cassette
+
+import valorantx
+from valorantx.http import ConnectionPool
+from valorantx.testing import Cassette, ReplayConnectionPool
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup('valorantx', 'valorantx offline benchmarks')
+    group.addoption('--cassette', default=None, help='replay a recorded cassette instead of the synthetic one')
+    group.addoption('--auth-data', default=None, help='JSON file with the auth data of the recorded account')
+    group.addoption(
+        '--synthetic-scale',
+        type=float,
+        default=1.0,
+        help='size of the synthetic valorant-api catalogue relative to the live one',
+    )
+
+
+@pytest.fixture(scope='session')
+def cassette(pytestconfig: pytest.Config) -> Cassette:
+    path = pytestconfig.getoption('--cassette')
+    if path is not None:
+        return Cassette.load(path)
+    return build_cassette(scale=pytestconfig.getoption('--synthetic-scale'))
+
+
+@pytest.fixture(scope='session')
+def auth_data(pytestconfig: pytest.Config) -> Dict[str, Any]:
+    path = pytestconfig.getoption('--auth-data')
+    if path is None:
+        return AUTH_DATA
+    with open(path, encoding='utf-8') as fp:
+        return json.load(fp)
+
+
+@pytest.fixture(scope='session')
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    # the benchmark fixture is synchronous, coroutines are driven on this loop
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+async def _bootstrap(pool: ConnectionPool, auth_data: Dict[str, Any]) -> valorantx.Client:
+    client = valorantx.Client(
+        region=valorantx.Region(auth_data['region']),
+        re_authorize=False,
+        connection_pool=pool,
+    )
+    await client.authorize_from_data(auth_data)
+    return client
+
+
+@pytest.fixture(scope='session')
+def bootstrap(auth_data: Dict[str, Any]) -> Callable[[ConnectionPool], Coroutine[Any, Any, valorantx.Client]]:
+    """A coroutine function that authorizes a new client on the given pool and waits until it is ready."""
+
+    def bootstrap(pool: ConnectionPool) -> Coroutine[Any, Any, valorantx.Client]:
+        return _bootstrap(pool, auth_data)
+
+    return bootstrap
+
+
+@pytest.fixture(scope='session')
+def client(loop: asyncio.AbstractEventLoop, cassette: Cassette, bootstrap: Any) -> Iterator[valorantx.Client]:
+    client = loop.run_until_complete(bootstrap(ReplayConnectionPool(cassette)))
+    yield client
+    loop.run_until_complete(client.close())
+
+
+@pytest.fixture(scope='session')
+def payloads(cassette: Cassette) -> Callable[..., List[Any]]:
+    """A function returning the decoded responses of every request whose URL contains a fragment.
+
+    The test is skipped when the cassette has none.
+    """
+
+    def payloads(fragment: str, *, method: str = 'GET') -> List[Any]:
+        found = [i.json() for i in cassette.search(fragment, method=method) if i.status == 200]
+        if not found:
+            pytest.skip(f'the cassette has no {method} {fragment} responses')
+        return found
+
+    return payloads
@@ -0,0 +1,678 @@
+"""Deterministic synthetic cassette for the offline benchmarks.
+
+Builds everything a client needs to bootstrap and to serve the benchmarked
+endpoints: the whole valorant-api.com catalogue, content, configs, offers,
+storefront, wallet, favorites, loadout, match history and match details.
+
+The catalogue is generated from the valorant-api TypedDicts, with every
+localized field in every locale like ``language=all`` returns it, and sized
+like the live catalogue at ``scale=1.0``. The in-game payloads reference
+catalogue items so the models resolve them the way they do on live data.
+
+The URLs are taken from the client's own route builders, so the cassette
+stays in sync with the endpoints the client actually calls.
+"""
+
+from __future__ import annotations
+
+import random
+import typing
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from valorant.http import HTTPClient as ValorantAPIHTTPClient
+from valorant.types import (
+    agents,
+    buddies,
+    bundles,
+    ceremonies,
+    competitive_tiers,
+    content_tiers,
+    contracts,
+    currencies,
+    events,
+    gamemodes,
+    gear,
+    level_borders,
+    maps,
+    missions,
+    player_cards,
+    player_titles,
+    seasons,
+    sprays,
+    themes,
+    weapons,
+)
+
+from valorantx.enums import (
+    KINGDOM_POINT_UUID,
+    RADIANITE_POINT_UUID,
+    VALORANT_POINT_UUID,
+    AgentID,
+    ItemTypeID,
+    Locale,
+    Region,
+    SpraySlotID,
+    WeaponID,
+)
+from valorantx.http import HTTPClient
+from valorantx.testing import Cassette, Interaction
+from valorantx.valorant_api_client import GAME_MODE_URLS
+
+PUUID = '9b2a1f0e-5c3d-4e6f-8a7b-1c2d3e4f5a6b'
+
+# the data authorize_from_data is given, the tokens are never checked offline
+AUTH_DATA: Dict[str, Any] = {
+    'access_token': 'synthetic-access-token',
+    'id_token': 'synthetic-id-token',
+    'entitlements_token': 'synthetic-entitlements-token',
+    'token_type': 'Bearer',
+    'expires_at': 4102444800,
+    'user_id': PUUID,
+    'game_name': 'Synthetic',
+    'tag_line': 'BENCH',
+    'region': 'ap',
+}
+
+# a 1x1 transparent PNG
+ASSET_BYTES = bytes.fromhex(
+    '89504e470d0a1a0a0000000d4948445200000001000000010806000000'
+    '1f15c4890000000d4944415478da63f8ffff3f0005fe02fea7d6a4830000000049454e44ae426082'
+)
+
+LOCALES = sorted({locale.value for locale in Locale})
+
+MAP_NAMES = ('Ascent', 'Bind', 'Breeze', 'Fracture', 'Haven', 'Icebox', 'Lotus', 'Pearl', 'Split', 'Sunset')
+
+# live catalogue sizes, multiplied by the scale
+CATALOGUE_SIZES: Dict[str, int] = {
+    'buddies': 500,
+    'bundles': 180,
+    'contracts': 120,
+    'events': 25,
+    'missions': 400,
+    'player_cards': 800,
+    'player_titles': 600,
+    'sprays': 700,
+    'themes': 250,
+    'skins_per_weapon': 70,
+}
+
+# how many items the generic generator puts in lists, by key
+_LIST_SIZES: Dict[str, int] = {
+    'abilities': 5,
+    'borders': 9,
+    'callouts': 25,
+    'chapters': 5,
+    'damageRanges': 3,
+    'levels': 5,
+    'mediaList': 1,
+    'objectives': 1,
+    'freeRewards': 1,
+}
+
+_TIME_KEYS = frozenset({'startTime', 'endTime', 'activationDate', 'expirationDate', 'buildDate'})
+_URL_HINTS = ('icon', 'art', 'image', 'render', 'portrait', 'splash', 'wallpaper', 'background', 'video', 'gif', 'png')
+_URL_HINTS += ('swatch', 'appearance', 'wave', 'wwise')
+
+
+class _Generator:
+    def __init__(self, seed: int) -> None:
+        self.rng: random.Random = random.Random(seed)
+        self._counter: int = 0
+
+    def uuid(self) -> str:
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def localized(self, text: str) -> Dict[str, str]:
+        return dict.fromkeys(LOCALES, text)
+
+    def string(self, key: str) -> str:
+        self._counter += 1
+        lowered = key.lower()
+        if key == 'uuid' or lowered.endswith('uuid'):
+            return self.uuid()
+        if key in _TIME_KEYS:
+            return '2023-06-27T00:00:00Z'
+        if 'color' in lowered:
+            return 'ff4655ff'
+        if key == 'assetPath':
+            return f'ShooterGame/Content/Synthetic/Asset{self._counter}_PrimaryAsset'
+        if any(hint in lowered for hint in _URL_HINTS):
+            return f'https://media.valorant-api.com/synthetic/{self.uuid()}/{lowered}.png'
+        return f'{key}{self._counter}'
+
+    def build(self, tp: Any, key: str = '') -> Any:
+        if typing.is_typeddict(tp):
+            return {k: self.build(v, k) for k, v in typing.get_type_hints(tp).items()}
+
+        origin = typing.get_origin(tp)
+        args = typing.get_args(tp)
+        if origin is typing.Union:
+            options = [arg for arg in args if arg is not type(None)]
+            if any(typing.get_origin(arg) is dict for arg in options) and str in options:
+                return self.localized(f'{key} {self._counter}')
+            return self.build(options[0], key)
+        if origin is list:
+            return [self.build(args[0], key) for _ in range(_LIST_SIZES.get(key, 2))]
+        if origin is dict:
+            return {}
+        if tp is str:
+            return self.string(key)
+        if tp is bool:
+            return self.rng.random() < 0.5
+        if tp is int:
+            return self.rng.randint(0, 100)
+        if tp is float:
+            return round(self.rng.uniform(0, 100), 3)
+        return None
+
+    def items(self, tp: Any, count: int) -> List[Dict[str, Any]]:
+        return [self.build(tp) for _ in range(count)]
+
+
+def _route_of(client: Any, call: Callable[[Any], Any]) -> Tuple[str, str, Optional[Dict[str, Any]]]:
+    # the request methods only build a Route and hand it to request(), capture it instead
+    captured: Dict[str, Any] = {}
+
+    def request(route: Any, **kwargs: Any) -> None:
+        captured['route'] = route
+        captured['params'] = kwargs.get('params')
+
+    client.request = request
+    call(client)
+    route = captured['route']
+    return route.method, route.url, captured['params']
+
+
+class SyntheticData:
+    """The payloads of the synthetic cassette, kept around for benchmarks that need them directly.
+
+    Parameters
+    ----------
+    scale: :class:`float`
+        The size of the catalogue relative to the live one.
+    matches: :class:`int`
+        The amount of match details to generate.
+    seed: :class:`int`
+        The seed of every random choice.
+    """
+
+    def __init__(self, *, scale: float = 1.0, matches: int = 20, seed: int = 0) -> None:
+        self.gen: _Generator = _Generator(seed)
+        self.scale: float = scale
+        self.catalogue: Dict[str, Any] = {}
+        self.version: Dict[str, Any] = {}
+        self.content: Dict[str, Any] = {}
+        self.offers: Dict[str, Any] = {}
+        self.storefront: Dict[str, Any] = {}
+        self.wallet: Dict[str, Any] = {}
+        self.favorites: Dict[str, Any] = {}
+        self.loadout: Dict[str, Any] = {}
+        self.match_details: List[Dict[str, Any]] = []
+        self._build_catalogue()
+        self._build_player()
+        for i in range(matches):
+            self.match_details.append(self._build_match(i))
+
+    def _size(self, name: str) -> int:
+        return max(1, int(CATALOGUE_SIZES[name] * self.scale))
+
+    # valorant-api.com
+
+    def _build_catalogue(self) -> None:
+        gen = self.gen
+        data: Dict[str, List[Dict[str, Any]]] = {}
+
+        data['agents'] = gen.items(agents.Agent, len(AgentID))
+        for agent, agent_id in zip(data['agents'], AgentID):
+            agent['uuid'] = agent_id.value
+            agent['displayName'] = gen.localized(agent_id.name.title())
+            agent['isPlayableCharacter'] = True
+
+        data['buddies'] = gen.items(buddies.Buddy, self._size('buddies'))
+        for buddy in data['buddies']:
+            del buddy['levels'][1:]
+        data['bundles'] = gen.items(bundles.Bundle, self._size('bundles'))
+        data['ceremonies'] = gen.items(ceremonies.Ceremony, 8)
+
+        data['competitive_tiers'] = gen.items(competitive_tiers.CompetitiveTier, 5)
+        for tiers in data['competitive_tiers']:
+            tiers['tiers'] = [gen.build(competitive_tiers.Tier) for _ in range(28)]
+            for number, tier in enumerate(tiers['tiers']):
+                tier['tier'] = number
+
+        data['content_tiers'] = gen.items(content_tiers.ContentTier, 5)
+        data['contracts'] = gen.items(contracts.Contract, self._size('contracts'))
+
+        data['currencies'] = gen.items(currencies.Currency, 5)
+        for currency, currency_id in zip(
+            data['currencies'], (VALORANT_POINT_UUID, RADIANITE_POINT_UUID, KINGDOM_POINT_UUID)
+        ):
+            currency['uuid'] = currency_id
+
+        data['events'] = gen.items(events.Event, self._size('events'))
+
+        data['game_modes'] = gen.items(gamemodes.GameMode, len(GAME_MODE_URLS) + 4)
+        for game_mode, game_mode_id in zip(data['game_modes'], GAME_MODE_URLS.values()):
+            game_mode['uuid'] = game_mode_id
+        data['game_mode_equippables'] = gen.items(gamemodes.GameModeEquippable, 15)
+        data['gear'] = gen.items(gear.Gear_, 3)
+
+        data['level_borders'] = gen.items(level_borders.LevelBorder, 25)
+        for number, border in enumerate(data['level_borders']):
+            border['startingLevel'] = max(1, number * 20)
+
+        data['maps'] = gen.items(maps.Map, len(MAP_NAMES))
+        for map_, name in zip(data['maps'], MAP_NAMES):
+            map_['displayName'] = gen.localized(name)
+            map_['mapUrl'] = f'/Game/Maps/{name}/{name}'
+
+        data['missions'] = gen.items(missions.Mission, self._size('missions'))
+        data['player_cards'] = gen.items(player_cards.PlayerCard, self._size('player_cards'))
+        data['player_titles'] = gen.items(player_titles.PlayerTitle, self._size('player_titles'))
+
+        # 10 episodes of 3 acts, the last act is the current one
+        data['seasons'] = []
+        for _ in range(10):
+            episode = gen.build(seasons.Season)
+            episode.update(type='EAresSeasonType::Episode', parentUuid=None)
+            data['seasons'].append(episode)
+            for _ in range(3):
+                act = gen.build(seasons.Season)
+                act.update(type='EAresSeasonType::Act', parentUuid=episode['uuid'])
+                data['seasons'].append(act)
+        acts = [season for season in data['seasons'] if season['parentUuid'] is not None]
+        data['competitive_seasons'] = gen.items(seasons.CompetitiveSeason, len(acts))
+        for competitive_season, act in zip(data['competitive_seasons'], acts):
+            competitive_season['seasonUuid'] = act['uuid']
+            competitive_season['competitiveTiersUuid'] = gen.rng.choice(data['competitive_tiers'])['uuid']
+
+        data['sprays'] = gen.items(sprays.Spray, self._size('sprays'))
+        for spray in data['sprays']:
+            del spray['levels'][1:]
+        data['themes'] = gen.items(themes.Theme, self._size('themes'))
+
+        data['weapons'] = []
+        for weapon_id in WeaponID:
+            weapon = gen.build(weapons.Weapon)
+            weapon['uuid'] = weapon_id.value
+            weapon['displayName'] = gen.localized(weapon_id.name.title())
+            weapon['skins'] = []
+            for _ in range(self._size('skins_per_weapon')):
+                skin = gen.build(weapons.Skin)
+                skin['levels'] = [gen.build(weapons.Level, 'level') for _ in range(gen.rng.randint(1, 5))]
+                skin['chromas'] = [gen.build(weapons.Chroma, 'chroma') for _ in range(gen.rng.randint(1, 4))]
+                weapon['skins'].append(skin)
+            weapon['defaultSkinUuid'] = weapon['skins'][0]['uuid']
+            data['weapons'].append(weapon)
+
+        self.catalogue = data
+        self.version = {
+            'manifestId': 'C330DEF8E1A7EA8B',
+            'branch': 'release-07.04',
+            'version': '07.04.00.2053331',
+            'buildVersion': '18',
+            'engineVersion': '4.26.2.0',
+            'riotClientVersion': 'release-07.04-shipping-18-2053331',
+            'riotClientBuild': '74.0.2.1085.2183',
+            'buildDate': '2023-08-22T00:00:00Z',
+        }
+
+    # in-game API
+
+    def _skin_levels(self) -> List[Dict[str, Any]]:
+        return [level for weapon in self.catalogue['weapons'] for skin in weapon['skins'] for level in skin['levels']]
+
+    def _offer(self, item_type: ItemTypeID, item_id: str, cost: int) -> Dict[str, Any]:
+        return {
+            'OfferID': item_id,
+            'IsDirectPurchase': True,
+            'StartDate': '2023-06-27T00:00:00Z',
+            'Cost': {VALORANT_POINT_UUID: cost},
+            'Rewards': [{'ItemTypeID': item_type.value, 'ItemID': item_id, 'Quantity': 1}],
+        }
+
+    def _build_player(self) -> None:
+        gen = self.gen
+        catalogue = self.catalogue
+        skin_levels = self._skin_levels()
+
+        seasons_content = []
+        for season in catalogue['seasons']:
+            seasons_content.append({
+                'ID': season['uuid'],
+                'Name': season['displayName']['en-US'],
+                'Type': 'episode' if season['parentUuid'] is None else 'act',
+                'StartTime': '2023-06-27T00:00:00Z',
+                'EndTime': '2023-08-29T00:00:00Z',
+                'IsActive': False,
+            })
+        # the current episode and act
+        seasons_content[-4]['IsActive'] = seasons_content[-1]['IsActive'] = True
+        self.content = {'DisabledIDs': [], 'Seasons': seasons_content, 'Events': []}
+
+        offers = [self._offer(ItemTypeID.skin_level, level['uuid'], 1775) for level in skin_levels[::3]]
+        offers += [self._offer(ItemTypeID.buddy_level, b['levels'][0]['uuid'], 475) for b in catalogue['buddies']]
+        offers += [self._offer(ItemTypeID.spray, spray['uuid'], 325) for spray in catalogue['sprays']]
+        offers += [self._offer(ItemTypeID.player_card, card['uuid'], 375) for card in catalogue['player_cards']]
+        self.offers = {'Offers': offers}
+
+        def bundle(bundle_data: Dict[str, Any]) -> Dict[str, Any]:
+            items = []
+            for level in gen.rng.sample(skin_levels, 5):
+                items.append({
+                    'Item': {'ItemTypeID': ItemTypeID.skin_level.value, 'ItemID': level['uuid'], 'Amount': 1},
+                    'BasePrice': 1775,
+                    'CurrencyID': VALORANT_POINT_UUID,
+                    'DiscountPercent': 0,
+                    'DiscountedPrice': 1775,
+                    'IsPromoItem': False,
+                })
+            return {
+                'ID': gen.uuid(),
+                'DataAssetID': bundle_data['uuid'],
+                'CurrencyID': VALORANT_POINT_UUID,
+                'Items': items,
+                'ItemOffers': None,
+                'TotalBaseCost': None,
+                'TotalDiscountedCost': None,
+                'TotalDiscountPercent': 0.0,
+                'DurationRemainingInSeconds': 86400,
+                'WholesaleOnly': False,
+            }
+
+        featured = [bundle(b) for b in catalogue['bundles'][:3]]
+        daily = [self._offer(ItemTypeID.skin_level, level['uuid'], 1775) for level in gen.rng.sample(skin_levels, 4)]
+        night_market = []
+        for level in gen.rng.sample(skin_levels, 6):
+            night_market.append({
+                'BonusOfferID': gen.uuid(),
+                'Offer': self._offer(ItemTypeID.skin_level, level['uuid'], 1775),
+                'DiscountPercent': 30,
+                'DiscountCosts': {VALORANT_POINT_UUID: 1242},
+                'IsSeen': True,
+            })
+        accessories = []
+        for card in gen.rng.sample(catalogue['player_cards'], 4):
+            accessories.append({
+                'Offer': self._offer(ItemTypeID.player_card, card['uuid'], 2000),
+                'ContractID': catalogue['contracts'][0]['uuid'],
+            })
+        self.storefront = {
+            'FeaturedBundle': {'Bundle': featured[0], 'Bundles': featured, 'BundleRemainingDurationInSeconds': 86400},
+            'SkinsPanelLayout': {
+                'SingleItemOffers': [offer['OfferID'] for offer in daily],
+                'SingleItemStoreOffers': daily,
+                'SingleItemOffersRemainingDurationInSeconds': 3600,
+            },
+            'UpgradeCurrencyStore': {'UpgradeCurrencyOffers': []},
+            'BonusStore': {'BonusStoreOffers': night_market, 'BonusStoreRemainingDurationInSeconds': 604800},
+            'AccessoryStore': {
+                'AccessoryStoreOffers': accessories,
+                'AccessoryStoreRemainingDurationInSeconds': 604800,
+                'StorefrontID': gen.uuid(),
+            },
+        }
+        self.wallet = {'Balances': {VALORANT_POINT_UUID: 1000, RADIANITE_POINT_UUID: 40, KINGDOM_POINT_UUID: 5000}}
+
+        guns = []
+        favorited: Dict[str, Dict[str, str]] = {}
+        for weapon in catalogue['weapons']:
+            skin = gen.rng.choice(weapon['skins'])
+            buddy = gen.rng.choice(catalogue['buddies'])
+            guns.append({
+                'ID': weapon['uuid'],
+                'SkinID': skin['uuid'],
+                'SkinLevelID': skin['levels'][-1]['uuid'],
+                'ChromaID': skin['chromas'][-1]['uuid'],
+                'CharmInstanceID': gen.uuid(),
+                'CharmID': buddy['uuid'],
+                'CharmLevelID': buddy['levels'][0]['uuid'],
+                'Attachments': [],
+            })
+            favorited[skin['chromas'][-1]['uuid']] = {'FavoriteID': gen.uuid(), 'ItemID': skin['chromas'][-1]['uuid']}
+        loadout_sprays = []
+        for slot, spray in zip(SpraySlotID, gen.rng.sample(catalogue['sprays'], len(SpraySlotID))):
+            loadout_sprays.append({'EquipSlotID': slot.value, 'SprayID': spray['uuid'], 'SprayLevelID': None})
+        self.favorites = {'Subject': PUUID, 'FavoritedContent': favorited}
+        self.loadout = {
+            'Subject': PUUID,
+            'Version': 42,
+            'Guns': guns,
+            'Sprays': loadout_sprays,
+            'Identity': {
+                'PlayerCardID': catalogue['player_cards'][0]['uuid'],
+                'PlayerTitleID': catalogue['player_titles'][0]['uuid'],
+                'AccountLevel': 187,
+                'PreferredLevelBorderID': catalogue['level_borders'][-1]['uuid'],
+                'HideAccountLevel': False,
+            },
+            'Incognito': False,
+        }
+
+    def _build_match(self, index: int) -> Dict[str, Any]:
+        gen = self.gen
+        rng = gen.rng
+        catalogue = self.catalogue
+        rounds = rng.randint(13, 25)
+        puuids = [PUUID] + [gen.uuid() for _ in range(9)]
+        team = {puuid: 'Blue' if i < 5 else 'Red' for i, puuid in enumerate(puuids)}
+        weapon_ids = [weapon_id.value for weapon_id in WeaponID]
+        current_season = catalogue['competitive_seasons'][-1]['seasonUuid']
+
+        def location() -> Dict[str, int]:
+            return {'x': rng.randint(-9000, 9000), 'y': rng.randint(-9000, 9000)}
+
+        def player_locations() -> List[Dict[str, Any]]:
+            return [
+                {'subject': p, 'viewRadians': round(rng.uniform(0, 6.28), 4), 'location': location()} for p in puuids
+            ]
+
+        players = []
+        for i, puuid in enumerate(puuids):
+            players.append({
+                'subject': puuid,
+                'gameName': f'Player{i}',
+                'tagLine': f'{1000 + i}',
+                'platformInfo': {
+                    'platformType': 'PC',
+                    'platformOS': 'Windows',
+                    'platformOSVersion': '10.0.19042.1.256.64bit',
+                    'platformChipset': 'Unknown',
+                },
+                'teamId': team[puuid],
+                'partyId': gen.uuid(),
+                'characterId': rng.choice(catalogue['agents'])['uuid'],
+                'stats': {
+                    'score': rng.randint(2000, 8000),
+                    'roundsPlayed': rounds,
+                    'kills': rng.randint(5, 30),
+                    'deaths': rng.randint(5, 25),
+                    'assists': rng.randint(0, 10),
+                    'playtimeMillis': rounds * 100000,
+                    'abilityCasts': {'grenadeCasts': 3, 'ability1Casts': 5, 'ability2Casts': 7, 'ultimateCasts': 1},
+                },
+                'roundDamage': [
+                    {'round': r, 'receiver': rng.choice(puuids), 'damage': rng.randint(0, 150)} for r in range(rounds)
+                ],
+                'competitiveTier': rng.randint(3, 27),
+                'isObserver': False,
+                'playerCard': rng.choice(catalogue['player_cards'])['uuid'],
+                'playerTitle': rng.choice(catalogue['player_titles'])['uuid'],
+                'preferredLevelBorder': rng.choice(catalogue['level_borders'])['uuid'],
+                'accountLevel': rng.randint(20, 400),
+                'sessionPlaytimeMinutes': 40,
+                'xpModifications': [],
+                'behaviorFactors': {'afkRounds': 0, 'collisions': 0.0, 'damageParticipationOutgoing': 1200},
+                'newPlayerExperienceDetails': {},
+            })
+
+        round_results = []
+        for r in range(rounds):
+            stats = []
+            for puuid in puuids:
+                enemies = [q for q in puuids if team[q] != team[puuid]]
+                kills = []
+                for _ in range(rng.randint(0, 2)):
+                    kills.append({
+                        'gameTime': rng.randint(0, 3000000),
+                        'roundTime': rng.randint(0, 100000),
+                        'killer': puuid,
+                        'victim': rng.choice(enemies),
+                        'victimLocation': location(),
+                        'assistants': [q for q in puuids if team[q] == team[puuid] and q != puuid][: rng.randint(0, 2)],
+                        'playerLocations': player_locations(),
+                        'finishingDamage': {
+                            'damageType': 'Weapon',
+                            'damageItem': rng.choice(weapon_ids).upper(),
+                            'isSecondaryFireMode': False,
+                        },
+                    })
+                damage = []
+                for enemy in enemies[: rng.randint(0, 3)]:
+                    damage.append({
+                        'receiver': enemy,
+                        'damage': rng.randint(0, 150),
+                        'legshots': rng.randint(0, 2),
+                        'bodyshots': rng.randint(0, 3),
+                        'headshots': rng.randint(0, 2),
+                    })
+                stats.append({
+                    'subject': puuid,
+                    'kills': kills,
+                    'damage': damage,
+                    'score': rng.randint(0, 600),
+                    'economy': {
+                        'loadoutValue': 3900,
+                        'weapon': rng.choice(weapon_ids),
+                        'armor': '',
+                        'remaining': 100,
+                        'spent': 3900,
+                    },
+                    'ability': {},
+                    'wasAfk': False,
+                    'wasPenalized': False,
+                    'stayedInSpawn': False,
+                })
+            round_results.append({
+                'roundNum': r,
+                'roundResult': 'Eliminated',
+                'roundCeremony': 'CeremonyDefault',
+                'winningTeam': rng.choice(['Blue', 'Red']),
+                'bombPlanter': rng.choice(puuids[5:]),
+                'plantRoundTime': rng.randint(0, 100000),
+                'plantSite': rng.choice('ABC'),
+                'plantLocation': location(),
+                'plantPlayerLocations': player_locations(),
+                'roundResultCode': 'Elimination',
+                'playerStats': stats,
+                'playerEconomies': [
+                    {'subject': q, 'loadoutValue': 3900, 'weapon': '', 'armor': '', 'remaining': 100, 'spent': 3900}
+                    for q in puuids
+                ],
+                'playerScores': [{'subject': q, 'score': rng.randint(0, 600)} for q in puuids],
+            })
+
+        blue_won = rng.random() < 0.5
+        return {
+            'matchInfo': {
+                'matchId': gen.uuid(),
+                'mapId': rng.choice(catalogue['maps'])['mapUrl'],
+                'gamePodId': 'aresriot.aws-rclusterprod-ape1-1.ap-gp-hongkong-1',
+                'gameLoopZone': 'hongkong',
+                'gameServerAddress': '127.0.0.1',
+                'gameVersion': self.version['riotClientVersion'],
+                'gameLengthMillis': rounds * 100000,
+                'gameStartMillis': 1693000000000 + index * 3600000,
+                'provisioningFlowID': 'Matchmaking',
+                'isCompleted': True,
+                'customGameName': '',
+                'forcePostProcessing': False,
+                'queueID': 'competitive',
+                'gameMode': next(iter(GAME_MODE_URLS)),
+                'isRanked': True,
+                'isMatchSampled': False,
+                'seasonId': current_season,
+                'completionState': 'Completed',
+                'platformType': 'PC',
+                'premierMatchInfo': {},
+                'partyRRPenalties': {},
+                'shouldMatchDisablePenalties': False,
+            },
+            'players': players,
+            'bots': [],
+            'coaches': [],
+            'teams': [
+                {'teamId': 'Blue', 'won': blue_won, 'roundsPlayed': rounds, 'roundsWon': 13, 'numPoints': 13},
+                {
+                    'teamId': 'Red',
+                    'won': not blue_won,
+                    'roundsPlayed': rounds,
+                    'roundsWon': rounds - 13,
+                    'numPoints': 11,
+                },
+            ],
+            'roundResults': round_results,
+        }
+
+    # cassette
+
+    def cassette(self) -> Cassette:
+        """Returns a cassette answering every request of the bootstrap and the benchmarked endpoints."""
+        cassette = Cassette()
+
+        api = ValorantAPIHTTPClient()
+        for name, items in self.catalogue.items():
+            method, url, params = _route_of(api, lambda http, name=name: getattr(http, f'get_{name}')())
+            cassette.add_json(method, url, {'status': 200, 'data': items}, params=params)
+        method, url, params = _route_of(api, lambda http: http.get_version())
+        cassette.add_json(method, url, {'status': 200, 'data': self.version}, params=params)
+
+        # skip __init__, the route builders only read the region and the puuid
+        http = HTTPClient.__new__(HTTPClient)
+        http.region = Region.AP
+        http._puuid = PUUID
+        for region in Region:
+            if region is Region.PBE:
+                continue
+            collapsed = {'loginqueue.region': region.value, 'playerfeedbacktool.shard': str(region.shard)}
+            method, url, params = _route_of(http, lambda http, region=region: http.get_config(region))
+            cassette.add_json(method, url, {'LastApplication': '2023-08-22T00:00:00Z', 'Collapsed': collapsed})
+
+        payloads: List[Tuple[Callable[[Any], Any], Any]] = [
+            (lambda http: http.get_content(), self.content),
+            (lambda http: http.get_store_offers(), self.offers),
+            (lambda http: http.post_store_storefront(), self.storefront),
+            (lambda http: http.get_store_wallet(), self.wallet),
+            (lambda http: http.get_favorites(), self.favorites),
+            (lambda http: http.get_personal_player_loadout(), self.loadout),
+        ]
+        for call, payload in payloads:
+            method, url, params = _route_of(http, call)
+            cassette.add_json(method, url, payload, params=params)
+
+        history = []
+        for match in self.match_details:
+            info = match['matchInfo']
+            method, url, params = _route_of(http, lambda http, info=info: http.get_match_details(info['matchId']))
+            cassette.add_json(method, url, match, params=params)
+            history.append({
+                'MatchID': info['matchId'],
+                'GameStartTime': info['gameStartMillis'],
+                'QueueID': 'competitive',
+            })
+        # the display icon of every agent, for read_from_url
+        for agent in self.catalogue['agents']:
+            cassette.append(Interaction('GET', agent['displayIcon'], 200, {'Content-Type': 'image/png'}, ASSET_BYTES))
+
+        history.sort(key=lambda entry: entry['GameStartTime'], reverse=True)
+        method, url, params = _route_of(http, lambda http: http.get_match_history(PUUID, 0, len(history)))
+        history_payload = {'Subject': PUUID, 'BeginIndex': 0, 'EndIndex': len(history), 'Total': len(history)}
+        cassette.add_json(method, url, {**history_payload, 'History': history}, params=params)
+        return cassette
+
+
+def build_cassette(*, scale: float = 1.0, matches: int = 20, seed: int = 0) -> Cassette:
+    """Builds the synthetic cassette, see :class:`SyntheticData`."""
+    return SyntheticData(scale=scale, matches=matches, seed=seed).cassette()
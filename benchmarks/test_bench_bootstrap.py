@@ -0,0 +1,65 @@
+"""Benchmarks of the asset cache load and of the whole client bootstrap."""
+
+from __future__ import annotations
+
+import pytest
+
+from valorantx.enums import Locale
+from valorantx.testing import FakeRiotServer, ReplayConnectionPool
+from valorantx.valorant_api_client import Client as ValorantAPIClient
+
+
+def test_asset_cache_load(benchmark, loop, cassette):
+    async def load():
+        valorant_api = ValorantAPIClient(ReplayConnectionPool(cassette), Locale.american_english)
+        await valorant_api.init()
+        await valorant_api.close()
+        return valorant_api
+
+    valorant_api = benchmark(lambda: loop.run_until_complete(load()))
+    assert valorant_api.version is not None
+
+
+def test_bootstrap_in_process(benchmark, loop, cassette, bootstrap):
+    # authorize, load the assets, then offers, content and configs
+    async def run():
+        cassette.rewind()
+        client = await bootstrap(ReplayConnectionPool(cassette))
+        await client.close()
+        return client
+
+    client = benchmark.pedantic(lambda: loop.run_until_complete(run()), rounds=5)
+    assert client.version is not None
+
+
+@pytest.mark.parametrize('latency', [0.0, 0.02], ids=['no-latency', '20ms'])
+def test_bootstrap_over_http(benchmark, loop, cassette, bootstrap, latency):
+    # the same, through aiohttp and a local server answering every route
+    server = FakeRiotServer(cassette, latency=latency)
+    loop.run_until_complete(server.start())
+
+    async def run():
+        cassette.rewind()
+        pool = server.connection_pool()
+        client = await bootstrap(pool)
+        await client.close()
+        await pool.close()
+        return client
+
+    try:
+        client = benchmark.pedantic(lambda: loop.run_until_complete(run()), rounds=5)
+    finally:
+        loop.run_until_complete(server.stop())
+
+    assert client.version is not None
+    assert not server.misses
+
+
+def test_read_from_url(benchmark, loop, client, cassette):
+    urls = [agent.display_icon.url for agent in client.valorant_api.agents if agent.display_icon is not None]
+
+    async def read():
+        return [await client.http.read_from_url(url) for url in urls]
+
+    assets = benchmark(lambda: loop.run_until_complete(read()))
+    assert all(assets)
@@ -0,0 +1,58 @@
+"""Benchmarks of the models built from in-game API responses."""
+
+from __future__ import annotations
+
+from valorantx.models.favorites import Favorites
+from valorantx.models.loadout import Loadout
+from valorantx.models.match import MatchDetails
+from valorantx.models.store import StoreFront
+
+
+def test_match_details(benchmark, client, payloads):
+    matches = payloads('/match-details/v1/matches/')
+
+    def parse():
+        return [MatchDetails(client, data) for data in matches]
+
+    parsed = benchmark(parse)
+    assert len(parsed) == len(matches)
+
+
+def test_match_details_lazy(benchmark, client, payloads):
+    matches = payloads('/match-details/v1/matches/')
+
+    def parse():
+        return [MatchDetails(client, data, lazy=True) for data in matches]
+
+    benchmark(parse)
+
+
+def test_match_details_round_results(benchmark, client, payloads):
+    matches = payloads('/match-details/v1/matches/')
+
+    def parse():
+        # round results and kills are what the match screens render
+        for data in matches:
+            match = MatchDetails(client, data, lazy=True)
+            assert match.round_results is not None
+            assert match.kills is not None
+
+    benchmark(parse)
+
+
+def test_storefront(benchmark, client, payloads):
+    data = payloads('/store/v3/storefront/', method='POST')[-1]
+    storefront = benchmark(StoreFront, client.valorant_api.cache, data)
+    assert storefront.skins_panel_layout.skins
+
+
+def test_loadout(benchmark, client, payloads):
+    favorites_data = payloads('/favorites/v1/players/')[-1]
+    data = payloads('/playerloadout')[-1]
+
+    def build():
+        favorites = Favorites(state=client.valorant_api.cache, data=favorites_data)
+        return Loadout(client, data, favorites=favorites)
+
+    loadout = benchmark(build)
+    assert loadout.guns is not None
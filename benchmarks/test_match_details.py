@@ -0,0 +1,154 @@
+"""Regression tests of the match details models on the synthetic matches.
+
+Not benchmarks, they share the bootstrapped client and the payloads of the suite.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from synthetic import PUUID
+
+from valorantx.models import match as match_module
+from valorantx.models.match import MatchDetails, MatchPlayer, OpponentStats, PlayerStats
+
+OPPONENT_FIELDS = (
+    'kills',
+    'assists',
+    'deaths',
+    'damages',
+    'head_shots',
+    'body_shots',
+    'leg_shots',
+    'opponent_kills',
+    'opponent_assists',
+    'opponent_deaths',
+    'opponent_damages',
+    'opponent_head_shots',
+    'opponent_body_shots',
+    'opponent_leg_shots',
+)
+
+
+def rounds(match: MatchDetails) -> List[Tuple[Any, ...]]:
+    return [
+        (
+            round_result.round_number,
+            round_result.round_result,
+            round_result.round_result_code,
+            round_result.winning_team.id if round_result.winning_team is not None else None,
+            [(stat.subject, stat.score, len(stat.kills), len(stat.damage)) for stat in round_result.player_stats],
+        )
+        for round_result in match.round_results
+    ]
+
+
+def kills(match: MatchDetails) -> List[Tuple[Any, ...]]:
+    return [
+        (kill.round_time, kill._killer_uuid, kill._victim_uuid, tuple(kill._assistants_list)) for kill in match.kills
+    ]
+
+
+def player_stats(match: MatchDetails) -> Dict[str, Dict[str, Any]]:
+    names = PlayerStats._ROUND_STATS + ('score', 'kills', 'deaths', 'assists', 'acs')
+    return {player.puuid: {name: getattr(player.stats, name) for name in names} for player in match.players}
+
+
+class TestLazyMatchDetails:
+    def test_same_as_eager(self, client, payloads) -> None:
+        for data in payloads('/match-details/v1/matches/'):
+            eager = MatchDetails(client, data)
+            lazy = MatchDetails(client, data, lazy=True)
+            # the round counters are read before the rounds, they build them
+            assert player_stats(lazy) == player_stats(eager)
+            assert rounds(lazy) == rounds(eager)
+            assert kills(lazy) == kills(eager)
+
+            lazy = MatchDetails(client, data, lazy=True)
+            assert rounds(lazy) == rounds(eager)
+            assert kills(lazy) == kills(eager)
+            assert player_stats(lazy) == player_stats(eager)
+
+    def test_failed_build_is_retried(self, client, payloads, monkeypatch) -> None:
+        data = payloads('/match-details/v1/matches/')[0]
+        eager = MatchDetails(client, data)
+        lazy = MatchDetails(client, data, lazy=True)
+
+        round_result = match_module.RoundResult
+        calls: List[int] = []
+
+        def failing(match: MatchDetails, payload: Any) -> Any:
+            calls.append(payload['roundNum'])
+            # e.g. an asset the cache does not know yet, after some rounds were counted
+            if len(calls) == 3:
+                raise KeyError('unknown asset')
+            return round_result(match, payload)
+
+        monkeypatch.setattr(match_module, 'RoundResult', failing)
+        with pytest.raises(KeyError):
+            lazy.round_results  # noqa: B018
+        monkeypatch.setattr(match_module, 'RoundResult', round_result)
+
+        # the half-built rounds were dropped instead of left as None or counted twice
+        assert player_stats(lazy) == player_stats(eager)
+        assert rounds(lazy) == rounds(eager)
+        assert kills(lazy) == kills(eager)
+
+
+def scan(match: MatchDetails, player: MatchPlayer, opponent: MatchPlayer) -> Dict[str, int]:
+    # what OpponentStats counted by scanning every event, with the assists of the player fixed
+    stats = dict.fromkeys(OPPONENT_FIELDS, 0)
+    for kill in match.kills:
+        if kill.killer == player and kill.victim == opponent:
+            stats['kills'] += 1
+            stats['opponent_deaths'] += 1
+        if kill.killer == opponent and kill.victim == player:
+            stats['opponent_kills'] += 1
+            stats['deaths'] += 1
+        if kill.victim == player and opponent in kill.assistants:
+            stats['opponent_assists'] += 1
+        if kill.victim == opponent and player in kill.assistants:
+            stats['assists'] += 1
+
+    for round_result in match.round_results:
+        for stat in round_result.player_stats:
+            for dmg in stat.damage:
+                if stat.subject == player.puuid and dmg.receiver == opponent:
+                    prefix = ''
+                elif stat.subject == opponent.puuid and dmg.receiver == player:
+                    prefix = 'opponent_'
+                else:
+                    continue
+                stats[prefix + 'damages'] += dmg.damage
+                stats[prefix + 'head_shots'] += dmg.head_shots
+                stats[prefix + 'body_shots'] += dmg.body_shots
+                stats[prefix + 'leg_shots'] += dmg.leg_shots
+    return stats
+
+
+def fields(stats: OpponentStats) -> Dict[str, int]:
+    return {name: getattr(stats, name) for name in OPPONENT_FIELDS}
+
+
+class TestOpponentStats:
+    def test_same_as_scan(self, client, payloads) -> None:
+        for data in payloads('/match-details/v1/matches/'):
+            match = MatchDetails(client, data)
+            for player in match.players:
+                for stats in player.get_opponents_stats():
+                    assert fields(stats) == scan(match, player, stats.opponent)
+
+    def test_assists(self, client, payloads, pytestconfig) -> None:
+        if pytestconfig.getoption('--cassette') is not None:
+            pytest.skip('pinned to the synthetic matches')
+
+        match = MatchDetails(client, payloads('/match-details/v1/matches/')[0])
+        player = match.get_player(PUUID)
+        assert player is not None
+        opponents = player.get_opponents_stats()
+
+        # every kill of the opponent the player assisted counts, the scan only counted kills without a killer
+        assert [stats.assists for stats in opponents] == [11, 8, 9, 14, 12]
+        assert all(kill.killer is not None for kill in match.kills)
+        assert [stats.opponent_assists for stats in opponents] == [7, 2, 1, 0, 0]
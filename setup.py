@@ -19,6 +19,7 @@ with open('README.md') as f:
 extras_require = {
     'local': ['urllib3>=1.26.15,<1.27'],
     'speed': ['orjson>=3.8.11,<4.0'],
+    'analytics': ['numpy>=1.21'],
 }
 
 packages = [
@@ -12,6 +12,9 @@ from dotenv import load_dotenv
 from valorant import Client as ValorantAPIClient
 
 import valorantx as valorantx
+from valorantx import name_resolver, response_cache, retry
+from valorantx.http import HTTPClient
+from valorantx.testing import Cassette, ReplayConnectionPool
 
 try:
     import uvloop  # type: ignore
@@ -24,15 +27,27 @@ else:
 load_dotenv()
 
 username = os.getenv('RIOT_USERNAME')
-assert username is not None
 password = os.getenv('RIOT_PASSWORD')
-assert password is not None
+
+
+# the puuid of the ``authorized_client`` fixture
+PUUID = '00000000-0000-0000-0000-000000000001'
+
+# the modules whose clock the ``clock`` fixture replaces by default
+CLOCK_MODULES = (name_resolver, response_cache, retry)
+
+
+def _require_riot_account() -> None:
+    # the offline tests run without an account, the live ones are skipped
+    if username is None or password is None:
+        pytest.skip('RIOT_USERNAME and RIOT_PASSWORD are not set')
 
 
 @pytest_asyncio.fixture
 async def client() -> AsyncGenerator[valorantx.Client, None]:
+    _require_riot_account()
     async with valorantx.Client(locale=valorantx.Locale.thai) as v_client:
-        await v_client.authorize(username, password)
+        await v_client.authorize(username, password)  # type: ignore
         yield v_client
 
 
@@ -45,10 +60,69 @@ def client_class(request) -> None:
 
 @pytest.fixture(scope='class')
 def riot_account(request) -> None:
+    _require_riot_account()
     request.cls.riot_username = username
     request.cls.riot_password = password
 
 
+@pytest.fixture
+def cassette() -> Cassette:
+    """An empty cassette, the responses a test expects are recorded into it."""
+    return Cassette()
+
+
+@pytest_asyncio.fixture
+async def http(cassette: Cassette) -> AsyncGenerator[HTTPClient, None]:
+    """An :class:`HTTPClient` answering from the ``cassette`` fixture instead of the network."""
+    pool = ReplayConnectionPool(cassette)
+    http = HTTPClient(asyncio.get_running_loop(), region=valorantx.Region.AP, re_authorize=False, connection_pool=pool)
+    yield http
+    await http.close()
+    await pool.close()
+
+
+@pytest_asyncio.fixture
+async def authorized_client(cassette: Cassette) -> AsyncGenerator[valorantx.Client, None]:
+    """A :class:`Client` answering from the ``cassette`` fixture, authorized as :data:`PUUID` without Riot auth."""
+    pool = ReplayConnectionPool(cassette)
+    client = valorantx.Client(region=valorantx.Region.AP, re_authorize=False, connection_pool=pool)
+    client.loop = client.http.loop = asyncio.get_running_loop()
+    client.http._puuid = PUUID
+    client._authorized = asyncio.Event()
+    client._authorized.set()
+    yield client
+    await client.http.close()
+    await pool.close()
+
+
+class FakeClock:
+    """Stands in for the :mod:`time` module, the time only moves when a test moves it."""
+
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now: float = now
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def perf_counter(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """A :class:`FakeClock` replacing the ``time`` module of :data:`CLOCK_MODULES`.
+
+    Parametrize it indirectly with other modules to replace theirs instead.
+    """
+    clock = FakeClock()
+    for module in getattr(request, 'param', CLOCK_MODULES):
+        monkeypatch.setattr(module, 'time', clock)
+    return clock
+
+
 @pytest.fixture(scope='session')
 def event_loop():
     try:
@@ -0,0 +1,63 @@
+import aiohttp
+import pytest
+import yarl
+
+from valorantx.auth import RiotAuth
+from valorantx.http import ConnectionPool
+from valorantx.testing import Cassette, ReplayConnectionPool
+
+GEO_URL = 'https://riot-geo.pas.si.riotgames.com/pas/v1/product/valorant'
+USERINFO_URL = 'https://auth.riotgames.com/userinfo'
+AUTH_URL = yarl.URL('https://auth.riotgames.com')
+
+
+def riot_auth(pool: ConnectionPool, ssid: str) -> RiotAuth:
+    auth = RiotAuth(connection_pool=pool)
+    auth.access_token = 'access'
+    auth.token_type = 'Bearer'
+    auth._cookie_jar.update_cookies({'ssid': ssid}, AUTH_URL)
+    return auth
+
+
+def ssid(auth: RiotAuth) -> str:
+    return auth._cookie_jar.filter_cookies(AUTH_URL)['ssid'].value
+
+
+class TestPooledAuthCookies:
+    @pytest.mark.asyncio
+    async def test_pool_session_has_no_cookie_jar(self) -> None:
+        pool = ConnectionPool()
+        try:
+            assert isinstance(pool.session.cookie_jar, aiohttp.DummyCookieJar)
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_rotated_cookie_is_kept_by_its_account(self) -> None:
+        cassette = Cassette()
+        cassette.add_json(
+            'POST',
+            USERINFO_URL,
+            {'acct': {'game_name': 'a', 'tag_line': '0001'}},
+            headers={'Set-Cookie': 'ssid=rotated; Domain=auth.riotgames.com; Path=/'},
+        )
+        pool = ReplayConnectionPool(cassette)
+        first = riot_auth(pool, 'first')
+        second = riot_auth(pool, 'second')
+
+        await first._RiotAuth__fetch_userinfo()  # type: ignore
+
+        assert first.game_name == 'a'
+        assert ssid(first) == 'rotated'
+        # another account on the same pool never sees it
+        assert ssid(second) == 'second'
+        assert first.to_dict()['ssid'] == 'rotated'
+
+    @pytest.mark.asyncio
+    async def test_response_without_cookies(self) -> None:
+        cassette = Cassette()
+        cassette.add_json('PUT', GEO_URL, {'affinities': {'live': 'ap'}})
+        auth = riot_auth(ReplayConnectionPool(cassette), 'first')
+
+        assert await auth.fetch_region() == 'ap'
+        assert ssid(auth) == 'first'
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from valorantx.enums import Region
+from valorantx.errors import NotFound
+from valorantx.http import EndpointType, Route
+
+PUUID = '00000000-0000-0000-0000-000000000001'
+
+
+def mmr_route() -> Route:
+    return Route('GET', '/mmr/v1/players/{puuid}', Region.AP, EndpointType.pd, puuid=PUUID)
+
+
+class TestCoalescing:
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_response(self, http, cassette) -> None:
+        cassette.add_json('GET', mmr_route().url, {'Subject': PUUID})
+
+        results = await asyncio.gather(*(http.request(mmr_route()) for _ in range(10)))
+        assert len(http.connection_pool.session.requests) == 1
+        assert all(result is results[0] for result in results)
+        assert http.coalesce_stats == {'leaders': 1, 'deduplicated': 9, 'in_flight': 0}
+
+        # finished requests are not shared with later ones
+        await http.request(mmr_route())
+        assert len(http.connection_pool.session.requests) == 2
+        assert http.coalesce_stats['leaders'] == 2
+
+    @pytest.mark.asyncio
+    async def test_in_flight(self, http, cassette) -> None:
+        cassette.add_json('GET', mmr_route().url, {'Subject': PUUID})
+
+        tasks = [asyncio.create_task(http.request(mmr_route())) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert http.coalesce_stats == {'leaders': 1, 'deduplicated': 2, 'in_flight': 1}
+        await asyncio.gather(*tasks)
+        assert http.coalesce_stats['in_flight'] == 0
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_caller(self, http, cassette) -> None:
+        cassette.add_json('GET', mmr_route().url, {'errorCode': 'RESOURCE_NOT_FOUND'}, status=404)
+
+        results = await asyncio.gather(*(http.request(mmr_route()) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(result, NotFound) for result in results)
+        assert len(http.connection_pool.session.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller(self, http, cassette) -> None:
+        cassette.add_json('GET', mmr_route().url, {'Subject': PUUID})
+
+        first = asyncio.create_task(http.request(mmr_route()))
+        second = asyncio.create_task(http.request(mmr_route()))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        # the other caller still gets the shared response
+        assert await second == {'Subject': PUUID}
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert len(http.connection_pool.session.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_headers_are_not_coalesced(self, http, cassette) -> None:
+        cassette.add_json('GET', mmr_route().url, {'Subject': PUUID})
+
+        await asyncio.gather(*(http.request(mmr_route(), headers={'X-Test': '1'}) for _ in range(3)))
+        assert len(http.connection_pool.session.requests) == 3
+        assert http.coalesce_stats['leaders'] == 0
+
+    @pytest.mark.asyncio
+    async def test_opt_in_per_route(self, http, cassette) -> None:
+        other = Route('GET', '/test', Region.AP)
+        cassette.add_json('GET', other.url, {})
+        cassette.add_json('GET', mmr_route().url, {'Subject': PUUID})
+
+        # not a coalesced route
+        await asyncio.gather(*(http.request(Route('GET', '/test', Region.AP)) for _ in range(3)))
+        assert len(http.connection_pool.session.requests) == 3
+
+        # the per call override wins both ways
+        await asyncio.gather(*(http.request(Route('GET', '/test', Region.AP), coalesce=True) for _ in range(3)))
+        assert len(http.connection_pool.session.requests) == 4
+        await asyncio.gather(*(http.request(mmr_route(), coalesce=False) for _ in range(3)))
+        assert len(http.connection_pool.session.requests) == 7
+
+        http.coalesced_routes.add('GET /test')
+        await asyncio.gather(*(http.request(Route('GET', '/test', Region.AP)) for _ in range(3)))
+        assert len(http.connection_pool.session.requests) == 8
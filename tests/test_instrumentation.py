@@ -0,0 +1,143 @@
+import re
+from typing import Dict, List
+
+import pytest
+
+from valorantx import instrumentation as instrumentation_module
+from valorantx.enums import Region
+from valorantx.errors import NotFound
+from valorantx.http import EndpointType, HTTPClient, Route
+from valorantx.instrumentation import MetricsCollector
+from valorantx.testing import ReplayResponse
+
+PUUID = '00000000-0000-0000-0000-000000000001'
+MMR = 'GET /mmr/v1/players/{puuid}'
+WALLET = 'GET /store/v1/wallet/{puuid}'
+DURATION = 'valorantx_http_request_duration_seconds'
+
+# a metric name, its optional labels and its value
+SAMPLE = re.compile(
+    r'^[a-zA-Z_:][a-zA-Z0-9_:]*(\{([a-zA-Z_][a-zA-Z0-9_]*="(\\.|[^"\\])*",?)+\})? (\+Inf|-?[0-9.e+-]+)$'
+)
+
+
+def mmr_route(region: Region) -> Route:
+    return Route('GET', '/mmr/v1/players/{puuid}', region, EndpointType.pd, puuid=PUUID)
+
+
+def wallet_route() -> Route:
+    return Route('GET', '/store/v1/wallet/{puuid}', Region.AP, EndpointType.pd, puuid=PUUID)
+
+
+@pytest.fixture
+def delays(clock, monkeypatch) -> List[float]:
+    # every body takes the next of these seconds to arrive, nothing else takes any time
+    delays: List[float] = []
+    read = ReplayResponse.read
+
+    async def slow_read(self: ReplayResponse) -> bytes:
+        clock.now += delays.pop(0)
+        return await read(self)
+
+    monkeypatch.setattr(ReplayResponse, 'read', slow_read)
+    return delays
+
+
+@pytest.fixture
+def metrics(http: HTTPClient) -> MetricsCollector:
+    http.instrumentation = MetricsCollector(buckets=(1.0, 0.1, 0.5))
+    return http.instrumentation  # type: ignore
+
+
+def series(text: str, name: str, **labels: str) -> Dict[str, str]:
+    # the value of every sample of a metric with the given labels, by their other labels
+    found = {}
+    for line in text.splitlines():
+        if not line.startswith(name + '{'):
+            continue
+        sample, value = line.rsplit(' ', 1)
+        pairs = dict(re.findall(r'([a-z]+)="([^"]*)"', sample))
+        if all(pairs.pop(key, None) == value_ for key, value_ in labels.items()):
+            found[','.join(f'{key}={value_}' for key, value_ in pairs.items())] = value
+    return found
+
+
+@pytest.mark.parametrize('clock', [(instrumentation_module,)], indirect=True)
+class TestMetricsCollector:
+    @pytest.mark.asyncio
+    async def test_to_prometheus(self, http, cassette, metrics, delays) -> None:
+        cassette.add_json('GET', mmr_route(Region.AP).url, {'Subject': PUUID})
+        cassette.add_json('GET', mmr_route(Region.NA).url, {'Subject': PUUID})
+        cassette.add_json('GET', wallet_route().url, {'errorCode': 'RESOURCE_NOT_FOUND'}, status=404)
+
+        delays.extend([0.5, 2.0, 0.05, 0.25])
+        await http.request(mmr_route(Region.AP))
+        await http.request(mmr_route(Region.AP))
+        await http.request(mmr_route(Region.NA))
+        with pytest.raises(NotFound):
+            await http.request(wallet_route())
+
+        text = metrics.to_prometheus()
+        assert text.endswith('\n')
+        lines = text.splitlines()
+
+        # every family is announced by its help and type, then its samples follow
+        families = [line.split()[2:4] for line in lines if line.startswith('# TYPE ')]
+        assert families == [
+            [DURATION, 'histogram'],
+            ['valorantx_http_requests_total', 'counter'],
+            ['valorantx_http_retries_total', 'counter'],
+            ['valorantx_http_reauth_total', 'counter'],
+            ['valorantx_http_ratelimited_total', 'counter'],
+            ['valorantx_http_ratelimit_sleep_seconds_total', 'counter'],
+        ]
+        for index, line in enumerate(lines):
+            if line.startswith('# TYPE '):
+                assert lines[index - 1].startswith('# HELP ' + line.split()[2] + ' ')
+            elif not line.startswith('# HELP '):
+                assert SAMPLE.match(line), line
+
+        # the buckets are sorted and cumulative, a value on a bound falls into its bucket
+        assert series(text, DURATION + '_bucket', route=MMR, region='ap', phase='body') == {
+            'le=0.1': '0',
+            'le=0.5': '1',
+            'le=1': '1',
+            'le=+Inf': '2',
+        }
+        assert series(text, DURATION + '_sum', route=MMR, region='ap', phase='body') == {'': '2.5'}
+        assert series(text, DURATION + '_count', route=MMR, region='ap', phase='body') == {'': '2'}
+        assert series(text, DURATION + '_bucket', route=MMR, region='na', phase='total') == {
+            'le=0.1': '1',
+            'le=0.5': '1',
+            'le=1': '1',
+            'le=+Inf': '1',
+        }
+        # the response arrived at once and was decoded in no time
+        assert series(text, DURATION + '_bucket', route=MMR, region='ap', phase='ttfb')['le=0.1'] == '2'
+        assert series(text, DURATION + '_sum', route=WALLET, region='ap', phase='decode') == {'': '0'}
+
+        # one series per route and region, the phases without a trace config were not measured
+        phases = {tuple(re.findall(r'="([^"]*)"', line)[:3]) for line in lines if line.startswith(DURATION + '_count')}
+        assert phases == {
+            (route, region, phase)
+            for route, region in ((MMR, 'ap'), (MMR, 'na'), (WALLET, 'ap'))
+            for phase in ('queue', 'ttfb', 'body', 'decode', 'total')
+        }
+
+        assert series(text, 'valorantx_http_requests_total') == {
+            f'route={MMR},region=ap,status=200': '2',
+            f'route={MMR},region=na,status=200': '1',
+            f'route={WALLET},region=ap,status=404': '1',
+        }
+        assert series(text, 'valorantx_http_retries_total') == {}
+
+    @pytest.mark.asyncio
+    async def test_clear(self, http, cassette, metrics, delays) -> None:
+        cassette.add_json('GET', mmr_route(Region.AP).url, {'Subject': PUUID})
+        delays.append(0.5)
+        await http.request(mmr_route(Region.AP))
+        assert metrics.slowest_routes() == [(MMR, 'ap', 0.5)]
+
+        metrics.clear()
+        assert metrics.slowest_routes() == []
+        assert not any(line for line in metrics.to_prometheus().splitlines() if not line.startswith('#'))
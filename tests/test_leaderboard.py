@@ -0,0 +1,133 @@
+import uuid
+from typing import Any, Dict, List
+
+import pytest
+
+import valorantx
+from valorantx.models.leaderboard import LeaderboardTable
+from valorantx.testing import Cassette
+
+SEASON_ID = 'season'
+TOTAL = 5
+
+
+def player(rank: int) -> Dict[str, Any]:
+    return {
+        'puuid': str(uuid.UUID(int=rank)),
+        'gameName': f'Player {rank}',
+        'tagLine': 'AP',
+        'leaderboardRank': rank,
+        'rankedRating': 1000 - rank,
+        'numberOfWins': 100,
+        'competitiveTier': 27,
+        'IsBanned': False,
+        'IsAnonymized': False,
+    }
+
+
+def page(start: int, size: int) -> List[Dict[str, Any]]:
+    return [player(rank) for rank in range(start + 1, min(start + size, TOTAL) + 1)]
+
+
+class TestLeaderboardTable:
+    def test_lookups(self) -> None:
+        table = LeaderboardTable(SEASON_ID, 'ap')
+        table.add_page(0, page(0, 3), total=TOTAL)
+        table.add({**player(4), 'puuid': '', 'gameName': '', 'tagLine': '', 'IsAnonymized': True})
+
+        assert len(table) == 4
+        assert table.is_complete() is False
+        assert table.get(2).riot_id == 'Player 2#AP'  # type: ignore
+        assert table.get(5) is None
+        assert table.find_by_puuid(str(uuid.UUID(int=3))).rank == 3  # type: ignore
+        assert [entry.rank for entry in table.search('player 1')] == [1]
+        anonymized = table.get(4)
+        assert anonymized is not None and anonymized.is_anonymized() and anonymized.puuid == ''
+
+    def test_missing_pages(self) -> None:
+        table = LeaderboardTable(SEASON_ID, 'ap', page_size=2)
+        table.add_page(0, page(0, 2), total=TOTAL)
+        table.add_page(4, page(4, 2))
+        assert table.missing_pages(2) == [2]
+
+    def test_missing_pages_with_another_size(self) -> None:
+        table = LeaderboardTable(SEASON_ID, 'ap', page_size=2)
+        table.add_page(0, page(0, 2), total=TOTAL)
+        # pages of 3 players starting at 0 and 3 would skip rank 3
+        with pytest.raises(ValueError):
+            table.missing_pages(3)
+
+    def test_checkpoint(self, tmp_path) -> None:
+        table = LeaderboardTable(SEASON_ID, 'ap', page_size=2)
+        table.add_page(0, page(0, 2), total=TOTAL)
+        table.add_page(2, page(2, 2))
+        table.save(tmp_path / 'leaderboard.bin')
+
+        loaded = LeaderboardTable.load(tmp_path / 'leaderboard.bin')
+        assert loaded.page_size == 2
+        assert loaded.pages == {0, 2}
+        assert loaded.total == TOTAL
+        assert list(loaded) == list(table)
+        assert [entry.rank for entry in loaded.search('Player 3', 'ap')] == [3]
+
+    def test_load_not_a_checkpoint(self, tmp_path) -> None:
+        path = tmp_path / 'leaderboard.bin'
+        path.write_bytes(b'not a checkpoint')
+        with pytest.raises(ValueError):
+            LeaderboardTable.load(path)
+
+
+def record_pages(client: valorantx.Client, cassette: Cassette, size: int) -> None:
+    for start in range(0, TOTAL, size):
+        stream = client.http.stream_mmr_leaderboard(SEASON_ID, start, size)
+        data = {'Players': page(start, size), 'totalPlayers': TOTAL}
+        cassette.add_json('GET', stream._route.url, data, params=stream._kwargs['params'])
+
+
+class TestIterLeaderboard:
+    @pytest.mark.asyncio
+    async def test_crawl(self, authorized_client, cassette) -> None:
+        record_pages(authorized_client, cassette, 2)
+        table = LeaderboardTable(SEASON_ID, 'ap')
+        ranks = [entry.rank async for entry in authorized_client.iter_leaderboard(SEASON_ID, page_size=2, table=table)]
+        assert sorted(ranks) == [1, 2, 3, 4, 5]
+        assert table.is_complete()
+        assert table.page_size == 2
+
+    @pytest.mark.asyncio
+    async def test_resume(self, authorized_client, cassette, tmp_path) -> None:
+        record_pages(authorized_client, cassette, 2)
+        checkpoint = tmp_path / 'leaderboard.bin'
+        table = LeaderboardTable(SEASON_ID, 'ap', page_size=2)
+        table.add_page(0, page(0, 2), total=TOTAL)
+        table.add_page(2, page(2, 2))
+        table.save(checkpoint)
+
+        # only the missing page is fetched and yielded
+        ranks = [
+            entry.rank
+            async for entry in authorized_client.iter_leaderboard(SEASON_ID, page_size=2, checkpoint=checkpoint)
+        ]
+        assert ranks == [5]
+        assert len(authorized_client.connection_pool.session.requests) == 1
+        assert LeaderboardTable.load(checkpoint).is_complete()
+
+    @pytest.mark.asyncio
+    async def test_resume_with_another_page_size(self, authorized_client, tmp_path) -> None:
+        checkpoint = tmp_path / 'leaderboard.bin'
+        table = LeaderboardTable(SEASON_ID, 'ap', page_size=2)
+        table.add_page(0, page(0, 2), total=TOTAL)
+        table.save(checkpoint)
+
+        with pytest.raises(ValueError):
+            async for _ in authorized_client.iter_leaderboard(SEASON_ID, page_size=3, checkpoint=checkpoint):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_resume_without_page_size(self, authorized_client) -> None:
+        table = LeaderboardTable(SEASON_ID, 'ap')
+        table.add_page(0, page(0, 2), total=TOTAL)
+
+        with pytest.raises(ValueError):
+            async for _ in authorized_client.iter_leaderboard(SEASON_ID, page_size=2, table=table):
+                pass
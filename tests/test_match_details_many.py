@@ -0,0 +1,112 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+import valorantx
+from valorantx import client as client_module
+from valorantx.errors import MatchDetailsFetchError, NotFound
+from valorantx.http import EndpointType, Route
+from valorantx.testing import Cassette, ReplayResponse
+
+MATCH_IDS = [f'match-{i}' for i in range(12)]
+
+
+class Match:
+    # stands in for MatchDetails, the fetcher only hands the payloads over
+    def __init__(self, client: Any, data: Dict[str, Any], lazy: bool = False) -> None:
+        self.id: str = data['matchInfo']['matchId']
+
+
+def url(match_id: str) -> str:
+    return Route(
+        'GET', '/match-details/v1/matches/{match_id}', valorantx.Region.AP, EndpointType.pd, match_id=match_id
+    ).url
+
+
+class InFlight:
+    def __init__(self) -> None:
+        self.current: int = 0
+        self.peak: int = 0
+
+
+@pytest.fixture
+def in_flight(authorized_client, cassette: Cassette, monkeypatch) -> InFlight:
+    monkeypatch.setattr(client_module, 'MatchDetails', Match)
+    for match_id in MATCH_IDS:
+        cassette.add_json('GET', url(match_id), {'matchInfo': {'matchId': match_id, 'isCompleted': True}})
+
+    in_flight = InFlight()
+    read = ReplayResponse.read
+
+    async def slow_read(self: ReplayResponse) -> bytes:
+        # the body takes a while to arrive, the other workers send their requests meanwhile
+        in_flight.current += 1
+        in_flight.peak = max(in_flight.peak, in_flight.current)
+        for _ in range(3):
+            await asyncio.sleep(0)
+        in_flight.current -= 1
+        return await read(self)
+
+    monkeypatch.setattr(ReplayResponse, 'read', slow_read)
+    return in_flight
+
+
+def fail(cassette: Cassette, match_id: str) -> None:
+    cassette.add_json('GET', url(match_id), {'errorCode': 'MATCH_NOT_FOUND'}, status=404)
+
+
+class TestFetchMatchDetailsMany:
+    @pytest.mark.asyncio
+    async def test_concurrency(self, authorized_client, in_flight) -> None:
+        matches = [match async for match in authorized_client.fetch_match_details_many(MATCH_IDS, concurrency=3)]
+        assert sorted(match.id for match in matches) == sorted(MATCH_IDS)
+        assert in_flight.peak == 3
+        assert len(authorized_client.connection_pool.session.requests) == len(MATCH_IDS)
+
+    @pytest.mark.asyncio
+    async def test_return_exceptions(self, authorized_client, cassette, in_flight) -> None:
+        fail(cassette, 'match-missing')
+        match_ids = ['match-0', 'match-missing', 'match-1']
+
+        results: List[Any] = [
+            result
+            async for result in authorized_client.fetch_match_details_many(
+                match_ids, concurrency=1, return_exceptions=True
+            )
+        ]
+        assert [type(result) for result in results] == [Match, MatchDetailsFetchError, Match]
+        error = results[1]
+        assert error.match_id == 'match-missing'
+        assert isinstance(error.original, NotFound)
+        assert results[2].id == 'match-1'
+
+    @pytest.mark.asyncio
+    async def test_raise(self, authorized_client, cassette, in_flight) -> None:
+        fail(cassette, 'match-missing')
+        results: List[Any] = []
+        with pytest.raises(NotFound):
+            async for result in authorized_client.fetch_match_details_many(['match-0', 'match-missing', 'match-1']):
+                results.append(result)
+        assert all(isinstance(result, Match) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_break_cancels_the_workers(self, authorized_client, in_flight) -> None:
+        matches = authorized_client.fetch_match_details_many(MATCH_IDS, concurrency=2)
+        async for _ in matches:
+            break
+        await matches.aclose()
+
+        # the workers are gone, nothing else is fetched
+        sent = len(authorized_client.connection_pool.session.requests)
+        assert sent < len(MATCH_IDS)
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert len(authorized_client.connection_pool.session.requests) == sent
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self, authorized_client) -> None:
+        with pytest.raises(ValueError):
+            async for _ in authorized_client.fetch_match_details_many(MATCH_IDS, concurrency=0):
+                pass
@@ -0,0 +1,98 @@
+import asyncio
+import datetime
+from typing import List, Tuple
+
+import pytest
+import yarl
+
+import valorantx
+from valorantx.http import EndpointType, Route
+from valorantx.testing import Cassette
+
+# the puuid of the authorized_client fixture
+PUUID = '00000000-0000-0000-0000-000000000001'
+TOTAL = 7
+# newest first, a minute apart
+STARTED_AT = 1_700_000_000_000
+
+
+def record_history(cassette: Cassette, page_size: int) -> None:
+    url = Route('GET', '/match-history/v1/history/{puuid}', valorantx.Region.AP, EndpointType.pd, puuid=PUUID).url
+    for start in range(0, TOTAL, page_size):
+        history = [
+            {'MatchID': f'match-{i}', 'GameStartTime': STARTED_AT - i * 60_000, 'QueueID': 'competitive'}
+            for i in range(start, min(start + page_size, TOTAL))
+        ]
+        data = {
+            'Subject': PUUID,
+            'BeginIndex': start,
+            'EndIndex': start + page_size,
+            'Total': TOTAL,
+            'History': history,
+        }
+        cassette.add_json('GET', url, data, params={'startIndex': start, 'endIndex': start + page_size})
+
+
+def pages(client: valorantx.Client) -> List[Tuple[int, int]]:
+    ranges = []
+    for _, url in client.connection_pool.session.requests:  # type: ignore
+        query = yarl.URL(url).query
+        ranges.append((int(query['startIndex']), int(query['endIndex'])))
+    return ranges
+
+
+def no_tasks_left() -> bool:
+    return asyncio.all_tasks() == {asyncio.current_task()}
+
+
+class TestIterMatchHistory:
+    @pytest.mark.asyncio
+    async def test_every_page(self, authorized_client, cassette) -> None:
+        record_history(cassette, 3)
+        ids = [entry.id async for entry in authorized_client.iter_match_history(page_size=3)]
+        assert ids == [f'match-{i}' for i in range(TOTAL)]
+        # the history ends with the page that reached Total
+        assert pages(authorized_client) == [(0, 3), (3, 6), (6, 9)]
+
+    @pytest.mark.asyncio
+    async def test_limit(self, authorized_client, cassette) -> None:
+        record_history(cassette, 3)
+        ids = [entry.id async for entry in authorized_client.iter_match_history(page_size=3, limit=4)]
+        assert ids == ['match-0', 'match-1', 'match-2', 'match-3']
+        # the page prefetched after the one holding the last match is cancelled before it is sent
+        assert pages(authorized_client) == [(0, 3), (3, 6)]
+        assert no_tasks_left()
+
+    @pytest.mark.asyncio
+    async def test_until_match_id(self, authorized_client, cassette) -> None:
+        record_history(cassette, 3)
+        ids = [entry.id async for entry in authorized_client.iter_match_history(page_size=3, until_match_id='match-2')]
+        assert ids == ['match-0', 'match-1']
+        assert pages(authorized_client) == [(0, 3)]
+        assert no_tasks_left()
+
+    @pytest.mark.asyncio
+    async def test_since(self, authorized_client, cassette) -> None:
+        record_history(cassette, 3)
+        since = datetime.datetime.fromtimestamp((STARTED_AT - 4 * 60_000) / 1000)
+        ids = [entry.id async for entry in authorized_client.iter_match_history(page_size=3, since=since)]
+        # the match that started at since is yielded, the one before it stops the iteration
+        assert ids == [f'match-{i}' for i in range(5)]
+        assert pages(authorized_client) == [(0, 3), (3, 6)]
+        assert no_tasks_left()
+
+    @pytest.mark.asyncio
+    async def test_break(self, authorized_client, cassette) -> None:
+        record_history(cassette, 3)
+        history = authorized_client.iter_match_history(page_size=3)
+        async for _ in history:
+            break
+        await history.aclose()
+        assert pages(authorized_client) == [(0, 3)]
+        assert no_tasks_left()
+
+    @pytest.mark.asyncio
+    async def test_invalid_page_size(self, authorized_client) -> None:
+        with pytest.raises(ValueError):
+            async for _ in authorized_client.iter_match_history(page_size=0):
+                pass
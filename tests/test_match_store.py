@@ -0,0 +1,87 @@
+import pytest
+
+from valorantx.match_store import MatchStore, SQLiteMatchStoreBackend
+
+
+def payload(match_id: str):
+    return {'matchInfo': {'matchId': match_id, 'isCompleted': True}, 'players': [{'subject': 'a' * 36}]}
+
+
+class TestMatchStore:
+    @pytest.mark.asyncio
+    async def test_get_set(self) -> None:
+        store = MatchStore()
+        assert await store.get('a') is None
+        await store.set('a', payload('a'))
+        assert 'a' in store
+        assert await store.get('a') == payload('a')
+        assert store.stats.to_dict()['memory_hits'] == 1
+        assert store.stats.misses == 1
+        assert store.stats.writes == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self) -> None:
+        store = MatchStore(max_size=2)
+        await store.set('a', payload('a'))
+        await store.set('b', payload('b'))
+        # 'a' becomes the most recently used, 'b' is evicted next
+        await store.get('a')
+        await store.set('c', payload('c'))
+
+        assert len(store) == 2
+        assert 'a' in store
+        assert 'b' not in store
+        assert 'c' in store
+        assert store.stats.evictions == 1
+        assert await store.get('b') is None
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_disabled(self) -> None:
+        store = MatchStore(max_size=0)
+        await store.set('a', payload('a'))
+        assert len(store) == 0
+        assert await store.get('a') is None
+
+    def test_negative_max_size(self) -> None:
+        with pytest.raises(ValueError):
+            MatchStore(max_size=-1)
+
+    @pytest.mark.asyncio
+    async def test_delete(self) -> None:
+        store = MatchStore()
+        await store.set('a', payload('a'))
+        await store.delete('a')
+        assert await store.get('a') is None
+
+
+class TestSQLiteMatchStoreBackend:
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path) -> None:
+        path = tmp_path / 'matches.db'
+        store = MatchStore(SQLiteMatchStoreBackend(path), max_size=1)
+        await store.set('a', payload('a'))
+        await store.set('b', payload('b'))
+        assert 'a' not in store
+
+        # evicted from memory, answered by the backend and remembered again
+        assert await store.get('a') == payload('a')
+        assert store.stats.disk_hits == 1
+        assert 'a' in store
+        await store.close()
+
+        # a new store over the same file sees what the first one wrote
+        store = MatchStore(SQLiteMatchStoreBackend(path))
+        assert await store.get('b') == payload('b')
+        assert store.stats.disk_hits == 1
+        await store.delete('b')
+        assert await store.get('b') is None
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_replace(self, tmp_path) -> None:
+        backend = SQLiteMatchStoreBackend(tmp_path / 'matches.db')
+        await backend.set('a', b'first')
+        await backend.set('a', b'second')
+        assert await backend.get('a') == b'second'
+        assert await backend.get('b') is None
+        await backend.close()
@@ -0,0 +1,75 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+import valorantx
+from valorantx.http import EndpointType, Route
+from valorantx.name_resolver import NameResolver
+from valorantx.testing import Cassette
+
+PUUIDS = [f'00000000-0000-0000-0000-{i:012d}' for i in range(25)]
+
+
+def player(puuid: str) -> Dict[str, Any]:
+    name = f'Player {puuid[-2:]}'
+    return {'DisplayName': name, 'Subject': puuid, 'GameName': name, 'TagLine': 'AP'}
+
+
+@pytest.fixture
+def client(authorized_client: valorantx.Client, cassette: Cassette) -> valorantx.Client:
+    # every request answers every player, the resolver only keeps the ones it asked for
+    route = Route('PUT', '/name-service/v2/players', valorantx.Region.AP, EndpointType.pd)
+    cassette.add_json('PUT', route.url, [player(puuid) for puuid in PUUIDS[:-1]])
+    return authorized_client
+
+
+def requests(client: valorantx.Client) -> List[str]:
+    return [method for method, _ in client.connection_pool.session.requests]  # type: ignore
+
+
+class TestNameResolver:
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_are_batched(self, client) -> None:
+        resolver = NameResolver(client)
+        names = await asyncio.gather(*(resolver.resolve(PUUIDS[i % 5]) for i in range(10)))
+        assert [name.subject for name in names] == [PUUIDS[i % 5] for i in range(10)]
+        assert requests(client) == ['PUT']
+
+        # answered by the cache
+        assert (await resolver.resolve(PUUIDS[0])).game_name == 'Player 00'  # type: ignore
+        assert requests(client) == ['PUT']
+
+    @pytest.mark.asyncio
+    async def test_batch_size(self, client) -> None:
+        resolver = NameResolver(client, batch_size=10)
+        names = await resolver.resolve_many(PUUIDS)
+        assert requests(client) == ['PUT', 'PUT', 'PUT']
+        # the name service does not know the last one
+        assert list(names) == PUUIDS[:-1]
+        assert await resolver.resolve(PUUIDS[-1]) is None
+
+    @pytest.mark.asyncio
+    async def test_ttl(self, client, clock) -> None:
+        resolver = NameResolver(client, ttl=60.0)
+        await resolver.resolve(PUUIDS[0])
+
+        clock.now += 59.0
+        assert resolver.get(PUUIDS[0]) is not None
+        clock.now += 1.0
+        assert resolver.get(PUUIDS[0]) is None
+
+        await resolver.resolve(PUUIDS[0])
+        assert requests(client) == ['PUT', 'PUT']
+
+    @pytest.mark.asyncio
+    async def test_clear(self, client) -> None:
+        resolver = NameResolver(client, window=60.0)
+        task = asyncio.create_task(resolver.resolve(PUUIDS[0]))
+        await asyncio.sleep(0)
+
+        resolver.clear()
+        # the caller was not cancelled, only its lookup
+        with pytest.raises(RuntimeError):
+            await task
+        assert requests(client) == []
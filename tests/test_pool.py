@@ -0,0 +1,116 @@
+import asyncio
+from typing import Any, List, Optional
+
+import pytest
+
+import valorantx
+from valorantx import pool as pool_module
+from valorantx.http import ConnectionPool
+from valorantx.pool import ClientPool
+from valorantx.testing import Cassette, ReplayConnectionPool
+
+
+class AssetCache:
+    """Stands in for the valorant-api client, whose load would download the catalogue."""
+
+    created: List['AssetCache'] = []
+    # how many of the next loads fail
+    failures: int = 0
+
+    def __init__(self, connection_pool: ConnectionPool, locale: valorantx.Locale, snapshot_path: Optional[str] = None):
+        self.connection_pool: ConnectionPool = connection_pool
+        self.locale: valorantx.Locale = locale
+        self.closed: bool = False
+        AssetCache.created.append(self)
+
+    async def init(self) -> None:
+        # the load takes a while, other clients ask for the same locale in the meantime
+        for _ in range(3):
+            await asyncio.sleep(0)
+        if AssetCache.failures:
+            AssetCache.failures -= 1
+            raise ConnectionError('valorant-api is unreachable')
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def asset_cache(monkeypatch) -> Any:
+    monkeypatch.setattr(pool_module, 'ValorantAPIClient', AssetCache)
+    monkeypatch.setattr(AssetCache, 'created', [])
+    monkeypatch.setattr(AssetCache, 'failures', 0)
+    return AssetCache
+
+
+class TestClientPool:
+    @pytest.mark.asyncio
+    async def test_one_asset_cache_per_locale(self, cassette: Cassette, asset_cache) -> None:
+        connection_pool = ReplayConnectionPool(cassette)
+        async with ClientPool(connection_pool=connection_pool) as pool:
+            first, second = await asyncio.gather(pool.create_client(), pool.create_client())
+            assert first.valorant_api is second.valorant_api
+            assert first.connection_pool is second.connection_pool is connection_pool
+
+            thai = await pool.create_client(locale=valorantx.Locale.thai)
+            assert thai.valorant_api is not first.valorant_api
+            assert [cache.locale for cache in asset_cache.created] == [
+                valorantx.Locale.american_english,
+                valorantx.Locale.thai,
+            ]
+            assert pool.clients == [first, second, thai]
+
+        assert pool.is_closed()
+        assert all(client.is_closed() for client in (first, second, thai))
+        assert all(cache.closed for cache in asset_cache.created)
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_retried(self, cassette: Cassette, asset_cache) -> None:
+        asset_cache.failures = 1
+        async with ClientPool(connection_pool=ReplayConnectionPool(cassette)) as pool:
+            # every client waiting for the failed load sees its error
+            results = await asyncio.gather(pool.create_client(), pool.create_client(), return_exceptions=True)
+            assert all(isinstance(result, ConnectionError) for result in results)
+            assert len(asset_cache.created) == 1
+            assert pool.clients == []
+
+            # the next client loads the catalogue again instead of getting the cached error
+            client = await pool.create_client()
+            assert len(asset_cache.created) == 2
+            assert client.valorant_api is asset_cache.created[1]
+            assert (await pool.create_client()).valorant_api is client.valorant_api
+
+    @pytest.mark.asyncio
+    async def test_close_keeps_the_callers_connection_pool(self, cassette: Cassette) -> None:
+        connection_pool = ReplayConnectionPool(cassette)
+        connection_pool.session  # noqa: B018
+        pool = ClientPool(connection_pool=connection_pool)
+        client = await pool.create_client()
+        await pool.close()
+
+        assert client.is_closed()
+        assert not connection_pool.is_closed()
+        await connection_pool.close()
+
+    @pytest.mark.asyncio
+    async def test_close_closes_its_own_connection_pool(self) -> None:
+        pool = ClientPool()
+        await pool.create_client()
+        pool.connection_pool.session  # noqa: B018
+        await pool.close()
+
+        assert pool.connection_pool.is_closed()
+        with pytest.raises(RuntimeError):
+            await pool.create_client()
+
+    @pytest.mark.asyncio
+    async def test_remove(self, cassette: Cassette, asset_cache) -> None:
+        async with ClientPool(connection_pool=ReplayConnectionPool(cassette)) as pool:
+            first = await pool.create_client()
+            second = await pool.create_client()
+            await pool.remove(first)
+
+            # the shared asset cache stays open for the other clients
+            assert first.is_closed()
+            assert pool.clients == [second]
+            assert not asset_cache.created[0].closed
@@ -0,0 +1,208 @@
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+import valorantx
+from valorantx import presence, utils
+from valorantx.http import EndpointType, Route
+from valorantx.testing import Cassette, Interaction, ReplayConnectionPool
+
+# the puuid of the authorized_client fixture
+PUUID = '00000000-0000-0000-0000-000000000001'
+PARTY_ID = 'party-1'
+MATCH_ID = 'match-1'
+
+
+class Model:
+    # stands in for the models, the poller only diffs the payloads
+    def __init__(self, client: Any, data: Dict[str, Any]) -> None:
+        self.data: Dict[str, Any] = data
+        self.id: str = data.get('ID') or data.get('MatchID') or data.get('Subject')
+        self.state: str = data.get('State', '')
+
+
+class Presence:
+    def __init__(self, cassette: Cassette, client: valorantx.Client) -> None:
+        self.cassette: Cassette = cassette
+        self.client: valorantx.Client = client
+        self.events: List[Tuple[Any, ...]] = []
+        client.dispatch = lambda event, *args: self.events.append((event, *args))  # type: ignore
+        self.poller: presence.PresencePoller = presence.PresencePoller(
+            client, idle_interval=10.0, matchmaking_interval=3.0, pregame_interval=1.0, ingame_interval=20.0
+        )
+
+    def url(self, path: str, **parameters: Any) -> str:
+        return Route('GET', path, valorantx.Region.AP, EndpointType.glz, **parameters).url
+
+    def respond(self, path: str, data: Any = None, **parameters: Any) -> None:
+        # replaces what the URL answers from the next request on, 404 without data
+        url = self.url(path, **parameters)
+        if data is None:
+            body = b'{"httpStatus": 404, "errorCode": "RESOURCE_NOT_FOUND"}'
+            interaction = Interaction('GET', url, 404, {'Content-Type': 'application/json'}, body)
+        else:
+            interaction = Interaction(
+                'GET', url, 200, {'Content-Type': 'application/json'}, utils._to_json(data).encode()
+            )
+        self.cassette._interactions[interaction.key] = [interaction]
+        self.cassette._plays.pop(interaction.key, None)
+
+    def party(self, version: int, state: str = 'DEFAULT') -> None:
+        self.respond('/parties/v1/players/{puuid}', {'CurrentPartyID': PARTY_ID}, puuid=PUUID)
+        self.respond(
+            '/parties/v1/parties/{party_id}',
+            {'ID': PARTY_ID, 'Version': version, 'State': state},
+            party_id=PARTY_ID,
+        )
+
+    def no_party(self) -> None:
+        self.respond('/parties/v1/players/{puuid}', puuid=PUUID)
+
+    def pregame(self, version: int, selection: str = '') -> None:
+        self.respond('/pregame/v1/players/{puuid}', {'MatchID': MATCH_ID}, puuid=PUUID)
+        player = {'Subject': PUUID, 'CharacterID': 'jett', 'CharacterSelectionState': selection}
+        data = {'ID': MATCH_ID, 'Version': version, 'Teams': [{'TeamID': 'Blue', 'Players': [player]}]}
+        self.respond('/pregame/v1/matches/{match_id}', data, match_id=MATCH_ID)
+
+    def no_pregame(self) -> None:
+        self.respond('/pregame/v1/players/{puuid}', puuid=PUUID)
+        self.respond('/pregame/v1/matches/{match_id}', match_id=MATCH_ID)
+
+    def coregame(self) -> None:
+        self.respond('/core-game/v1/players/{puuid}', {'MatchID': MATCH_ID}, puuid=PUUID)
+        self.respond('/core-game/v1/matches/{match_id}', {'MatchID': MATCH_ID}, match_id=MATCH_ID)
+
+    def no_coregame(self) -> None:
+        self.respond('/core-game/v1/players/{puuid}', puuid=PUUID)
+
+    def names(self) -> List[str]:
+        names = [event[0] for event in self.events]
+        self.events.clear()
+        return names
+
+
+@pytest.fixture
+def state(monkeypatch, authorized_client: valorantx.Client, cassette: Cassette) -> Presence:
+    for name in ('Party', 'PreGameMatch', 'PreGameMatchPlayer', 'CoreGameMatch'):
+        monkeypatch.setattr(presence, name, Model)
+
+    # everything unrecorded answers 404, i.e. not in a party, pregame or match
+    pool = authorized_client.connection_pool
+    assert isinstance(pool, ReplayConnectionPool)
+    pool.strict = False
+    return Presence(cassette, authorized_client)
+
+
+class TestPresencePoller:
+    @pytest.mark.asyncio
+    async def test_party_update(self, state) -> None:
+        state.party(version=1)
+        assert await state.poller.poll() == 10.0
+        assert state.events == [('party_update', None, state.poller.party)]
+        first = state.poller.party
+        state.events.clear()
+
+        # same version, nothing parsed or dispatched
+        assert await state.poller.poll() == 10.0
+        assert state.events == []
+        assert state.poller.party is first
+
+        state.party(version=2, state='MATCHMAKING')
+        assert await state.poller.poll() == 3.0
+        assert state.events == [('party_update', first, state.poller.party)]
+        assert state.poller.phase == 'matchmaking'
+
+    @pytest.mark.asyncio
+    async def test_agent_select(self, state) -> None:
+        state.party(version=1)
+        await state.poller.poll()
+        state.events.clear()
+
+        state.pregame(version=1)
+        assert await state.poller.poll() == 1.0
+        assert state.poller.phase == 'pregame'
+        assert state.names() == ['pregame_start']
+
+        state.pregame(version=2, selection='selected')
+        await state.poller.poll()
+        assert state.names() == ['pregame_update', 'agent_select']
+
+        # an unchanged version is not parsed again
+        await state.poller.poll()
+        assert state.names() == []
+
+        state.pregame(version=3, selection='locked')
+        await state.poller.poll()
+        assert state.names() == ['pregame_update', 'agent_lock']
+
+        state.pregame(version=4, selection='locked')
+        await state.poller.poll()
+        assert state.names() == ['pregame_update']
+
+    @pytest.mark.asyncio
+    async def test_match_start_and_end(self, state) -> None:
+        state.party(version=1)
+        state.pregame(version=1)
+        await state.poller.poll()
+        state.names()
+
+        # agent select is over and the match started
+        state.no_pregame()
+        state.coregame()
+        assert await state.poller.poll() == 20.0
+        assert state.poller.phase == 'ingame'
+        assert state.poller.pregame is None
+        assert state.names() == ['match_start']
+
+        assert await state.poller.poll() == 20.0
+        assert state.names() == []
+
+        match = state.poller.coregame
+        state.no_coregame()
+        assert await state.poller.poll() == 10.0
+        assert state.poller.phase == 'idle'
+        assert state.poller.coregame is None
+        assert state.events == [('match_end', match)]
+
+    @pytest.mark.asyncio
+    async def test_already_in_match(self, state) -> None:
+        # the first poll finds a match that started before the poller did
+        state.party(version=1, state='DEFAULT')
+        state.coregame()
+        assert await state.poller.poll() == 20.0
+        assert state.names() == ['party_update', 'match_start']
+
+    @pytest.mark.asyncio
+    async def test_leave_party_while_matchmaking(self, state) -> None:
+        state.party(version=1, state='MATCHMAKING')
+        assert await state.poller.poll() == 3.0
+        party = state.poller.party
+        state.events.clear()
+
+        # the stale party no longer keeps the matchmaking interval
+        state.no_party()
+        assert await state.poller.poll() == 10.0
+        assert state.poller.phase == 'idle'
+        assert state.poller.party is None
+        assert state.events == [('party_update', party, None)]
+        state.events.clear()
+
+        assert await state.poller.poll() == 10.0
+        assert state.events == []
+
+        # back in a party, it is new again whatever its version
+        state.party(version=1)
+        await state.poller.poll()
+        assert state.events == [('party_update', None, state.poller.party)]
+
+    @pytest.mark.asyncio
+    async def test_party_gone(self, state) -> None:
+        state.party(version=1, state='MATCHMAKING')
+        await state.poller.poll()
+        party = state.poller.party
+        state.events.clear()
+
+        # the player still points at a party that no longer answers
+        state.respond('/parties/v1/parties/{party_id}', party_id=PARTY_ID)
+        assert await state.poller.poll() == 10.0
+        assert state.events == [('party_update', party, None)]
@@ -0,0 +1,130 @@
+import asyncio
+import time
+
+import pytest
+
+from valorantx.enums import Region
+from valorantx.errors import RateLimited
+from valorantx.http import EndpointType, Ratelimit, Route
+
+KEY = (EndpointType.pd, Region.AP, 'GET /test')
+
+
+class TestRatelimit:
+    def test_unknown_budget(self) -> None:
+        ratelimit = Ratelimit(KEY)
+        assert ratelimit.limit is None
+        assert ratelimit.remaining is None
+        assert ratelimit.is_exhausted() is False
+
+    def test_update_from_headers(self) -> None:
+        ratelimit = Ratelimit(KEY)
+        ratelimit.update({'X-RateLimit-Limit': '10', 'X-RateLimit-Remaining': '7', 'X-RateLimit-Reset-After': '5'})
+        assert ratelimit.limit == 10
+        assert ratelimit.remaining == 7
+        assert ratelimit.window == 5.0
+        assert 4.0 < ratelimit.reset_after <= 5.0
+
+    def test_most_restrictive_window(self) -> None:
+        ratelimit = Ratelimit(KEY)
+        ratelimit.update({
+            'X-Method-Rate-Limit': '20:1,100:120',
+            'X-Method-Rate-Limit-Count': '1:1,98:120',
+        })
+        assert ratelimit.limit == 100
+        assert ratelimit.remaining == 2
+        assert ratelimit.window == 120.0
+
+    def test_update_keeps_lowest_remaining(self) -> None:
+        ratelimit = Ratelimit(KEY)
+        headers = {'X-RateLimit-Limit': '10', 'X-RateLimit-Remaining': '5', 'X-RateLimit-Reset-After': '5'}
+        ratelimit.update(headers)
+        # a response that left before the previous one reports a stale count
+        ratelimit.update({**headers, 'X-RateLimit-Remaining': '8'})
+        assert ratelimit.remaining == 5
+
+    def test_block(self) -> None:
+        ratelimit = Ratelimit(KEY)
+        ratelimit.block(5.0)
+        assert ratelimit.ratelimited == 1
+        assert ratelimit.is_exhausted() is True
+        assert 4.0 < ratelimit.reset_after <= 5.0
+
+    @pytest.mark.asyncio
+    async def test_acquire_reserves(self) -> None:
+        ratelimit = Ratelimit(KEY)
+        ratelimit.update({'X-RateLimit-Limit': '2', 'X-RateLimit-Remaining': '2', 'X-RateLimit-Reset-After': '5'})
+        assert await ratelimit.acquire() == 0.0
+        assert ratelimit.remaining == 1
+        assert ratelimit.outgoing == 1
+        ratelimit.release()
+        assert ratelimit.outgoing == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_reset(self) -> None:
+        ratelimit = Ratelimit(KEY)
+        ratelimit.update({'X-RateLimit-Limit': '1', 'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset-After': '0.05'})
+        assert ratelimit.is_exhausted() is True
+
+        start = time.monotonic()
+        waited = await ratelimit.acquire()
+        assert waited > 0.0
+        assert time.monotonic() - start >= 0.04
+        # refilled to the limit, then one slot taken
+        assert ratelimit.remaining == 0
+        assert ratelimit.reset_at > 0.0
+
+    @pytest.mark.asyncio
+    async def test_acquire_fifo(self) -> None:
+        ratelimit = Ratelimit(KEY)
+        ratelimit.update({'X-RateLimit-Limit': '1', 'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset-After': '0.02'})
+        order = []
+
+        async def request(i: int) -> None:
+            await ratelimit.acquire()
+            order.append(i)
+
+        await asyncio.gather(*(request(i) for i in range(3)))
+        assert order == [0, 1, 2]
+
+
+class TestHTTPRatelimit:
+    def route(self, path: str = '/test') -> Route:
+        return Route('GET', path, Region.AP)
+
+    @pytest.mark.asyncio
+    async def test_buckets_per_route(self, http, cassette) -> None:
+        headers = {'X-RateLimit-Limit': '10', 'X-RateLimit-Remaining': '9', 'X-RateLimit-Reset-After': '5'}
+        cassette.add_json('GET', self.route('/a').url, {'a': 1}, headers=headers)
+        cassette.add_json('GET', self.route('/b').url, {'b': 1})
+
+        assert await http.request(self.route('/a')) == {'a': 1}
+        assert await http.request(self.route('/b')) == {'b': 1}
+
+        a = http.get_ratelimit(self.route('/a'))
+        b = http.get_ratelimit(self.route('/b'))
+        assert a is not b
+        assert a.remaining == 9
+        assert b.remaining is None
+
+    @pytest.mark.asyncio
+    async def test_retry_after_429(self, http, cassette) -> None:
+        route = self.route()
+        cassette.add_json('GET', route.url, {}, status=429, headers={'Via': 'proxy', 'Retry-After': '0.05'})
+        cassette.add_json('GET', route.url, {'ok': True})
+
+        start = time.monotonic()
+        assert await http.request(route) == {'ok': True}
+        assert time.monotonic() - start >= 0.04
+        assert http.get_ratelimit(route).ratelimited == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_after_over_max_timeout(self, http, cassette) -> None:
+        http.max_ratelimit_timeout = 1.0
+        route = self.route()
+        cassette.add_json('GET', route.url, {}, status=429, headers={'Via': 'proxy', 'Retry-After': '60'})
+
+        with pytest.raises(RateLimited) as excinfo:
+            await http.request(route)
+        assert excinfo.value.retry_after == 60.0
+        assert http.get_ratelimit(route).is_exhausted() is True
@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from valorantx.enums import Region
+from valorantx.http import Route
+from valorantx.response_cache import CachePolicy, FileResponseCacheBackend, ResponseCache
+
+
+def cache(**policies: CachePolicy) -> ResponseCache:
+    return ResponseCache(policies={f'GET /{name}': policy for name, policy in policies.items()})
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio
+    async def test_ttl(self, clock) -> None:
+        response_cache = cache()
+        policy = CachePolicy(10.0)
+        await response_cache.set('key', {'a': 1}, policy)
+
+        entry, fresh = await response_cache.get('key')
+        assert entry is not None and entry.data == {'a': 1}
+        assert fresh is True
+
+        clock.now += 10.0
+        entry, fresh = await response_cache.get('key')
+        assert entry is None
+        assert response_cache.stats.hits == 1
+        assert response_cache.stats.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self, clock) -> None:
+        response_cache = cache()
+        await response_cache.set('key', {'a': 1}, CachePolicy(10.0, stale_while_revalidate=20.0))
+
+        clock.now += 15.0
+        entry, fresh = await response_cache.get('key')
+        assert entry is not None
+        assert fresh is False
+
+        clock.now += 15.0
+        entry, _ = await response_cache.get('key')
+        assert entry is None
+        assert response_cache.stats.stale_hits == 1
+        assert response_cache.stats.hit_ratio == 0.5
+
+    @pytest.mark.asyncio
+    async def test_cache_control(self, clock) -> None:
+        response_cache = cache()
+        policy = CachePolicy(10.0)
+
+        entry = await response_cache.set('key', {}, policy, {'Cache-Control': 'max-age=60, stale-while-revalidate=30'})
+        assert entry is not None
+        assert entry.expires_at == clock.now + 60.0
+        assert entry.stale_until == clock.now + 90.0
+
+        entry = await response_cache.set('key', {}, policy, {'Cache-Control': 'max-age=60', 'Age': '20'})
+        assert entry is not None
+        assert entry.expires_at == clock.now + 40.0
+
+        assert await response_cache.set('key', {}, policy, {'Cache-Control': 'no-store'}) is None
+        assert await response_cache.set('key', {}, policy, {'Cache-Control': 'private'}) is None
+        assert await response_cache.set('key', {}, CachePolicy(10.0, shared=False), {'Cache-Control': 'private'})
+
+        ignored = CachePolicy(10.0, respect_cache_control=False)
+        entry = await response_cache.set('key', {}, ignored, {'Cache-Control': 'no-store'})
+        assert entry is not None
+        assert entry.expires_at == clock.now + 10.0
+
+    def test_make_key(self) -> None:
+        route = Route('GET', '/test', Region.AP)
+        shared = ResponseCache.make_key(route, CachePolicy(1.0), 'puuid', {})
+        private = ResponseCache.make_key(route, CachePolicy(1.0, shared=False), 'puuid', {})
+        assert shared == f'GET {route.url}'
+        assert private == f'GET {route.url} @puuid'
+
+    def test_policies(self) -> None:
+        response_cache = ResponseCache(policies={'GET /content-service/v3/content': None})
+        assert 'GET /content-service/v3/content' not in response_cache.policies
+        assert response_cache.get_policy(Route('GET', '/v1/config/{config_region}', config_region='ap')) is not None
+
+    @pytest.mark.asyncio
+    async def test_file_backend(self, tmp_path) -> None:
+        first = ResponseCache(FileResponseCacheBackend(tmp_path))
+        await first.set('key', {'a': 1}, CachePolicy(60.0))
+
+        # another process sharing the directory
+        second = ResponseCache(FileResponseCacheBackend(tmp_path))
+        entry, fresh = await second.get('key')
+        assert entry is not None and entry.data == {'a': 1}
+        assert fresh is True
+
+        await second.clear()
+        entry, _ = await first.get('key')
+        assert entry is None
+
+
+class TestHTTPResponseCache:
+    @pytest.mark.asyncio
+    async def test_cached_route(self, http, cassette, clock) -> None:
+        route = Route('GET', '/test', Region.AP)
+        cassette.add_json('GET', route.url, {'v': 1})
+        http.response_cache = cache(test=CachePolicy(60.0))
+
+        assert await http.request(route) == {'v': 1}
+        assert await http.request(Route('GET', '/test', Region.AP)) == {'v': 1}
+        assert len(http.connection_pool.session.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_uncached_route(self, http, cassette) -> None:
+        route = Route('GET', '/other', Region.AP)
+        cassette.add_json('GET', route.url, {'v': 1})
+        http.response_cache = cache(test=CachePolicy(60.0))
+
+        await http.request(route)
+        await http.request(route)
+        assert len(http.connection_pool.session.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_response_is_revalidated(self, http, cassette, clock) -> None:
+        route = Route('GET', '/test', Region.AP)
+        cassette.add_json('GET', route.url, {'v': 1})
+        cassette.add_json('GET', route.url, {'v': 2})
+        http.response_cache = cache(test=CachePolicy(60.0, stale_while_revalidate=60.0))
+
+        assert await http.request(route) == {'v': 1}
+        clock.now += 90.0
+
+        # served at once while the fresh response is fetched in the background
+        assert await http.request(route) == {'v': 1}
+        assert http.response_cache.stats.revalidations == 1
+        await asyncio.gather(*http._revalidations.values())
+
+        assert await http.request(route) == {'v': 2}
+        assert http.response_cache.stats.hits == 1
+        assert len(http.connection_pool.session.requests) == 2
@@ -0,0 +1,292 @@
+import asyncio
+from typing import Any
+
+import aiohttp
+import pytest
+
+from valorantx import testing
+from valorantx.enums import Region
+from valorantx.errors import CircuitOpen, InternalServerError
+from valorantx.http import Route
+from valorantx.retry import CircuitBreaker, RetryBudget, RetryPolicy
+from valorantx.testing import ReplayResponse
+
+
+def connector_error() -> aiohttp.ClientConnectorError:
+    # the connection key is only used to format the message
+    return aiohttp.ClientConnectorError(None, ConnectionRefusedError(111, 'Connection refused'))  # type: ignore
+
+
+class TestRetryBudget:
+    def test_withdraw_deposit(self, clock) -> None:
+        budget = RetryBudget(ratio=0.5, min_per_second=0.0, window=10.0)
+        assert budget.remaining == 0
+        assert budget.withdraw() is False
+
+        budget.deposit()
+        budget.deposit()
+        assert budget.remaining == 1
+        assert budget.withdraw() is True
+        assert budget.remaining == 0
+        # nothing is spent when the retry is refused
+        assert budget.withdraw() is False
+        assert budget.remaining == 0
+
+    def test_min_per_second(self, clock) -> None:
+        budget = RetryBudget(ratio=0.0, min_per_second=0.2, window=10.0)
+        assert budget.withdraw() is True
+        assert budget.withdraw() is True
+        assert budget.withdraw() is False
+
+    def test_window(self, clock) -> None:
+        budget = RetryBudget(ratio=1.0, min_per_second=0.0, window=10.0)
+        budget.deposit()
+        assert budget.withdraw() is True
+        assert budget.withdraw() is False
+
+        # the request and the retry are forgotten together
+        clock.now += 11.0
+        assert budget.remaining == 0
+        budget.deposit()
+        assert budget.withdraw() is True
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            RetryBudget(ratio=-1.0)
+        with pytest.raises(ValueError):
+            RetryBudget(window=0.0)
+
+
+class TestRetryPolicy:
+    def test_is_retryable_error(self) -> None:
+        policy = RetryPolicy()
+        get = Route('GET', '/test', Region.AP)
+        post = Route('POST', '/test', Region.AP)
+
+        # the server may have processed the request before the connection dropped
+        for error in (aiohttp.ServerDisconnectedError(), ConnectionResetError(), asyncio.TimeoutError()):
+            assert policy.is_retryable_error(get, error) is True
+            assert policy.is_retryable_error(post, error) is False
+
+        # nothing was sent
+        assert policy.is_retryable_error(get, connector_error()) is True
+        assert policy.is_retryable_error(post, connector_error()) is True
+
+        certificate = aiohttp.ClientConnectorCertificateError(None, Exception())  # type: ignore
+        assert policy.is_retryable_error(get, certificate) is False
+        assert policy.is_retryable_error(get, ValueError()) is False
+
+    def test_idempotent_routes(self) -> None:
+        policy = RetryPolicy(idempotent_routes={'POST /test': True, 'GET /other': False})
+        assert policy.is_retryable_error(Route('POST', '/test', Region.AP), aiohttp.ServerDisconnectedError()) is True
+        assert policy.is_retryable_error(Route('GET', '/other', Region.AP), aiohttp.ServerDisconnectedError()) is False
+        assert policy.is_retryable_status(Route('POST', '/test', Region.AP), 502) is True
+        assert policy.is_retryable_status(Route('POST', '/post', Region.AP), 502) is False
+        assert policy.is_retryable_status(Route('GET', '/test', Region.AP), 404) is False
+
+    def test_next_delay(self, clock) -> None:
+        budget = RetryBudget(ratio=0.0, min_per_second=0.1, window=10.0)
+        policy = RetryPolicy(max_attempts=3, base_delay=1.0, max_delay=5.0, budget=budget, circuit_breaker=None)
+        route = Route('GET', '/test', Region.AP)
+
+        delay = policy.next_delay(route, 0, 0.0)
+        assert delay is not None and 1.0 <= delay <= 5.0
+        # out of attempts, the budget is not touched
+        assert policy.next_delay(route, 2, delay) is None
+        assert budget.remaining == 0
+        # the budget is spent
+        assert policy.next_delay(route, 1, delay) is None
+
+    def test_backoff(self) -> None:
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+        delay = 0.0
+        for _ in range(20):
+            delay = policy.backoff(delay)
+            assert 1.0 <= delay <= 5.0
+
+
+class TestCircuitBreaker:
+    def test_failures_in_a_row(self, clock) -> None:
+        breaker = CircuitBreaker('host', failure_threshold=3, recovery_time=30.0)
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        assert breaker.failures == 0
+        assert breaker.state == 'closed'
+
+        for _ in range(3):
+            assert breaker.acquire() is False
+            breaker.record_failure()
+            breaker.release(False)
+        assert breaker.state == 'open'
+        assert breaker.is_open()
+
+        clock.now += 10.0
+        with pytest.raises(CircuitOpen) as excinfo:
+            breaker.acquire()
+        assert excinfo.value.retry_after == 20.0
+        assert breaker.retry_after == 20.0
+
+    def test_half_open(self, clock) -> None:
+        breaker = CircuitBreaker('host', failure_threshold=1, recovery_time=30.0, half_open_probes=1)
+        breaker.record_failure()
+        clock.now += 30.0
+        assert breaker.state == 'half_open'
+        assert breaker.retry_after == 0.0
+
+        assert breaker.acquire() is True
+        # the probe in flight decides
+        with pytest.raises(CircuitOpen) as excinfo:
+            breaker.acquire()
+        assert excinfo.value.retry_after == 0.0
+
+        breaker.record_success()
+        breaker.release(True)
+        assert breaker.state == 'closed'
+        assert breaker.error_rate == 0.0
+        assert breaker.acquire() is False
+
+    def test_failed_probe(self, clock) -> None:
+        breaker = CircuitBreaker('host', failure_threshold=1, recovery_time=30.0)
+        breaker.record_failure()
+        clock.now += 30.0
+        assert breaker.acquire() is True
+        breaker.record_failure()
+        breaker.release(True)
+        assert breaker.state == 'open'
+        assert breaker.retry_after == 30.0
+
+    def test_failure_rate(self, clock) -> None:
+        breaker = CircuitBreaker('host', failure_threshold=100, failure_rate=0.5, minimum_requests=4, window=10.0)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        # not enough requests in the window yet
+        assert breaker.state == 'closed'
+        assert breaker.error_rate == 2 / 3
+
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == 'open'
+
+    def test_failure_rate_window(self, clock) -> None:
+        breaker = CircuitBreaker('host', failure_threshold=100, failure_rate=0.5, minimum_requests=4, window=10.0)
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_failure()
+
+        # the old failures left the window
+        clock.now += 11.0
+        assert breaker.error_rate == 0.0
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == 'closed'
+        assert breaker.error_rate == 0.25
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            CircuitBreaker('host', failure_threshold=0)
+        with pytest.raises(ValueError):
+            CircuitBreaker('host', failure_rate=0.0)
+        with pytest.raises(ValueError):
+            CircuitBreaker('host', recovery_time=-1.0)
+
+
+class TestHTTPRetry:
+    @pytest.mark.asyncio
+    async def test_server_error_is_retried(self, http, cassette) -> None:
+        route = Route('GET', '/test', Region.AP)
+        cassette.add_json('GET', route.url, {'error': 'oops'}, status=502)
+        cassette.add_json('GET', route.url, {'v': 1})
+        http.retry_policy = RetryPolicy(base_delay=0.0, max_delay=0.0, circuit_breaker=None)
+
+        assert await http.request(route) == {'v': 1}
+        assert len(http.connection_pool.session.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_post_is_not_retried(self, http, cassette) -> None:
+        route = Route('POST', '/test', Region.AP)
+        cassette.add_json('POST', route.url, {'error': 'oops'}, status=502)
+        cassette.add_json('POST', route.url, {'v': 1})
+        http.retry_policy = RetryPolicy(base_delay=0.0, max_delay=0.0, circuit_breaker=None)
+
+        with pytest.raises(InternalServerError):
+            await http.request(route)
+        assert len(http.connection_pool.session.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_circuit_open_fails_fast(self, http, cassette, clock) -> None:
+        route = Route('GET', '/test', Region.AP)
+        cassette.add_json('GET', route.url, {'error': 'oops'}, status=502)
+        http.retry_policy = RetryPolicy(
+            max_attempts=1,
+            budget=None,
+            circuit_breaker=lambda host: CircuitBreaker(host, failure_threshold=2, recovery_time=30.0),
+        )
+
+        for _ in range(2):
+            with pytest.raises(InternalServerError):
+                await http.request(route)
+        breaker = http.retry_policy.get_circuit_breaker(route.host)
+        assert breaker is not None and breaker.is_open()
+
+        # nothing is sent while the host is down
+        with pytest.raises(CircuitOpen):
+            await http.request(route)
+        assert len(http.connection_pool.session.requests) == 2
+
+        # a successful probe closes it
+        cassette.add_json('GET', route.url, {'v': 1})
+        clock.now += 30.0
+        assert await http.request(route) == {'v': 1}
+        assert breaker.state == 'closed'
+
+    @pytest.mark.asyncio
+    async def test_broken_body_is_one_failure(self, http, cassette, clock, monkeypatch) -> None:
+        route = Route('GET', '/test', Region.AP)
+        cassette.add_json('GET', route.url, {'v': 1})
+        http.retry_policy = RetryPolicy(max_attempts=1, budget=None)
+
+        async def read(self: Any) -> bytes:
+            raise aiohttp.ClientPayloadError('Response payload is not completed')
+
+        monkeypatch.setattr(ReplayResponse, 'read', read)
+        with pytest.raises(aiohttp.ClientPayloadError):
+            await http.request(route)
+
+        # the headers arrived fine, the attempt still only counts as the failure it was
+        breaker = http.retry_policy.get_circuit_breaker(route.host)
+        assert breaker.failures == 1
+        assert breaker.error_rate == 1.0
+
+    @pytest.mark.asyncio
+    async def test_broken_stream_is_one_failure(self, http, cassette, clock, monkeypatch) -> None:
+        stream = http.stream_mmr_leaderboard('season', region=Region.AP)
+        cassette.add_json('GET', stream._route.url, {'Players': [{'puuid': 'a'}]}, params=stream._kwargs['params'])
+        http.retry_policy = RetryPolicy(max_attempts=1, budget=None)
+
+        async def iter_chunked(self: Any, n: int) -> Any:
+            yield b'{"Players": ['
+            raise aiohttp.ClientPayloadError('Response payload is not completed')
+
+        monkeypatch.setattr(testing._ReplayStream, 'iter_chunked', iter_chunked)
+        with pytest.raises(aiohttp.ClientPayloadError):
+            async for _ in stream:
+                pass
+
+        breaker = http.retry_policy.get_circuit_breaker(stream._route.host)
+        assert breaker.failures == 1
+        assert breaker.error_rate == 1.0
+
+    @pytest.mark.asyncio
+    async def test_success_is_recorded_once(self, http, cassette, clock) -> None:
+        route = Route('GET', '/test', Region.AP)
+        cassette.add_json('GET', route.url, {'v': 1})
+        http.retry_policy = RetryPolicy(max_attempts=1, budget=None)
+
+        await http.request(route)
+        await http.request(route)
+        breaker = http.retry_policy.get_circuit_breaker(route.host)
+        assert len(breaker._outcomes) == 2
@@ -0,0 +1,153 @@
+import json
+from typing import Any, List
+
+import aiohttp
+import pytest
+
+from valorantx import utils
+from valorantx.enums import Region
+from valorantx.http import JSONArrayParser, StreamedArray
+from valorantx.retry import RetryPolicy
+from valorantx.testing import Cassette, ReplayConnectionPool, ReplayResponse, ReplaySession
+from valorantx.utils import MISSING
+
+SEASON_ID = 'season'
+
+# strings holding brackets, escaped quotes and escaped backslashes, nested values
+PLAYERS = [
+    {'puuid': 'a', 'gameName': 'close } and ]', 'tagLine': '0001', 'leaderboardRank': 1},
+    {'puuid': 'b', 'gameName': 'quote \\" }, {', 'tagLine': 'back\\\\', 'leaderboardRank': 2},
+    {'puuid': 'c', 'gameName': 'ünï ✓', 'tagLine': '[]', 'leaderboardRank': 3, 'nested': {'x': [1, {'y': ']'}]}},
+    {'puuid': 'd', 'gameName': '', 'tagLine': '', 'leaderboardRank': 4},
+]
+DOCUMENT = {
+    'Deployment': 'ap',
+    'Players': PLAYERS,
+    'totalPlayers': 4,
+    'tierDetails': {'27': {'rankedRatingThreshold': 0}},
+}
+
+
+def feed(parser: JSONArrayParser, raw: bytes, size: int) -> List[Any]:
+    items = []
+    for i in range(0, len(raw), size):
+        items.extend(parser.feed(raw[i : i + size]))
+    return items
+
+
+class TestJSONArrayParser:
+    @pytest.mark.parametrize('size', [1, 2, 3, 7, 64, 1 << 16])
+    def test_chunk_boundaries(self, size: int) -> None:
+        raw = json.dumps(DOCUMENT, ensure_ascii=False).encode('utf-8')
+        parser = JSONArrayParser('Players')
+        assert feed(parser, raw, size) == PLAYERS
+        assert parser.close() == {**DOCUMENT, 'Players': []}
+
+    @pytest.mark.parametrize('size', [1, 5])
+    def test_whitespace(self, size: int) -> None:
+        raw = json.dumps(DOCUMENT, indent=4).encode('utf-8')
+        parser = JSONArrayParser('Players')
+        assert feed(parser, raw, size) == PLAYERS
+        assert parser.close()['totalPlayers'] == 4
+
+    def test_empty_array(self) -> None:
+        parser = JSONArrayParser('Players')
+        assert parser.feed(b'{"Players": [], "totalPlayers": 0}') == []
+        assert parser.close() == {'Players': [], 'totalPlayers': 0}
+
+    def test_key_missing(self) -> None:
+        parser = JSONArrayParser('Players')
+        assert parser.feed(b'{"totalPlayers": 0}') == []
+        assert parser.close() == {'totalPlayers': 0}
+
+    def test_truncated(self) -> None:
+        raw = json.dumps(DOCUMENT).encode('utf-8')
+        parser = JSONArrayParser('Players')
+        assert feed(parser, raw[: raw.index(b'"puuid": "c"')], 3) == PLAYERS[:2]
+        with pytest.raises(ValueError):
+            parser.close()
+
+
+class _BrokenStream:
+    # hands out the first bytes of the body, then the connection resets
+    def __init__(self, body: bytes, fail_at: int) -> None:
+        self._body: bytes = body
+        self._fail_at: int = fail_at
+
+    async def iter_chunked(self, n: int):
+        for i in range(0, self._fail_at, n):
+            yield self._body[i : min(i + n, self._fail_at)]
+        raise aiohttp.ClientPayloadError('Response payload is not completed')
+
+
+class FlakySession(ReplaySession):
+    def __init__(self, cassette: Cassette) -> None:
+        super().__init__(cassette)
+        self.disconnects: int = 0
+        self.break_at: int = 0
+
+    def request(self, method: str, url: Any, **kwargs: Any) -> ReplayResponse:
+        if self.disconnects:
+            self.disconnects -= 1
+            self.requests.append((method, str(url)))
+            raise aiohttp.ServerDisconnectedError()
+        response = super().request(method, url, **kwargs)
+        if self.break_at:
+            response.content = _BrokenStream(response._body, self.break_at)  # type: ignore
+        return response
+
+
+class FlakyConnectionPool(ReplayConnectionPool):
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is MISSING or self._session.closed:
+            self._session = FlakySession(self.cassette)  # type: ignore
+        return self._session
+
+
+class TestStreamedArray:
+    @pytest.fixture
+    def session(self, http, cassette, monkeypatch) -> FlakySession:
+        http.connection_pool = FlakyConnectionPool(cassette)
+        http.retry_policy = RetryPolicy(base_delay=0.0, max_delay=0.0, circuit_breaker=None)
+        monkeypatch.setattr(StreamedArray, 'CHUNK_SIZE', 32)
+
+        stream = http.stream_mmr_leaderboard(SEASON_ID, region=Region.AP)
+        cassette.add_json('GET', stream._route.url, DOCUMENT, params=stream._kwargs['params'])
+        return http.connection_pool.session
+
+    async def collect(self, stream: StreamedArray, items: List[Any]) -> None:
+        async for item in stream:
+            items.append(item)
+
+    @pytest.mark.asyncio
+    async def test_stream(self, http, session) -> None:
+        stream = http.stream_mmr_leaderboard(SEASON_ID, region=Region.AP)
+        items: List[Any] = []
+        await self.collect(stream, items)
+        assert items == PLAYERS
+        assert stream.envelope is not None
+        assert stream.envelope['totalPlayers'] == 4
+        assert stream.envelope['Players'] == []
+
+    @pytest.mark.asyncio
+    async def test_connection_error_before_the_body_is_retried(self, http, session) -> None:
+        session.disconnects = 2
+        items: List[Any] = []
+        await self.collect(http.stream_mmr_leaderboard(SEASON_ID, region=Region.AP), items)
+        assert items == PLAYERS
+        assert len(session.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_broken_stream_yields_items_once(self, http, session) -> None:
+        raw = utils._to_json(DOCUMENT).encode('utf-8')
+        # after the second player was received
+        session.break_at = raw.index(b'"puuid":"c"')
+
+        items: List[Any] = []
+        with pytest.raises(aiohttp.ClientPayloadError):
+            await self.collect(http.stream_mmr_leaderboard(SEASON_ID, region=Region.AP), items)
+
+        # the items handed out cannot be taken back, so the request is not replayed from the start
+        assert items == PLAYERS[:2]
+        assert len(session.requests) == 1
@@ -0,0 +1,124 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from valorantx import http as http_module
+from valorantx.enums import Region
+from valorantx.http import HTTPClient, Route
+
+
+class Reauthorize:
+    """Stands in for :meth:`RiotAuth.reauthorize`, renewing the tokens for another hour."""
+
+    def __init__(self, http: HTTPClient, results: List[bool]) -> None:
+        self.http: HTTPClient = http
+        self.results: List[bool] = results
+        self.calls: int = 0
+
+    async def __call__(self) -> bool:
+        self.calls += 1
+        # the renewal takes a while, other requests fail in the meantime
+        for _ in range(5):
+            await asyncio.sleep(0)
+        renewed = self.results.pop(0) if self.results else True
+        if renewed:
+            auth = self.http.riot_auth
+            auth.access_token = f'access-{self.calls}'
+            auth.expires_at += 3600
+        return renewed
+
+
+@pytest.fixture
+def reauthorize(http: HTTPClient, clock, monkeypatch) -> Reauthorize:
+    http.re_authorize = True
+    auth = http.riot_auth
+    auth.access_token = 'access'
+    auth.entitlements_token = 'entitlements'
+    auth.expires_at = clock.now + 1000
+    http._update_auth_headers()
+
+    reauthorize = Reauthorize(http, [])
+    monkeypatch.setattr(auth, 'reauthorize', reauthorize)
+    return reauthorize
+
+
+@pytest.mark.parametrize('clock', [(http_module,)], indirect=True)
+class TestRefreshAuth:
+    @pytest.mark.asyncio
+    async def test_concurrent_bad_claims(self, http, cassette, reauthorize) -> None:
+        route = Route('GET', '/test', Region.AP)
+        for _ in range(5):
+            cassette.add_json('GET', route.url, {'errorCode': 'BAD_CLAIMS'}, status=400)
+        cassette.add_json('GET', route.url, {'v': 1})
+
+        results = await asyncio.gather(*(http.request(Route('GET', '/test', Region.AP)) for _ in range(5)))
+        assert results == [{'v': 1}] * 5
+        assert reauthorize.calls == 1
+        assert http._auth_headers['Authorization'] == 'Bearer access-1'
+        assert len(http.connection_pool.session.requests) == 10
+
+    @pytest.mark.asyncio
+    async def test_stale_generation(self, http, reauthorize) -> None:
+        generation = http._auth_generation
+        assert await http.refresh_auth(generation=generation) is True
+        assert reauthorize.calls == 1
+
+        # renewed since the caller sent its request, it retries with the new tokens
+        assert await http.refresh_auth(generation=generation) is True
+        assert reauthorize.calls == 1
+        assert await http.refresh_auth() is True
+        assert reauthorize.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_renewal(self, http, reauthorize) -> None:
+        reauthorize.results.append(False)
+        generation = http._auth_generation
+        assert await http.refresh_auth() is False
+        assert http._auth_generation == generation
+
+
+class Stop(Exception):
+    pass
+
+
+@pytest.mark.parametrize('clock', [(http_module,)], indirect=True)
+class TestTokenRefreshLoop:
+    @pytest.fixture
+    def sleeps(self, clock, monkeypatch) -> List[float]:
+        sleeps: List[float] = []
+        sleep = asyncio.sleep
+
+        async def fake_sleep(delay: float, *args) -> None:
+            if delay:
+                sleeps.append(delay)
+                if len(sleeps) == 4:
+                    raise Stop
+                clock.now += delay
+            await sleep(0)
+
+        monkeypatch.setattr(asyncio, 'sleep', fake_sleep)
+        return sleeps
+
+    @pytest.mark.asyncio
+    async def test_schedule(self, http, reauthorize, sleeps) -> None:
+        reauthorize.results.append(False)
+        with pytest.raises(Stop):
+            await http._token_refresh_loop()
+
+        margin = HTTPClient.TOKEN_REFRESH_MARGIN
+        retry = HTTPClient.TOKEN_REFRESH_RETRY
+        # woken up the margin before the expiry, the failed renewal is retried after a while and succeeds
+        assert sleeps[0] == 1000 - margin
+        assert sleeps[1] == retry
+        # then woken up the margin before the expiry of each renewed token
+        assert sleeps[2] == 1000 + 3600 - (1000 - margin + retry) - margin
+        assert sleeps[3] == 3600
+        assert reauthorize.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_unknown_expiry(self, http, reauthorize, sleeps) -> None:
+        http.riot_auth.expires_at = 0
+        await http._token_refresh_loop()
+        assert sleeps == []
+        assert reauthorize.calls == 0
@@ -17,4 +17,11 @@ from .auth import *
 from .client import *
 from .enums import *
 from .errors import *
+from .instrumentation import *
+from .match_store import *
 from .models import *
+from .name_resolver import *
+from .pool import *
+from .presence import *
+from .response_cache import *
+from .retry import *
@@ -4,7 +4,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+import contextlib
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Optional
 
 import aiohttp
 import yarl
@@ -15,6 +16,8 @@ from .errors import RiotAuthenticationError
 if TYPE_CHECKING:
     from typing_extensions import Self
 
+    from .http import ConnectionPool
+
 # fmt: off
 __all__ = (
     'RiotAuth',
@@ -23,8 +26,9 @@ __all__ = (
 
 
 class RiotAuth(_RiotAuth):
-    def __init__(self) -> None:
+    def __init__(self, *, connection_pool: Optional[ConnectionPool] = None) -> None:
         super().__init__()
+        self.connection_pool: Optional[ConnectionPool] = connection_pool
         self.game_name: Optional[str] = None
         self.tag_line: Optional[str] = None
         self.region: Optional[str] = None
@@ -49,23 +53,45 @@ class RiotAuth(_RiotAuth):
         await super().authorize_mfa(code)
         await self.__fetch_userinfo()
 
+    @contextlib.asynccontextmanager
+    async def _session(self) -> AsyncGenerator[aiohttp.ClientSession, None]:
+        # the riot-auth handshake itself keeps its own session (it needs a custom SSL context),
+        # everything else borrows the shared pool when there is one.
+        # the pool's session is shared by every account and ignores cookies, they are
+        # sent per request from this account's jar and stored back with _store_cookies
+        if self.connection_pool is None:
+            async with aiohttp.ClientSession(cookie_jar=self._cookie_jar) as session:
+                yield session
+        else:
+            yield self.connection_pool.session
+
+    def _cookies_for(self, url: str) -> Any:
+        return self._cookie_jar.filter_cookies(yarl.URL(url))
+
+    def _store_cookies(self, response: aiohttp.ClientResponse) -> None:
+        # e.g. a rotated ssid or tdid, kept for the next re-authorization
+        if response.cookies:
+            self._cookie_jar.update_cookies(response.cookies, response.url)
+
     async def fetch_region(self) -> Optional[str]:
         # Get regions
+        url = 'https://riot-geo.pas.si.riotgames.com/pas/v1/product/valorant'
         body = {'id_token': self.id_token}
         headers = {'Authorization': f'{self.token_type} {self.access_token}'}
-        async with aiohttp.ClientSession(cookie_jar=self._cookie_jar) as session:
-            async with session.put(
-                'https://riot-geo.pas.si.riotgames.com/pas/v1/product/valorant', headers=headers, json=body
-            ) as r:
+        async with self._session() as session:
+            async with session.put(url, headers=headers, json=body, cookies=self._cookies_for(url)) as r:
+                self._store_cookies(r)
                 data = await r.json()
                 self.region = data['affinities']['live']
         return self.region
 
     async def __fetch_userinfo(self) -> None:
         # Get user info
+        url = 'https://auth.riotgames.com/userinfo'
         headers = {'Authorization': f'{self.token_type} {self.access_token}'}
-        async with aiohttp.ClientSession(cookie_jar=self._cookie_jar) as session:
-            async with session.post('https://auth.riotgames.com/userinfo', headers=headers) as r:
+        async with self._session() as session:
+            async with session.post(url, headers=headers, cookies=self._cookies_for(url)) as r:
+                self._store_cookies(r)
                 data = await r.json()
                 # self.user_id = data['sub'] # puuid
                 self.game_name = data['acct']['game_name']
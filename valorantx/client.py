@@ -4,13 +4,34 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import datetime
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, List, Optional, Type, TypeVar, Union
+import os
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from . import utils
 from .enums import Locale, QueueType, Region, SeasonType, try_enum
-from .errors import RiotAuthRequired
-from .http import HTTPClient
+from .errors import MatchDetailsFetchError, RiotAuthRequired
+from .http import ConnectionPool, HTTPClient
+from .instrumentation import Instrumentation
+from .match_store import MatchStore
 from .models.account_xp import AccountXP
 from .models.config import Config
 from .models.content import Content
@@ -19,8 +40,9 @@ from .models.coregame import CoreGameMatch, CoreGamePlayer
 from .models.daily_ticket import DailyTicket
 from .models.esports import ScheduleLeague, TournamentStanding
 from .models.favorites import Favorites
+from .models.leaderboard import LeaderboardEntry, LeaderboardTable
 from .models.loadout import Loadout
-from .models.match import MatchDetails, MatchHistory
+from .models.match import MatchDetails, MatchHistory, MatchHistoryEntry
 from .models.mmr import MatchmakingRating
 from .models.name_service import NameService
 from .models.party import Party, PartyPlayer
@@ -29,6 +51,10 @@ from .models.pregame import PreGameMatch, PreGamePlayer
 from .models.premiers import Conference, Eligibility, PremierPleyer, PremierSeason, Roster
 from .models.store import AgentStore, Entitlements, Offers, StoreFront, Wallet
 from .models.user import ClientUser
+from .name_resolver import NameResolver
+from .presence import PresencePoller
+from .response_cache import ResponseCache
+from .retry import CircuitBreaker, RetryPolicy
 from .valorant_api_client import Client as ValorantAPIClient
 
 if TYPE_CHECKING:
@@ -96,6 +122,14 @@ class Client:
         region: Region = MISSING,
         locale: Locale = Locale.american_english,
         re_authorize: bool = True,
+        max_ratelimit_timeout: Optional[float] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+        match_store: Optional[MatchStore] = None,
+        asset_snapshot_path: Optional[Union[str, os.PathLike[str]]] = None,
+        valorant_api: Optional[ValorantAPIClient] = None,
+        response_cache: Optional[ResponseCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> None:
         if region is MISSING:
             _log.warning(
@@ -109,8 +143,28 @@ class Client:
         self.locale: Locale = locale
         self.re_authorize: bool = re_authorize
         self.loop: asyncio.AbstractEventLoop = _loop
-        self.http: HTTPClient = HTTPClient(self.loop, region=region, re_authorize=re_authorize)
-        self.valorant_api: ValorantAPIClient = ValorantAPIClient(self.http._session, self.locale)
+        # a pool passed in by the caller is theirs to close
+        self._owns_connection_pool: bool = connection_pool is None
+        if connection_pool is None:
+            trace_configs = [instrumentation.trace_config()] if instrumentation is not None else []
+            connection_pool = ConnectionPool(trace_configs=trace_configs)
+        self.connection_pool: ConnectionPool = connection_pool
+        self.http: HTTPClient = HTTPClient(
+            self.loop,
+            region=region,
+            re_authorize=re_authorize,
+            max_ratelimit_timeout=max_ratelimit_timeout,
+            connection_pool=self.connection_pool,
+            response_cache=response_cache,
+            instrumentation=instrumentation,
+            retry_policy=retry_policy,
+        )
+        # a shared asset cache is initialised and closed by its owner, see ClientPool
+        self._owns_valorant_api: bool = valorant_api is None
+        self.valorant_api: ValorantAPIClient = valorant_api or ValorantAPIClient(
+            self.connection_pool, self.locale, snapshot_path=asset_snapshot_path
+        )
+        self.match_store: Optional[MatchStore] = match_store
         self.me: ClientUser = MISSING
         self._closed: bool = False
         self._authorized: asyncio.Event = MISSING
@@ -120,6 +174,9 @@ class Client:
         self._act: Season = MISSING
         self._configs: Dict[Region, Config] = {}
         self._tasks: Dict[str, asyncio.Task[Any]] = {}
+        self._timings: Dict[str, float] = {}
+        self.presence: Optional[PresencePoller] = None
+        self.name_resolver: NameResolver = NameResolver(self)
 
     async def __aenter__(self) -> Self:
         return self
@@ -161,6 +218,33 @@ class Client:
     def configs(self) -> Dict[Region, Config]:
         return self._configs
 
+    @property
+    def timings(self) -> Dict[str, float]:
+        """Dict[:class:`str`, :class:`float`]: The seconds each bootstrap phase took.
+
+        ``valorant_api`` is the asset cache load. ``offers``, ``content`` and
+        ``configs`` run concurrently after authorization, so ``after_authorize``,
+        the time from authorization until the client is ready, is their maximum.
+        """
+        return self._timings.copy()
+
+    @property
+    def circuit_breakers(self) -> List[CircuitBreaker]:
+        """List[:class:`CircuitBreaker`]: The circuit breaker of every Riot host requested so far.
+
+        Their :attr:`CircuitBreaker.state` tells which hosts are considered down.
+        """
+        return self.http.retry_policy.circuit_breakers
+
+    @contextlib.contextmanager
+    def _timed(self, phase: str) -> Generator[None, None, None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._timings[phase] = elapsed = time.perf_counter() - start
+            _log.debug('bootstrap phase %r took %.3fs', phase, elapsed)
+
     def get_config(self, region: Optional[Region] = None) -> Optional[Config]:
         """Gets the config for the given region.
 
@@ -202,6 +286,80 @@ class Client:
                 'Please use the authorize method or asynchronous context manager before calling this method'
             )
 
+    # events
+
+    def event(self, coro: Callable[..., Coro[Any]], /) -> Callable[..., Coro[Any]]:
+        """A decorator that registers an event to listen to.
+
+        The name of the coroutine is the event it listens to, e.g. ``on_party_update``.
+
+        Raises
+        ------
+        TypeError
+            The function passed is not a coroutine function.
+        """
+        if not asyncio.iscoroutinefunction(coro):
+            raise TypeError('event registered must be a coroutine function')
+
+        setattr(self, coro.__name__, coro)
+        _log.debug('%s has successfully been registered as an event', coro.__name__)
+        return coro
+
+    async def _run_event(self, coro: Callable[..., Coro[Any]], event_name: str, *args: Any, **kwargs: Any) -> None:
+        try:
+            await coro(*args, **kwargs)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            try:
+                await self.on_error(event_name, *args, **kwargs)
+            except asyncio.CancelledError:
+                pass
+
+    def dispatch(self, event: str, /, *args: Any, **kwargs: Any) -> None:
+        """Calls the ``on_<event>`` coroutine registered with :meth:`event`, if any, in a new task."""
+        _log.debug('Dispatching event %s', event)
+        method = 'on_' + event
+        try:
+            coro = getattr(self, method)
+        except AttributeError:
+            return
+        self.loop.create_task(self._run_event(coro, method, *args, **kwargs), name=f'valorantx: {method}')
+
+    async def on_error(self, event_method: str, /, *args: Any, **kwargs: Any) -> None:
+        """|coro|
+
+        The default error handler of events, logs the exception. Override it to handle errors yourself.
+        """
+        _log.exception('Ignoring exception in %s', event_method)
+
+    @_authorize_required
+    async def start_presence_polling(self, **options: Any) -> PresencePoller:
+        """|coro|
+
+        Starts polling the party, pregame and coregame state in the background
+        and dispatching events like ``on_party_update``, ``on_agent_lock`` and ``on_match_start``.
+
+        Parameters
+        ----------
+        **options: Any
+            The intervals passed to :class:`PresencePoller`, used only if it is not running yet.
+
+        Returns
+        -------
+        :class:`PresencePoller`
+            The running poller.
+        """
+        if self.presence is None:
+            self.presence = PresencePoller(self, **options)
+        self.presence.start()
+        return self.presence
+
+    def stop_presence_polling(self) -> None:
+        """Stops the presence poller started with :meth:`start_presence_polling`."""
+        if self.presence is not None:
+            self.presence.stop()
+
     async def _init(self) -> None:
         _log.debug('initializing client')
 
@@ -212,16 +370,18 @@ class Client:
         self._authorized = asyncio.Event()
 
         # valorant-api
-        await self.valorant_api.init()
-
-        try:
-            await asyncio.wait_for(self.valorant_api.wait_until_ready(), timeout=30)
-        except asyncio.TimeoutError as e:
-            raise RuntimeError('Valorant API did not become ready in time') from e
-        else:
-            self._version = self.valorant_api.version
-            HTTPClient.RIOT_CLIENT_VERSION = self._version.riot_client_version
-            _log.debug('assets valorant version: %s', self._version.version)
+        with self._timed('valorant_api'):
+            if self._owns_valorant_api:
+                await self.valorant_api.init()
+
+            try:
+                await asyncio.wait_for(self.valorant_api.wait_until_ready(), timeout=30)
+            except asyncio.TimeoutError as e:
+                raise RuntimeError('Valorant API did not become ready in time') from e
+            else:
+                self._version = self.valorant_api.version
+                HTTPClient.RIOT_CLIENT_VERSION = self._version.riot_client_version
+                _log.debug('assets valorant version: %s', self._version.version)
 
         self._tasks['after_authorize'] = self.loop.create_task(
             self._init_after_authorize(), name='valorantx: after_authorize'
@@ -232,34 +392,49 @@ class Client:
     async def _init_after_authorize(self) -> None:
         await self.wait_until_authorized()
 
-        # fetch offers and insert into items
-        offers = await self.fetch_store_offers()
-        self.valorant_api.insert_cost(offers)
-
-        # fetch current season and act
-        content = await self.fetch_content()
-        for season_content in reversed(content.seasons):
-            if not season_content.is_active():
-                continue
-
-            season = self.valorant_api.get_season(season_content.id)
-            if season is not None:
-                if season_content.type == SeasonType.episode:
-                    self._season = season
-                elif season_content.type == SeasonType.act:
-                    self._act = season
-
-        # fetch configs
-        for region in Region:
-            if region is Region.PBE:
-                continue
-            if region is self._configs:
-                continue
-            config = await self.fetch_config(region)
-            self._configs[region] = config
+        # offers, content and configs do not depend on each other
+        with self._timed('after_authorize'):
+            await asyncio.gather(
+                self._init_offers(),
+                self._init_content(),
+                self._init_configs(),
+            )
 
         self._ready.set()
 
+    async def _init_offers(self) -> None:
+        with self._timed('offers'):
+            # fetch offers and insert into items
+            offers = await self.fetch_store_offers()
+            self.valorant_api.insert_cost(offers)
+
+    async def _init_content(self) -> None:
+        with self._timed('content'):
+            # fetch current season and act
+            content = await self.fetch_content()
+            for season_content in reversed(content.seasons):
+                if not season_content.is_active():
+                    continue
+
+                season = self.valorant_api.get_season(season_content.id)
+                if season is not None:
+                    if season_content.type == SeasonType.episode:
+                        self._season = season
+                    elif season_content.type == SeasonType.act:
+                        self._act = season
+
+    async def _init_configs(self, *, concurrency: int = 3) -> None:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(region: Region) -> None:
+            async with semaphore:
+                self._configs[region] = await self.fetch_config(region)
+
+        with self._timed('configs'):
+            # Region has aliases, iterating it yields each shard once
+            regions = [region for region in Region if region is not Region.PBE and region not in self._configs]
+            await asyncio.gather(*(fetch(region) for region in regions))
+
     async def close(self) -> None:
         """|coro|
 
@@ -269,14 +444,19 @@ class Client:
             return
         self._closed = True
 
-        await self.valorant_api.close()
+        if self._owns_valorant_api:
+            await self.valorant_api.close()
         await self.http.close()
+        if self._owns_connection_pool:
+            await self.connection_pool.close()
         if self._ready is not MISSING:
             self._ready.clear()
 
         if self._authorized is not MISSING:
             self._authorized.clear()
 
+        self.stop_presence_polling()
+        self.name_resolver.clear()
         for task in self._tasks.values():
             task.cancel()
 
@@ -292,6 +472,8 @@ class Client:
         self._version = MISSING
         self._season = MISSING
         self._act = MISSING
+        self._timings.clear()
+        self.name_resolver.clear()
 
     def is_ready(self) -> bool:
         """:class:`bool`: Specifies if the client's internal cache is ready for use."""
@@ -350,7 +532,7 @@ class Client:
 
         data = await self.http.cookie_login(auth_data)
         self.me = me = ClientUser(data=data)
-        self._authorized.is_set()
+        self._authorized.set()
         _log.info('logged as %s', me.riot_id)
 
         await self.wait_until_ready()
@@ -406,6 +588,45 @@ class Client:
         data = await self.http.get_name_service_players(puuid)
         return [NameService(data=name) for name in data]
 
+    @_authorize_required
+    async def resolve_player_name(self, puuid: str) -> Optional[NameService]:
+        """|coro|
+
+        Resolves the name of a player through :attr:`name_resolver`.
+
+        Unlike :meth:`fetch_player_name_by_puuid`, the name may come from the
+        cache, and lookups made at the same time are sent in one request.
+
+        Parameters
+        ----------
+        puuid: :class:`str`
+            The puuid of the player.
+
+        Returns
+        -------
+        Optional[:class:`NameService`]
+            The name of the player, ``None`` if the name service does not know the puuid.
+        """
+        return await self.name_resolver.resolve(puuid)
+
+    @_authorize_required
+    async def resolve_player_names(self, puuids: Iterable[str]) -> Dict[str, NameService]:
+        """|coro|
+
+        Resolves the names of several players through :attr:`name_resolver`.
+
+        Parameters
+        ----------
+        puuids: Iterable[:class:`str`]
+            The puuids of the players.
+
+        Returns
+        -------
+        Dict[:class:`str`, :class:`NameService`]
+            The names by puuid. Puuids the name service does not know are missing.
+        """
+        return await self.name_resolver.resolve_many(puuids)
+
     # store endpoints
 
     @_authorize_required
@@ -571,6 +792,151 @@ class Client:
         data = await self.http.get_mmr_player(puuid)
         return MatchmakingRating(self, data)
 
+    async def iter_leaderboard(
+        self,
+        season: Optional[Union[str, Season]] = None,
+        region: Optional[Region] = None,
+        *,
+        page_size: int = 510,
+        concurrency: int = 4,
+        limit: Optional[int] = None,
+        table: Optional[LeaderboardTable] = None,
+        checkpoint: Optional[Union[str, os.PathLike[str]]] = None,
+        checkpoint_interval: int = 10,
+    ) -> AsyncIterator[LeaderboardEntry]:
+        """Crawls the competitive leaderboard of a shard.
+
+        Pages are fetched ``concurrency`` at a time under the shared rate limiter
+        and streamed into a compact :class:`LeaderboardTable`. Players are yielded
+        page by page in completion order, not necessarily by rank.
+
+        With a ``checkpoint`` file the table is saved every ``checkpoint_interval``
+        pages and when the iteration stops, and a later call with the same file
+        only fetches the pages that are still missing. Players of pages that were
+        already in the checkpoint are not yielded again, they are in the table.
+
+        Parameters
+        ----------
+        season: Optional[Union[:class:`str`, :class:`Season`]]
+            The season (act) of the leaderboard. Defaults to the current act.
+        region: Optional[:class:`Region`]
+            The region of the leaderboard. Defaults to the client's region.
+        page_size: :class:`int`
+            The amount of players per request.
+        concurrency: :class:`int`
+            The maximum amount of pages fetched at once.
+        limit: Optional[:class:`int`]
+            Only crawl the top ``limit`` ranks.
+        table: Optional[:class:`LeaderboardTable`]
+            The table to fill. Defaults to the one in ``checkpoint`` or a new one.
+        checkpoint: Optional[Union[:class:`str`, :class:`os.PathLike`]]
+            A file to save progress to and resume from.
+        checkpoint_interval: :class:`int`
+            The amount of finished pages between two checkpoint saves.
+
+        Yields
+        ------
+        :class:`LeaderboardEntry`
+            The players as their pages complete.
+
+        Raises
+        ------
+        ValueError
+            No season was given and the current act is not known, or the table
+            belongs to another season or region or was crawled with another ``page_size``.
+        HTTPException
+            Fetching a page failed.
+        """
+        if not self.is_authorized():
+            raise RiotAuthRequired(f'{self.__class__.__name__}.iter_leaderboard requires authorization')
+
+        if concurrency < 1 or page_size < 1:
+            raise ValueError('concurrency and page_size must be at least 1')
+
+        if season is None:
+            if self._act is MISSING:
+                raise ValueError('season is required until the current act is known')
+            season = self._act
+        season_id = season if isinstance(season, str) else str(season.id)
+        region = region or self.region
+
+        if table is None:
+            if checkpoint is not None and os.path.exists(checkpoint):
+                table = LeaderboardTable.load(checkpoint)
+            else:
+                table = LeaderboardTable(season_id, region.value, page_size)
+        if table.season_id != season_id or table.region != region.value:
+            raise ValueError(f'{table!r} does not belong to season {season_id!r} in {region.value!r}')
+        # the pages are known by start index only, with another size they would cover other ranks
+        if table.page_size is None:
+            if table.pages:
+                raise ValueError(f'{table!r} does not record the size of its pages and cannot be resumed')
+            table.page_size = page_size
+        elif table.page_size != page_size:
+            raise ValueError(f'{table!r} was crawled with page_size={table.page_size}, not {page_size}')
+
+        async def fetch_page(start: int) -> List[int]:
+            stream = self.http.stream_mmr_leaderboard(season_id, start, page_size, region=region)
+            ranks = [table.add(player) async for player in stream]  # type: ignore # table is set
+            table.mark_page(start, (stream.envelope or {}).get('totalPlayers'))  # type: ignore
+            return ranks
+
+        def entries(ranks: List[int]) -> List[LeaderboardEntry]:
+            return [table.get(rank) for rank in ranks if limit is None or rank <= limit]  # type: ignore
+
+        finished = 0
+
+        def page_done() -> None:
+            nonlocal finished
+            finished += 1
+            if checkpoint is not None and not finished % checkpoint_interval:
+                table.save(checkpoint)  # type: ignore
+
+        try:
+            if table.total is None:
+                # the first page tells how many pages there are
+                ranks = await fetch_page(0)
+                page_done()
+                for entry in entries(ranks):
+                    yield entry
+
+            stop = table.total or 0
+            if limit is not None:
+                stop = min(stop, limit)
+            pages = iter(table.missing_pages(page_size, 0, stop))
+            queue: asyncio.Queue[Optional[Union[List[int], Exception]]] = asyncio.Queue(maxsize=concurrency)
+
+            async def worker() -> None:
+                # workers share the iterator, each takes the next page when it is free
+                for start in pages:
+                    try:
+                        result: Union[List[int], Exception] = await fetch_page(start)
+                    except Exception as e:
+                        result = e
+                    await queue.put(result)
+                await queue.put(None)
+
+            workers = [self.loop.create_task(worker()) for _ in range(concurrency)]
+            try:
+                done = 0
+                while done < len(workers):
+                    result = await queue.get()
+                    if result is None:
+                        done += 1
+                        continue
+                    if isinstance(result, Exception):
+                        raise result
+                    page_done()
+                    for entry in entries(result):
+                        yield entry
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+        finally:
+            if checkpoint is not None:
+                table.save(checkpoint)
+
     @_authorize_required
     async def fetch_match_history(
         self,
@@ -580,6 +946,7 @@ class Client:
         start: int = 0,
         end: int = 15,
         with_details: bool = True,
+        lazy: bool = False,
     ) -> MatchHistory:
         """|coro|
 
@@ -597,6 +964,8 @@ class Client:
             The end index of the match history.
         with_details: :class:`bool`
             Whether to fetch the match details for the match history.
+        lazy: :class:`bool`
+            Whether to defer building the round results of each match until they are first accessed.
 
         Returns
         -------
@@ -615,11 +984,94 @@ class Client:
         data = await self.http.get_match_history(puuid, start, end, queue)
         history = MatchHistory(client=self, data=data)
         if with_details:
-            await history.fetch_details()
+            await history.fetch_details(lazy=lazy)
         return history
 
+    async def iter_match_history(
+        self,
+        puuid: Optional[str] = None,
+        queue: Optional[Union[str, QueueType]] = None,
+        *,
+        page_size: int = 20,
+        since: Optional[datetime.datetime] = None,
+        until_match_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[MatchHistoryEntry]:
+        """Iterates over the whole match history of the current user or a given user, newest first.
+
+        Pages are requested one after another and the next page is fetched in the
+        background while the current one is being consumed. Because the history is
+        ordered newest first, an incremental sync can stop as soon as it reaches a
+        match it has already seen.
+
+        Parameters
+        ----------
+        puuid: Optional[:class:`str`]
+            The puuid of the user to iterate the match history for.
+        queue: Optional[Union[:class:`str`, :class:`QueueType`]]
+            The queue to iterate the match history for.
+        page_size: :class:`int`
+            The amount of matches requested per page.
+        since: Optional[:class:`datetime.datetime`]
+            Stop before the first match that started before this time.
+        until_match_id: Optional[:class:`str`]
+            Stop before this match. Usually the newest match of the previous sync.
+        limit: Optional[:class:`int`]
+            The maximum amount of matches to yield.
+
+        Yields
+        ------
+        :class:`MatchHistoryEntry`
+            A match in the match history.
+
+        Raises
+        ------
+        HTTPException
+            Fetching a page of the match history failed.
+        """
+        if not self.is_authorized():
+            raise RiotAuthRequired(f'{self.__class__.__name__}.iter_match_history requires authorization')
+
+        if page_size < 1:
+            raise ValueError('page_size must be at least 1')
+
+        if isinstance(queue, QueueType):
+            queue = queue.value
+
+        since_millis = since.timestamp() * 1000 if since is not None else None
+
+        def fetch_page(start: int) -> asyncio.Task[Any]:
+            return self.loop.create_task(self.http.get_match_history(puuid, start, start + page_size, queue))
+
+        start = 0
+        yielded = 0
+        next_page: Optional[asyncio.Task[Any]] = fetch_page(start)
+        try:
+            while next_page is not None:
+                data = await next_page
+                next_page = None
+                history = data['History']
+                start += page_size
+                if history and start < data['Total']:
+                    next_page = fetch_page(start)
+
+                for match in history:
+                    entry = MatchHistoryEntry(self, data['Subject'], match)
+                    if entry.id == until_match_id:
+                        return
+                    if since_millis is not None and entry.game_start_millis < since_millis:
+                        return
+                    yield entry
+                    yielded += 1
+                    if limit is not None and yielded >= limit:
+                        return
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+                await asyncio.gather(next_page, return_exceptions=True)
+
     @_authorize_required
-    async def fetch_match_details(self, match_id: str, /) -> MatchDetails:
+    async def fetch_match_details(self, match_id: str, /, *, lazy: bool = False) -> MatchDetails:
         """|coro|
 
         Fetches the match details for a given match.
@@ -628,6 +1080,9 @@ class Client:
         ----------
         match_id: :class:`str`
             The match ID to fetch the match details for.
+        lazy: :class:`bool`
+            Whether to defer building the round results, kills and round-derived
+            player stats until they are first accessed.
 
         Returns
         -------
@@ -640,8 +1095,92 @@ class Client:
         NotFound
             The match details for the given match could not be found.
         """
+        if self.match_store is not None:
+            data = await self.match_store.get(match_id)
+            if data is not None:
+                return MatchDetails(client=self, data=data, lazy=lazy)
+
         data = await self.http.get_match_details(match_id)
-        return MatchDetails(client=self, data=data)
+        # only a finished match is immutable
+        if self.match_store is not None and data['matchInfo']['isCompleted']:
+            await self.match_store.set(match_id, data)
+        return MatchDetails(client=self, data=data, lazy=lazy)
+
+    async def fetch_match_details_many(
+        self,
+        match_ids: Iterable[str],
+        *,
+        concurrency: int = 5,
+        return_exceptions: bool = False,
+        lazy: bool = False,
+    ) -> AsyncIterator[Union[MatchDetails, MatchDetailsFetchError]]:
+        """Fetches the match details for many matches with bounded concurrency.
+
+        Matches are yielded in completion order. At most ``concurrency`` requests are
+        in flight and finished results wait in a queue of the same size, so a slow
+        consumer pauses the workers instead of piling up parsed matches.
+
+        Parameters
+        ----------
+        match_ids: Iterable[:class:`str`]
+            The match IDs to fetch the match details for.
+        concurrency: :class:`int`
+            The maximum amount of matches fetched at once.
+        return_exceptions: :class:`bool`
+            Whether to yield a :class:`MatchDetailsFetchError` for a match that failed
+            instead of raising and stopping the iteration.
+        lazy: :class:`bool`
+            Whether to defer building the round results of each match until they are first accessed.
+
+        Yields
+        ------
+        Union[:class:`MatchDetails`, :class:`MatchDetailsFetchError`]
+            The match details as they complete.
+
+        Raises
+        ------
+        HTTPException
+            Fetching the match details failed and ``return_exceptions`` is ``False``.
+        """
+        if not self.is_authorized():
+            raise RiotAuthRequired(f'{self.__class__.__name__}.fetch_match_details_many requires authorization')
+
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+
+        match_ids = iter(match_ids)
+        queue: asyncio.Queue[Optional[Tuple[str, Union[MatchDetails, Exception]]]] = asyncio.Queue(maxsize=concurrency)
+
+        async def worker() -> None:
+            # workers share the iterator, each takes the next ID when it is free
+            for match_id in match_ids:
+                try:
+                    result = await self.fetch_match_details(match_id, lazy=lazy)
+                except Exception as e:
+                    result = e
+                await queue.put((match_id, result))
+            await queue.put(None)
+
+        workers = [self.loop.create_task(worker()) for _ in range(concurrency)]
+        try:
+            finished = 0
+            while finished < len(workers):
+                item = await queue.get()
+                if item is None:
+                    finished += 1
+                    continue
+
+                match_id, result = item
+                if isinstance(result, Exception):
+                    if not return_exceptions:
+                        raise result
+                    yield MatchDetailsFetchError(match_id, result)
+                else:
+                    yield result
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
     # party
 
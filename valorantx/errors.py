@@ -11,9 +11,11 @@ if TYPE_CHECKING:
 
 __all__ = (
     'BadRequest',
+    'CircuitOpen',
     'Forbidden',
     'HTTPException',
     'InternalServerError',
+    'MatchDetailsFetchError',
     'NotFound',
     'RateLimited',
     'RiotAuthRequired',
@@ -108,10 +110,59 @@ class RiotScheduledDowntime(InGameAPIError):
 
 class RateLimited(InGameAPIError):
     """Exception that's raised for when a 429 status code occurs.
-    .
+
+    Attributes
+    ------------
+    retry_after: :class:`float`
+        The amount of seconds the server asked us to wait before retrying.
     """
 
-    pass
+    def __init__(
+        self,
+        response: ClientResponse,
+        message: Optional[Union[str, Dict[str, Any]]],
+        retry_after: float = 0.0,
+    ):
+        self.retry_after: float = retry_after
+        super().__init__(response, message)
+
+
+class MatchDetailsFetchError(ValorantXError):
+    """Exception that's yielded by :meth:`Client.fetch_match_details_many`
+    for a single match that could not be fetched.
+
+    Attributes
+    ------------
+    match_id: :class:`str`
+        The ID of the match that failed.
+    original: :class:`Exception`
+        The exception that was raised while fetching the match.
+    """
+
+    def __init__(self, match_id: str, original: Exception):
+        self.match_id: str = match_id
+        self.original: Exception = original
+        super().__init__(f'Fetching match details of {match_id!r} failed: {original}')
+
+
+class CircuitOpen(ValorantXError):
+    """Exception that's raised when a request is not sent because its host is considered down.
+
+    See :class:`CircuitBreaker`.
+
+    Attributes
+    ------------
+    host: :class:`str`
+        The host, e.g. ``pd.ap.a.pvp.net``.
+    retry_after: :class:`float`
+        The amount of seconds until requests to the host are tried again.
+        ``0`` when the host is already being probed.
+    """
+
+    def __init__(self, host: str, retry_after: float):
+        self.host: str = host
+        self.retry_after: float = retry_after
+        super().__init__(f'{host} is considered down, retry in {retry_after:.2f} seconds')
 
 
 class RiotAuthRequired(ValorantXError):
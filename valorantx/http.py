@@ -7,19 +7,31 @@ from __future__ import annotations
 import asyncio
 import base64
 import enum
+import functools
 import json
 import logging
+import re
+import ssl
+import string
+import time
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
     ClassVar,
     Coroutine,
     Dict,
+    FrozenSet,
     List,
     Literal,
     Mapping,
     NoReturn,
     Optional,
+    Sequence,
+    Set,
+    Tuple,
     TypeVar,
     Union,
     overload,
@@ -40,6 +52,9 @@ from .errors import (
     RateLimited,
     RiotAuthenticationError,
 )
+from .instrumentation import Instrumentation, RequestTrace
+from .response_cache import CachePolicy, ResponseCache
+from .retry import RetryPolicy
 
 # try:
 #     import urllib3
@@ -80,25 +95,201 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 
+# the routes whose identical requests in flight share one response, keyed like the rate limit buckets
+# every caller gets the same decoded payload, only routes whose payload is read and not mutated belong here
+DEFAULT_COALESCED_ROUTES: FrozenSet[str] = frozenset({
+    'GET /content-service/v3/content',
+    'GET /match-details/v1/matches/{match_id}',
+    'GET /mmr/v1/players/{puuid}',
+})
+
 
 async def json_or_text(response: aiohttp.ClientResponse) -> Union[Dict[str, Any], str]:
-    text = await response.text(encoding='utf-8')
+    return _decode_body(await response.read(), response.headers)
 
-    try:
-        if 'application/json' in response.headers['content-type']:
-            return utils._from_json(text)
-    except KeyError:
-        pass
+
+def _decode_body(body: bytes, headers: Mapping[str, str]) -> Union[Dict[str, Any], str]:
+    # decoded straight from the bytes, the body is never copied into an intermediate str
+    if 'application/json' in headers.get('content-type', ''):
+        return utils._from_json(body)
 
     # try to parse it as json anyway
     # some endpoints return plain text but it's actually json
-    if isinstance(text, str):
-        try:
-            return utils._from_json(text)
-        except json.JSONDecodeError:
-            pass
+    try:
+        return utils._from_json(body)
+    except ValueError:
+        pass
 
-    return text
+    return body.decode('utf-8')
+
+
+# between two items of an array: separators, then the next item or the end of the array
+_json_item_start = re.compile(rb'[\s,]*([\[{\]])').match
+# where an object or array item may end: its closing bracket followed by ',' or ']'
+_json_item_end = re.compile(rb'[}\]](?=\s*[,\]])').search
+
+
+class JSONArrayParser:
+    """Incrementally parses the items of one array inside a JSON object fed in chunks.
+
+    Each item is decoded as soon as its last byte arrived, so a caller can
+    handle the first records of a large response before the rest is received,
+    and at no point is the whole body held as bytes and objects at once.
+    The items of the array must be objects or arrays.
+
+    Parameters
+    ----------
+    key: :class:`str`
+        The key of the array in the top-level object, e.g. ``'Players'``.
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key: str = key
+        self._key_pattern = re.compile(rb'"%s"\s*:\s*\[' % re.escape(key.encode('utf-8')))
+        self._buffer: bytearray = bytearray()
+        # the document before the array (up to and including '['), once found
+        self._prefix: Optional[bytes] = None
+        # the document after the array (from its ']'), once the array ended
+        self._suffix: Optional[bytearray] = None
+        self._pos: int = 0
+        self._start: int = -1
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Feeds the next chunk and returns the items completed by it."""
+        if self._suffix is not None:
+            self._suffix += chunk
+            return []
+
+        self._buffer += chunk
+        if self._prefix is None:
+            match = self._key_pattern.search(self._buffer)
+            if match is None:
+                return []
+            self._prefix = bytes(self._buffer[: match.end()])
+            del self._buffer[: match.end()]
+            self._pos = 0
+
+        return self._scan()
+
+    def _scan(self) -> List[Any]:
+        items: List[Any] = []
+        buffer = self._buffer
+        pos = self._pos
+
+        while True:
+            if self._start == -1:
+                match = _json_item_start(buffer, pos)
+                if match is None:
+                    break
+                if match.group(1) == b']':
+                    # the array is over, the rest belongs to the envelope
+                    self._suffix = buffer[match.start(1) :]
+                    buffer.clear()
+                    pos = 0
+                    break
+                self._start = match.start(1)
+                pos = self._start + 1
+
+            # a JSON value cannot be followed by more JSON, so the first
+            # candidate end that decodes is the end of the item
+            match = _json_item_end(buffer, pos)
+            if match is None:
+                break
+            end = match.start() + 1
+            try:
+                item = utils._from_json(buffer[self._start : end])
+            except ValueError:
+                # the '}' or ']' was inside a string or closed a nested value
+                pos = end
+                continue
+            items.append(item)
+            self._start = -1
+            pos = end
+
+        # only the unfinished item has to be kept
+        keep = self._start if self._start != -1 else pos
+        if keep:
+            del buffer[:keep]
+            pos -= keep
+            if self._start != -1:
+                self._start = 0
+        self._pos = pos
+        return items
+
+    def close(self) -> Any:
+        """Returns the rest of the document, with the streamed array left empty.
+
+        If the key never appeared the whole document is returned as is.
+
+        Raises
+        ------
+        ValueError
+            The document ended inside the array.
+        """
+        if self._prefix is None:
+            return utils._from_json(bytes(self._buffer))
+        if self._suffix is None:
+            raise ValueError(f'JSON document ended inside the {self.key!r} array')
+        return utils._from_json(self._prefix + bytes(self._suffix))
+
+
+class StreamedArray:
+    """An asynchronous iterator over the items of one array of a JSON response, yielded as they arrive.
+
+    The request goes through the usual rate limiting and retries of
+    :class:`HTTPClient`. At most ``buffer`` decoded items wait for the consumer;
+    once it is full the body is not read any further.
+
+    Attributes
+    ----------
+    envelope: Optional[Dict[:class:`str`, Any]]
+        The rest of the response, with the array left empty.
+        Available once the iterator is exhausted.
+    """
+
+    CHUNK_SIZE: ClassVar[int] = 64 * 1024
+
+    def __init__(self, http: HTTPClient, route: Route, key: str, *, buffer: int = 64, **kwargs: Any) -> None:
+        self._http: HTTPClient = http
+        self._route: Route = route
+        self._key: str = key
+        self._buffer: int = buffer
+        self._kwargs: Dict[str, Any] = kwargs
+        self.envelope: Optional[Dict[str, Any]] = None
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[Any]:
+        queue: asyncio.Queue[Any] = asyncio.Queue(self._buffer)
+
+        async def decode(response: aiohttp.ClientResponse) -> Any:
+            parser = JSONArrayParser(self._key)
+            async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                for item in parser.feed(chunk):
+                    await queue.put(item)
+            return parser.close()
+
+        loop = asyncio.get_running_loop()
+        task = loop.create_task(self._http._request(self._route, decoder=decode, **self._kwargs))
+        try:
+            while True:
+                if not queue.empty():
+                    yield queue.get_nowait()
+                    continue
+                if task.done():
+                    break
+                getter = loop.create_task(queue.get())
+                await asyncio.wait((getter, task), return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    yield getter.result()
+                else:
+                    getter.cancel()
+            self.envelope, _ = task.result()
+        finally:
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
 
 
 class EndpointType(enum.Enum):
@@ -108,6 +299,24 @@ class EndpointType(enum.Enum):
     play_valorant = 3
 
 
+# (endpoint type, region, 'METHOD /path/{template}')
+RouteKey = Tuple[Optional[EndpointType], Optional[Region], str]
+
+# characters quote() leaves untouched, most parameters (puuids, match ids) are only these
+_is_safe_parameter = re.compile(r'[A-Za-z0-9_.\-~/]*\Z').match
+
+
+def _quote_parameter(value: Any) -> str:
+    if isinstance(value, str):
+        return value if _is_safe_parameter(value) else _uriquote(value)
+    return str(value)
+
+
+def _compile_template(url: str) -> List[Tuple[str, Optional[str]]]:
+    # 'https://x/{a}/y' -> [('https://x/', 'a'), ('/y', None)]
+    return [(literal, field) for literal, field, _, _ in string.Formatter().parse(url)]
+
+
 # http-client inspired by https://github.com/Rapptz/discord.py/blob/master/discord/http.pyS
 
 
@@ -117,6 +326,11 @@ class Route:
     BASE_SHARD_URL: ClassVar[str] = 'https://shared.{shard}.a.pvp.net'
     BASE_PLAY_VALORANT_URL: ClassVar[str] = 'https://playvalorant.com'
 
+    # (method, endpoint, region, path) -> (compiled url template, rate limit key)
+    _templates: ClassVar[
+        Dict[Tuple[str, EndpointType, Region, str], Tuple[List[Tuple[str, Optional[str]]], RouteKey]]
+    ] = {}
+
     def __init__(
         self,
         method: str,
@@ -131,20 +345,35 @@ class Route:
         self.endpoint = endpoint
         self.parameters = parameters
 
-        url = ''
+        cache_key = (method, endpoint, region, path)
+        try:
+            template, self.key = self._templates[cache_key]
+        except KeyError:
+            template = _compile_template(self._base_url(endpoint, region) + path)
+            self.key = (endpoint, region, f'{method} {path}')
+            self._templates[cache_key] = (template, self.key)
+
+        self.url: str = ''.join([
+            literal if field is None else literal + _quote_parameter(parameters[field]) for literal, field in template
+        ])
+
+    @property
+    def host(self) -> str:
+        """:class:`str`: The host the route is sent to, e.g. ``pd.ap.a.pvp.net``."""
+        # 'https://host/path' -> ['https:', '', 'host', 'path']
+        return self.url.split('/', 3)[2]
+
+    @classmethod
+    def _base_url(cls, endpoint: EndpointType, region: Region) -> str:
         if endpoint == EndpointType.pd:
-            url = self.BASE_PD_URL.format(shard=str(region.shard)) + path
+            return cls.BASE_PD_URL.format(shard=str(region.shard))
         elif endpoint == EndpointType.glz:
-            url = self.BASE_GLZ_URL.format(region=str(region), shard=str(region)) + path
+            return cls.BASE_GLZ_URL.format(region=str(region), shard=str(region))
         elif endpoint == EndpointType.shard:
-            url = self.BASE_SHARD_URL.format(shard=str(region.shard)) + path
+            return cls.BASE_SHARD_URL.format(shard=str(region.shard))
         elif endpoint == EndpointType.play_valorant:
-            url = self.BASE_PLAY_VALORANT_URL + path
-
-        if parameters:
-            url = url.format_map({k: _uriquote(v) if isinstance(v, str) else v for k, v in parameters.items()})
-
-        self.url: str = url
+            return cls.BASE_PLAY_VALORANT_URL
+        return ''
 
     @classmethod
     def from_url(cls, method: str, url: str, **parameters: Any) -> Self:
@@ -152,6 +381,7 @@ class Route:
         self.method = method
         self.url = url
         self.parameters = parameters
+        self.key = (None, None, f'{method} {url}')
         if parameters:
             self.url = self.url.format_map({
                 k: _uriquote(v) if isinstance(v, str) else v for k, v in parameters.items()
@@ -159,8 +389,277 @@ class Route:
         return self
 
 
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _parse_rate_limit_windows(limits: str, counts: str) -> List[Tuple[int, int, float]]:
+    # Riot style headers: 'X-*-Rate-Limit: 20:1,100:120' and 'X-*-Rate-Limit-Count: 1:1,5:120'
+    # returns [(limit, remaining, window_seconds), ...]
+    used: Dict[str, int] = {}
+    for pair in counts.split(','):
+        count, _, window = pair.strip().partition(':')
+        if count.isdigit() and window:
+            used[window] = int(count)
+
+    windows: List[Tuple[int, int, float]] = []
+    for pair in limits.split(','):
+        limit, _, window = pair.strip().partition(':')
+        seconds = _parse_float(window)
+        if not limit.isdigit() or seconds is None:
+            continue
+        windows.append((int(limit), int(limit) - used.get(window, 0), seconds))
+    return windows
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Returns the ``Retry-After`` header in seconds if present."""
+    return _parse_float(headers.get('Retry-After'))
+
+
+class Ratelimit:
+    """Represents the request budget of a single route bucket.
+
+    The budget is learned from the response headers and requests wait in
+    :meth:`acquire` until the bucket has room instead of being sent and failing with a 429.
+
+    Attributes
+    ----------
+    key: Tuple[Optional[:class:`EndpointType`], Optional[:class:`Region`], :class:`str`]
+        The (endpoint type, region, route template) this bucket belongs to.
+    limit: Optional[:class:`int`]
+        The amount of requests allowed per window, ``None`` if unknown.
+    remaining: Optional[:class:`int`]
+        The amount of requests left in the current window, ``None`` if unknown.
+    window: Optional[:class:`float`]
+        The length of a window in seconds, ``None`` if unknown.
+    outgoing: :class:`int`
+        The amount of requests currently in flight.
+    ratelimited: :class:`int`
+        The amount of 429 responses received by this bucket.
+    """
+
+    __slots__ = (
+        'key',
+        'limit',
+        'remaining',
+        'window',
+        'reset_at',
+        'outgoing',
+        'ratelimited',
+        '_lock',
+    )
+
+    def __init__(self, key: RouteKey) -> None:
+        self.key: RouteKey = key
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.window: Optional[float] = None
+        self.reset_at: float = 0.0
+        self.outgoing: int = 0
+        self.ratelimited: int = 0
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def __repr__(self) -> str:
+        attrs = [
+            ('key', self.key),
+            ('limit', self.limit),
+            ('remaining', self.remaining),
+            ('reset_after', round(self.reset_after, 3)),
+            ('outgoing', self.outgoing),
+        ]
+        joined = ' '.join('%s=%r' % t for t in attrs)
+        return f'<{self.__class__.__name__} {joined}>'
+
+    @property
+    def reset_after(self) -> float:
+        """:class:`float`: The amount of seconds until the current window resets."""
+        return max(0.0, self.reset_at - time.monotonic())
+
+    def is_exhausted(self) -> bool:
+        """:class:`bool`: Whether requests to this bucket will have to wait."""
+        return self.remaining is not None and self.remaining <= 0 and self.reset_after > 0
+
+    def _refill(self, now: float) -> None:
+        if self.reset_at and now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = 0.0
+
+    async def acquire(self) -> float:
+        """|coro|
+
+        Waits until the bucket has room for one more request and reserves it.
+
+        Returns
+        -------
+        :class:`float`
+            The amount of seconds spent waiting.
+        """
+        waited = 0.0
+        # the lock keeps waiters in FIFO order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if self.remaining is None or self.remaining > 0 or not self.reset_at:
+                    break
+                delay = self.reset_at - now
+                _log.debug('bucket %s is exhausted, waiting %.2f seconds', self.key, delay)
+                await asyncio.sleep(delay)
+                waited += delay
+
+            if self.remaining is not None:
+                if not self.reset_at and self.window is not None:
+                    # the first request after a reset opens the next window
+                    self.reset_at = time.monotonic() + self.window
+                self.remaining -= 1
+            self.outgoing += 1
+        return waited
+
+    def release(self) -> None:
+        self.outgoing -= 1
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Updates the budget from the rate limit headers of a response."""
+        now = time.monotonic()
+        self._refill(now)
+
+        # (limit, remaining, reset after)
+        candidates: List[Tuple[int, int, float]] = []
+
+        limit = headers.get('X-RateLimit-Limit')
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset_after = _parse_float(headers.get('X-RateLimit-Reset-After'))
+        if limit is not None and remaining is not None and reset_after is not None:
+            if limit.isdigit() and remaining.isdigit():
+                candidates.append((int(limit), int(remaining), reset_after))
+
+        for prefix in ('X-Method-Rate-Limit', 'X-App-Rate-Limit'):
+            limits = headers.get(prefix)
+            counts = headers.get(prefix + '-Count')
+            if limits and counts:
+                candidates.extend(_parse_rate_limit_windows(limits, counts))
+
+        if not candidates:
+            return
+
+        # the most restrictive window wins
+        limit, remaining, reset_after = min(candidates, key=lambda c: (c[1], -c[2]))
+        self.limit = limit
+        self.window = reset_after
+        if self.remaining is None or self.reset_at == 0.0:
+            # a new window started with this response
+            self.remaining = remaining
+            self.reset_at = now + reset_after
+        else:
+            self.remaining = min(self.remaining, remaining)
+
+    def block(self, delay: float) -> None:
+        """Marks the bucket as exhausted for ``delay`` seconds, e.g. after a 429."""
+        self.ratelimited += 1
+        self.remaining = 0
+        self.reset_at = max(self.reset_at, time.monotonic() + delay)
+
+
+class ConnectionPool:
+    """Owns the :class:`aiohttp.ClientSession` shared by the in-game API,
+    Riot auth and valorant-api.com requests.
+
+    The session is created lazily inside the running event loop and recreated if it was closed.
+    It does not store cookies, since many accounts may share it: each :class:`RiotAuth`
+    sends and keeps its own.
+
+    Parameters
+    ----------
+    limit: :class:`int`
+        The total amount of simultaneous connections. ``0`` means unlimited.
+    limit_per_host: :class:`int`
+        The amount of simultaneous connections to the same host. ``0`` means unlimited.
+    keepalive_timeout: :class:`float`
+        The amount of seconds an idle connection is kept open for reuse.
+    ttl_dns_cache: Optional[:class:`int`]
+        The amount of seconds resolved addresses are cached. ``None`` caches forever.
+    timeout: Optional[:class:`aiohttp.ClientTimeout`]
+        The default timeouts of every request. Defaults to aiohttp's timeouts.
+    ssl_context: Optional[:class:`ssl.SSLContext`]
+        The SSL context shared by every connection. Defaults to :func:`ssl.create_default_context`.
+    trace_configs: Sequence[:class:`aiohttp.TraceConfig`]
+        The aiohttp trace configs of the session, see :meth:`Instrumentation.trace_config`.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 0,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: Optional[int] = 300,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        trace_configs: Sequence[aiohttp.TraceConfig] = (),
+    ) -> None:
+        self.limit: int = limit
+        self.limit_per_host: int = limit_per_host
+        self.keepalive_timeout: float = keepalive_timeout
+        self.ttl_dns_cache: Optional[int] = ttl_dns_cache
+        self.timeout: Optional[aiohttp.ClientTimeout] = timeout
+        self._ssl_context: Optional[ssl.SSLContext] = ssl_context
+        self.trace_configs: List[aiohttp.TraceConfig] = list(trace_configs)
+        self._session: aiohttp.ClientSession = MISSING
+
+    def __repr__(self) -> str:
+        return (
+            f'<ConnectionPool limit={self.limit!r} limit_per_host={self.limit_per_host!r} closed={self.is_closed()!r}>'
+        )
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """:class:`aiohttp.ClientSession`: The shared session."""
+        if self._session is MISSING or self._session.closed:
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                use_dns_cache=True,
+                ttl_dns_cache=self.ttl_dns_cache,
+                ssl=self._ssl_context,
+            )
+            # shared by every account, cookies are kept by each RiotAuth and never in the session
+            kwargs: Dict[str, Any] = {'connector': connector, 'cookie_jar': aiohttp.DummyCookieJar()}
+            if self.timeout is not None:
+                kwargs['timeout'] = self.timeout
+            if self.trace_configs:
+                kwargs['trace_configs'] = self.trace_configs
+            self._session = aiohttp.ClientSession(**kwargs)
+        return self._session
+
+    def is_closed(self) -> bool:
+        """:class:`bool`: Whether the shared session is closed or not created yet."""
+        return self._session is MISSING or self._session.closed
+
+    async def close(self) -> None:
+        """|coro|
+
+        Closes the shared session and every pooled connection.
+        """
+        if self._session is not MISSING and not self._session.closed:
+            await self._session.close()
+        self._session = MISSING
+
+
 class HTTPClient:
     RIOT_CLIENT_VERSION: ClassVar[str] = ''
+    # how long before the access token expires it is renewed in the background
+    TOKEN_REFRESH_MARGIN: ClassVar[float] = 300.0
+    # how long to wait before retrying a background renewal that failed
+    TOKEN_REFRESH_RETRY: ClassVar[float] = 60.0
     RIOT_CLIENT_PLATFORM: ClassVar[str] = base64.b64encode(
         json.dumps(
             {
@@ -173,62 +672,257 @@ class HTTPClient:
         ).encode()
     ).decode()
 
-    def __init__(self, loop: asyncio.AbstractEventLoop, *, region: Region, re_authorize: bool) -> None:
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        *,
+        region: Region,
+        re_authorize: bool,
+        max_ratelimit_timeout: Optional[float] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+        response_cache: Optional[ResponseCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
         self.loop: asyncio.AbstractEventLoop = loop
+        self.connection_pool: ConnectionPool = connection_pool or ConnectionPool()
         self._session: aiohttp.ClientSession = MISSING
-        self.riot_auth: RiotAuth = RiotAuth()
+        self.riot_auth: RiotAuth = RiotAuth(connection_pool=self.connection_pool)
         self._puuid: Optional[str] = None
         self.region: Region = region
         self.re_authorize: bool = re_authorize
+        self.max_ratelimit_timeout: Optional[float] = max_ratelimit_timeout
+        self._ratelimits: Dict[RouteKey, Ratelimit] = {}
+        self._auth_headers: Dict[str, str] = {}
+        self._auth_generation: int = 0
+        # (auth generation, client version, headers), rebuilt when either changes
+        self._headers: Optional[Tuple[int, str, Dict[str, str]]] = None
+        # the routes coalesced unless a call passes coalesce=, see DEFAULT_COALESCED_ROUTES
+        self.coalesced_routes: Set[str] = set(DEFAULT_COALESCED_ROUTES)
+        self._in_flight: Dict[Tuple[str, str, str], asyncio.Task[Any]] = {}
+        self._coalesce_stats: Dict[str, int] = {'leaders': 0, 'deduplicated': 0}
+        self.response_cache: Optional[ResponseCache] = response_cache
+        self._revalidations: Dict[str, asyncio.Task[None]] = {}
+        self.instrumentation: Optional[Instrumentation] = instrumentation
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self._refresh_lock: asyncio.Lock = MISSING
+        self._refresh_task: Optional[asyncio.Task[None]] = None
 
     @property
     def puuid(self) -> Optional[str]:
         return self._puuid
 
+    @property
+    def token_expires_at(self) -> float:
+        """:class:`float`: The UNIX time the current access token expires at, ``0`` if unknown."""
+        return float(getattr(self.riot_auth, 'expires_at', 0) or 0)
+
+    @property
+    def ratelimits(self) -> Dict[RouteKey, Ratelimit]:
+        """Dict[Tuple[Optional[:class:`EndpointType`], Optional[:class:`Region`], :class:`str`], :class:`Ratelimit`]:
+        The rate limit buckets learned so far."""
+        return self._ratelimits.copy()
+
+    def get_ratelimit(self, route: Route) -> Ratelimit:
+        """Returns the rate limit bucket of the given route, creating it if needed."""
+        try:
+            return self._ratelimits[route.key]
+        except KeyError:
+            self._ratelimits[route.key] = ratelimit = Ratelimit(route.key)
+            return ratelimit
+
+    @property
+    def coalesce_stats(self) -> Dict[str, int]:
+        """Dict[:class:`str`, :class:`int`]: Counters of the request coalescing.
+
+        ``leaders`` is the amount of requests that were sent, ``deduplicated`` the
+        amount that joined one already in flight instead, and ``in_flight`` the
+        amount of coalesced requests currently waiting on a response.
+        """
+        return {**self._coalesce_stats, 'in_flight': len(self._in_flight)}
+
     def clear(self) -> None:
         if self._session and self._session.closed:
             self._session = MISSING
+        self._ratelimits.clear()
+        self._auth_headers = {}
+        self._headers = None
+
+    async def request(self, route: Route, *, coalesce: Optional[bool] = None, **kwargs: Any) -> Any:
+        if self.response_cache is not None and 'headers' not in kwargs:
+            policy = self.response_cache.get_policy(route)
+            if policy is not None:
+                return await self._cached_request(route, policy, coalesce, kwargs)
 
-    async def request(self, route: Route, **kwargs: Any) -> Any:
+        data, _ = await self._coalesced_request(route, coalesce, kwargs)
+        return data
+
+    async def _cached_request(
+        self,
+        route: Route,
+        policy: CachePolicy,
+        coalesce: Optional[bool],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        cache: ResponseCache = self.response_cache  # type: ignore
+        key = cache.make_key(route, policy, self._puuid, kwargs)
+        entry, fresh = await cache.get(key)
+        if entry is not None:
+            if not fresh and key not in self._revalidations:
+                cache.stats.revalidations += 1
+                task = self._revalidations[key] = self.loop.create_task(self._revalidate(key, route, policy, kwargs))
+                task.add_done_callback(lambda _: self._revalidations.pop(key, None))
+            return entry.data
+
+        data, headers = await self._coalesced_request(route, coalesce, dict(kwargs))
+        await cache.set(key, data, policy, headers)
+        return data
+
+    async def _revalidate(self, key: str, route: Route, policy: CachePolicy, kwargs: Dict[str, Any]) -> None:
+        try:
+            data, headers = await self._coalesced_request(route, None, dict(kwargs))
+            await self.response_cache.set(key, data, policy, headers)  # type: ignore
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # the stale response keeps being served until it is no longer usable
+            _log.warning('could not revalidate %s %s: %s', route.method, route.url, e)
+
+    async def _coalesced_request(
+        self, route: Route, coalesce: Optional[bool], kwargs: Dict[str, Any]
+    ) -> Tuple[Any, Mapping[str, str]]:
+        # identical requests to a coalesced route in flight at the same time share one response
+        if coalesce is None:
+            coalesce = route.key[2] in self.coalesced_routes
+        if not coalesce or 'headers' in kwargs:
+            return await self._request(route, **kwargs)
+
+        key = (route.method, route.url, utils._to_json(kwargs) if kwargs else '')
+        task = self._in_flight.get(key)
+        if task is None:
+            self._coalesce_stats['leaders'] += 1
+            task = self._in_flight[key] = self.loop.create_task(self._request(route, **kwargs))
+            task.add_done_callback(functools.partial(self._coalesced_done, key))
+        else:
+            self._coalesce_stats['deduplicated'] += 1
+            _log.debug('%s %s joined an identical request in flight', route.method, route.url)
+
+        # the response is shared, a caller that gives up must not cancel it for the others
+        return await asyncio.shield(task)
+
+    def _coalesced_done(self, key: Tuple[str, str, str], task: asyncio.Task[Any]) -> None:
+        self._in_flight.pop(key, None)
+        if not task.cancelled():
+            # every caller may have given up, mark the exception as retrieved
+            task.exception()
+
+    async def _request(
+        self,
+        route: Route,
+        *,
+        decoder: Optional[Callable[[aiohttp.ClientResponse], Awaitable[Any]]] = None,
+        **kwargs: Any,
+    ) -> Tuple[Any, Mapping[str, str]]:
         method = route.method
         url = route.url
+        ratelimit = self.get_ratelimit(route)
 
-        headers = kwargs.pop('headers', await self.__build_headers())
+        headers = kwargs.pop('headers', None) or self.__build_headers()
 
         if 'json' in kwargs:
             headers['Content-Type'] = 'application/json'
             kwargs['data'] = utils._to_json(kwargs.pop('json'))
 
         kwargs['headers'] = headers
+        generation = self._auth_generation
 
         response: Optional[aiohttp.ClientResponse] = None
         data: Optional[Union[Dict[str, Any], str]] = None
 
         if self._session is MISSING:
-            self._session = aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(limit=0),
-                # raise_for_status=True
-            )
-
-        for tries in range(5):
+            self._session = self.connection_pool.session
+
+        instrumentation = self.instrumentation
+        trace: Optional[RequestTrace] = None
+
+        policy = self.retry_policy
+        breaker = policy.get_circuit_breaker(route.host)
+        if policy.budget is not None:
+            policy.budget.deposit()
+        # the delay before the current attempt and the sleep still owed before sending it
+        delay = 0.0
+        pending = 0.0
+
+        for tries in range(policy.max_attempts):
+            if pending:
+                # slept with the connection released and the rate limit slot free
+                await asyncio.sleep(pending)
+                pending = 0.0
+            can_retry = tries + 1 < policy.max_attempts
+            # fails fast with CircuitOpen while the host is down, before queueing for the rate limit
+            probe = breaker is not None and breaker.acquire()
+            if instrumentation is not None:
+                trace = kwargs['trace_request_ctx'] = RequestTrace(route, tries)
+            try:
+                waited = await ratelimit.acquire()
+            except BaseException:
+                if breaker is not None:
+                    breaker.release(probe)
+                raise
+            if trace is not None:
+                trace._mark_sent(waited)
+            error: Optional[BaseException] = None
+            streaming = False
+            # the breaker counts each attempt once, a success only once its body was read
+            recorded = False
             try:
                 async with self._session.request(method, url, **kwargs) as response:
+                    if trace is not None:
+                        trace._mark_headers(response.status)
                     _log.debug('%s %s with %s has returned %s', method, url, kwargs.get('data'), response.status)
-                    data = await json_or_text(response)
+                    ratelimit.update(response.headers)
+                    if breaker is not None and response.status in policy.statuses:
+                        breaker.record_failure()
+                        recorded = True
+
+                    if decoder is not None and 300 > response.status >= 200:
+                        # items already handed out cannot be taken back, a broken stream is not retried
+                        streaming = True
+                        decoded = await decoder(response)
+                        if breaker is not None:
+                            breaker.record_success()
+                            recorded = True
+                        if trace is not None:
+                            # streamed, the body is decoded while it is read
+                            trace._mark_read()
+                        return decoded, response.headers
+
+                    body = await response.read()
+                    if breaker is not None and not recorded:
+                        breaker.record_success()
+                        recorded = True
+                    if trace is not None:
+                        trace._mark_read()
+                    data = _decode_body(body, response.headers)
+                    if trace is not None:
+                        trace._mark_decoded()
+
                     if 300 > response.status >= 200:
                         _log.debug('%s %s has received %s', method, url, data)
-                        return data
+                        return data, response.headers
 
                     if response.status == 400:
-                        if tries < 4 and self.re_authorize:
+                        if can_retry and self.re_authorize:
                             if isinstance(data, dict) and data.get('errorCode') == 'BAD_CLAIMS':
-                                try:
-                                    await self.riot_auth.reauthorize()
-                                except RiotAuthenticationError:
-                                    ...
-                                else:
-                                    if 'headers' in kwargs:
-                                        kwargs['headers'].update(await self.__build_headers())
+                                # the token was rejected, renew it unless another request already did
+                                renewed = await self.refresh_auth(generation=generation)
+                                if trace is not None:
+                                    self._instrument('on_reauth', trace, renewed)
+                                if renewed:
+                                    generation = self._auth_generation
+                                    kwargs['headers'].update(self._auth_headers)
+                                    if trace is not None:
+                                        self._instrument('on_retry', trace, 'reauth', 0.0)
                                     continue
                         raise BadRequest(response, data)
 
@@ -238,11 +932,44 @@ class HTTPClient:
                             # Banned by Cloudflare more than likely.
                             raise HTTPException(response, data)
 
-                        raise RateLimited(response, data)
-
-                    if response.status in {500, 502, 504, 524}:
-                        await asyncio.sleep(1 + tries * 2)
-                        continue
+                        retry_after = parse_retry_after(response.headers)
+                        if retry_after is None:
+                            retry_after = policy.backoff(delay)
+                        # the next acquire() waits for the bucket to reset
+                        ratelimit.block(retry_after)
+                        if trace is not None:
+                            self._instrument('on_ratelimit', trace, retry_after)
+
+                        # the request was refused, not processed, so it is retried whatever its method
+                        max_timeout = self.max_ratelimit_timeout
+                        if can_retry and (max_timeout is None or retry_after <= max_timeout):
+                            _log.warning(
+                                'We are being rate limited. %s %s responded with 429. Retrying in %.2f seconds.',
+                                method,
+                                url,
+                                retry_after,
+                            )
+                            delay = retry_after
+                            if trace is not None:
+                                self._instrument('on_retry', trace, 'ratelimited', retry_after)
+                            continue
+
+                        raise RateLimited(response, data, retry_after)
+
+                    if policy.is_retryable_status(route, response.status):
+                        next_delay = policy.next_delay(route, tries, delay)
+                        if next_delay is not None:
+                            _log.debug(
+                                '%s %s responded with %s. Retrying in %.2f seconds.',
+                                method,
+                                url,
+                                response.status,
+                                next_delay,
+                            )
+                            delay = pending = next_delay
+                            if trace is not None:
+                                self._instrument('on_retry', trace, 'server_error', next_delay)
+                            continue
 
                     if response.status == 403:
                         raise Forbidden(response, data)
@@ -253,12 +980,29 @@ class HTTPClient:
                     else:
                         raise HTTPException(response, data)
 
-            except OSError as e:
-                # Connection reset by peer
-                if tries < 4 and e.errno in (54, 10054):
-                    await asyncio.sleep(1 + tries * 2)
-                    continue
+            except (OSError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+                if breaker is not None and not recorded:
+                    breaker.record_failure()
+                if not streaming and policy.is_retryable_error(route, e):
+                    next_delay = policy.next_delay(route, tries, delay)
+                    if next_delay is not None:
+                        _log.debug('%s %s failed with %r. Retrying in %.2f seconds.', method, url, e, next_delay)
+                        delay = pending = next_delay
+                        if trace is not None:
+                            self._instrument('on_retry', trace, 'connection_error', next_delay)
+                        continue
+                raise
+            except BaseException as e:
+                error = e
                 raise
+            finally:
+                ratelimit.release()
+                if breaker is not None:
+                    breaker.release(probe)
+                if trace is not None:
+                    trace._finish(error)
+                    self._instrument('on_request', trace)
 
         if response is not None:
             # We've run out of retries, raise.
@@ -269,14 +1013,108 @@ class HTTPClient:
 
         raise RuntimeError('Unreachable code in HTTP handling')
 
+    def _instrument(self, event: str, *args: Any) -> None:
+        try:
+            getattr(self.instrumentation, event)(*args)
+        except Exception:
+            _log.exception('instrumentation hook %s failed', event)
+
     async def close(self) -> None:
-        if self._session:
-            await self._session.close()
+        self.stop_token_refresh()
+        for task in self._revalidations.values():
+            task.cancel()
+        self._revalidations.clear()
+        # the session belongs to the connection pool, which is closed by its owner
+        self._session = MISSING
+
+    # token refresh
+
+    def _set_riot_auth(self, riot_auth: RiotAuth) -> None:
+        riot_auth.connection_pool = self.connection_pool
+        self.riot_auth = riot_auth
+        self._puuid = riot_auth.puuid
+        self._update_auth_headers()
+
+    def _update_auth_headers(self) -> None:
+        # swapped as a whole, a request either sends the old token pair or the new one
+        self._auth_headers = {
+            'Authorization': 'Bearer %s' % self.riot_auth.access_token,
+            'X-Riot-Entitlements-JWT': self.riot_auth.entitlements_token,
+        }
+        self._auth_generation += 1
+
+    async def refresh_auth(self, *, generation: Optional[int] = None) -> bool:
+        """Renews the access and entitlements tokens with the stored cookies.
+
+        Concurrent callers share one renewal. A caller that passes the
+        ``generation`` it sent its request with does not renew again if the
+        tokens were already renewed since.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the caller now holds newer tokens than ``generation``.
+        """
+        if self._refresh_lock is MISSING:
+            self._refresh_lock = asyncio.Lock()
+
+        if generation is None:
+            generation = self._auth_generation
+
+        async with self._refresh_lock:
+            if self._auth_generation != generation:
+                return True
+
+            try:
+                renewed = await self.riot_auth.reauthorize()
+            except RiotAuthenticationError as e:
+                _log.warning('could not renew the access token: %s', e)
+                return False
+
+            if not renewed:
+                _log.warning('could not renew the access token, the auth cookies were rejected')
+                return False
+
+            self._update_auth_headers()
+            _log.debug('access token renewed, expires at %s', self.token_expires_at)
+            return True
+
+    def start_token_refresh(self) -> None:
+        """Starts renewing the tokens in the background shortly before they expire."""
+        if not self.re_authorize:
+            return
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = self.loop.create_task(self._token_refresh_loop(), name='valorantx: token_refresh')
+
+    def stop_token_refresh(self) -> None:
+        """Stops the background token renewal."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    async def _token_refresh_loop(self) -> None:
+        while True:
+            expires_at = self.token_expires_at
+            if not expires_at:
+                _log.debug('token expiry unknown, background renewal stopped')
+                return
+
+            delay = max(expires_at - time.time() - self.TOKEN_REFRESH_MARGIN, 0.0)
+            await asyncio.sleep(delay)
+            try:
+                renewed = await self.refresh_auth()
+            except Exception:
+                _log.exception('background token renewal failed')
+                renewed = False
+
+            if not renewed:
+                await asyncio.sleep(self.TOKEN_REFRESH_RETRY)
 
     async def static_login(self, username: str, password: str) -> user.PartialUser:
         """Riot Auth login."""
         if self._session is MISSING:
-            self._session = aiohttp.ClientSession()
+            self._session = self.connection_pool.session
 
         await self.riot_auth.authorize(username.strip(), password.strip())
 
@@ -289,8 +1127,8 @@ class HTTPClient:
             else:
                 self.region = try_enum(Region, region)
 
-        self._puuid = self.riot_auth.puuid
-        await self.__build_headers()
+        self._set_riot_auth(self.riot_auth)
+        self.start_token_refresh()
 
         data = {
             'puuid': self.riot_auth.puuid,
@@ -302,12 +1140,11 @@ class HTTPClient:
 
     async def cookie_login(self, data: Dict[str, Any]) -> user.PartialUser:
         if self._session is MISSING:
-            self._session = aiohttp.ClientSession()
+            self._session = self.connection_pool.session
 
-        self.riot_auth.from_data(data)
-        self._puuid = self.riot_auth.puuid
+        self._set_riot_auth(RiotAuth.from_data(data))
         self.region = try_enum(Region, self.riot_auth.region)
-        await self.__build_headers()
+        self.start_token_refresh()
         data = {
             'puuid': self.riot_auth.puuid,
             'game_name': self.riot_auth.game_name,
@@ -319,15 +1156,14 @@ class HTTPClient:
     async def token_login(self, data: Dict[str, Any]) -> RiotAuth:
         """Riot Auth login."""
 
-        self.riot_auth.from_data(data)
-        self._puuid = self.riot_auth.puuid
-        await self.__build_headers()
+        self._set_riot_auth(RiotAuth.from_data(data))
+        self.start_token_refresh()
         if self._session is MISSING:
-            self._session = aiohttp.ClientSession()
+            self._session = self.connection_pool.session
         return self.riot_auth
 
     async def read_from_url(self, url: str) -> bytes:
-        async with self._session.get(url) as resp:
+        async with self.connection_pool.session.get(url) as resp:
             if resp.status == 200:
                 return await resp.read()
             elif resp.status == 404:
@@ -338,7 +1174,7 @@ class HTTPClient:
                 raise HTTPException(resp, 'failed to get asset')
 
     async def text_from_url(self, url: str) -> str:
-        async with self._session.get(url) as resp:
+        async with self.connection_pool.session.get(url) as resp:
             if resp.status == 200:
                 return await resp.text()
             elif resp.status == 404:
@@ -525,6 +1361,39 @@ class HTTPClient:
 
         return self.request(r, params=params)
 
+    def stream_mmr_leaderboard(
+        self,
+        season_id: Optional[str],
+        start_index: int = 0,
+        size: int = 510,
+        query: Optional[str] = None,
+        region: Optional[Region] = None,
+    ) -> StreamedArray:
+        """
+        MMR_FetchLeaderboard, streamed
+        Yields the players of a leaderboard page as they are received instead of
+        decoding the whole page at once. The rest of the page, such as
+        ``totalPlayers``, is in :attr:`StreamedArray.envelope` afterwards.
+        """
+        if season_id is None:
+            raise ValueError('Season cannot be empty')
+
+        region = region or self.region
+
+        r = Route(
+            'GET',
+            '/mmr/v1/leaderboards/affinity/{shard}/queue/competitive/season/{season}',
+            region,
+            EndpointType.pd,
+            shard=region.shard,
+            season=season_id,
+        )
+        params: Dict[str, Any] = {'startIndex': start_index, 'size': size}
+        if query is not None:
+            params['query'] = query
+
+        return StreamedArray(self, r, 'Players', params=params)
+
     def get_restrictions_penalties(self) -> Response[Mapping[str, Any]]:
         """
         Restrictions_FetchPlayerRestrictionsV3
@@ -1009,7 +1878,7 @@ class HTTPClient:
         QueueMatchmaking_FetchQueue
         Get information about the current queue
         """
-        r = Route('GET', '/matchmaking/v1/queues/configs ', self.region, EndpointType.glz)
+        r = Route('GET', '/matchmaking/v1/queues/configs', self.region, EndpointType.glz)
         return self.request(r)
 
     # favorite endpoints
@@ -1536,15 +2405,20 @@ class HTTPClient:
         """if puuid passed into method is None make it current user's puuid"""
         return self._puuid if puuid is None else puuid  # type: ignore
 
-    async def __build_headers(self) -> Dict[str, Any]:
+    def __build_headers(self) -> Dict[str, Any]:
         # if self.riot_client_version is None:
         # self.riot_client_version = await self._get_current_version()
-        return {
-            'Authorization': 'Bearer %s' % self.riot_auth.access_token,
-            'X-Riot-Entitlements-JWT': self.riot_auth.entitlements_token,
-            'X-Riot-ClientPlatform': HTTPClient.RIOT_CLIENT_PLATFORM,
-            'X-Riot-ClientVersion': HTTPClient.RIOT_CLIENT_VERSION,
-        }
+        version = HTTPClient.RIOT_CLIENT_VERSION
+        cached = self._headers
+        if cached is None or cached[0] != self._auth_generation or cached[1] != version:
+            headers = {
+                **self._auth_headers,
+                'X-Riot-ClientPlatform': HTTPClient.RIOT_CLIENT_PLATFORM,
+                'X-Riot-ClientVersion': version,
+            }
+            self._headers = cached = (self._auth_generation, version, headers)
+        # callers add per-request headers, never hand out the cached dict
+        return cached[2].copy()
 
     async def _get_current_version(self) -> str:
         ...
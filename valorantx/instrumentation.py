@@ -0,0 +1,475 @@
+# Copyright (c) 2023-present STACiA
+# Licensed under the MIT
+
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import aiohttp
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+    from .http import Route
+
+# fmt: off
+__all__ = (
+    'DEFAULT_BUCKETS',
+    'Instrumentation',
+    'MetricsCollector',
+    'RequestTrace',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+
+# the default buckets of the Prometheus client libraries, in seconds
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RequestTrace:
+    """The timings of one attempt of a request made by :class:`HTTPClient`.
+
+    A request that is retried produces one trace per attempt. Every duration is
+    in seconds and ``None`` when the phase did not happen, e.g. ``connect`` when
+    a pooled connection was reused or ``decode`` when the attempt failed before
+    the body was read.
+
+    Attributes
+    ----------
+    method: :class:`str`
+        The HTTP method.
+    route: :class:`str`
+        The route template, e.g. ``GET /store/v1/wallet/{puuid}``.
+    region: :class:`str`
+        The region of the route, empty for routes without one.
+    url: :class:`str`
+        The requested URL.
+    attempt: :class:`int`
+        The attempt number, starting at ``0``.
+    status: Optional[:class:`int`]
+        The response status, ``None`` if no response was received.
+    error: Optional[:class:`str`]
+        The name of the exception the attempt failed with, if any.
+    queue_wait: :class:`float`
+        The time spent waiting for room in the route's rate limit bucket.
+    pool_wait: Optional[:class:`float`]
+        The time spent waiting for a free connection of the connection pool.
+    connect: Optional[:class:`float`]
+        The time spent opening a new connection, DNS and TLS included.
+    ttfb: Optional[:class:`float`]
+        The time from sending the request until the response headers arrived,
+        ``pool_wait`` and ``connect`` included.
+    body_read: Optional[:class:`float`]
+        The time spent reading the response body.
+    decode: Optional[:class:`float`]
+        The time spent decoding the response body.
+    total: :class:`float`
+        The time of the whole attempt, ``queue_wait`` included.
+    """
+
+    __slots__ = (
+        'method',
+        'route',
+        'region',
+        'url',
+        'attempt',
+        'status',
+        'error',
+        'queue_wait',
+        'pool_wait',
+        'connect',
+        'ttfb',
+        'body_read',
+        'decode',
+        'total',
+        '_started',
+        '_sent',
+        '_received',
+        '_read',
+        '_pool_started',
+        '_connect_started',
+    )
+
+    def __init__(self, route: Route, attempt: int) -> None:
+        _, region, template = route.key
+        self.method: str = route.method
+        self.route: str = template
+        self.region: str = '' if region is None else str(region)
+        self.url: str = route.url
+        self.attempt: int = attempt
+        self.status: Optional[int] = None
+        self.error: Optional[str] = None
+        self.queue_wait: float = 0.0
+        self.pool_wait: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.body_read: Optional[float] = None
+        self.decode: Optional[float] = None
+        self.total: float = 0.0
+        self._started: float = time.perf_counter()
+        self._sent: float = self._started
+        self._received: float = 0.0
+        self._read: float = 0.0
+        self._pool_started: float = 0.0
+        self._connect_started: float = 0.0
+
+    def __repr__(self) -> str:
+        attrs = [
+            ('route', self.route),
+            ('region', self.region),
+            ('attempt', self.attempt),
+            ('status', self.status),
+            ('total', round(self.total, 6)),
+        ]
+        joined = ' '.join('%s=%r' % t for t in attrs)
+        return f'<{self.__class__.__name__} {joined}>'
+
+    def phases(self) -> Dict[str, float]:
+        """Dict[:class:`str`, :class:`float`]: The durations of the phases that happened, by name."""
+        phases = {'queue': self.queue_wait, 'total': self.total}
+        for name, value in (
+            ('pool', self.pool_wait),
+            ('connect', self.connect),
+            ('ttfb', self.ttfb),
+            ('body', self.body_read),
+            ('decode', self.decode),
+        ):
+            if value is not None:
+                phases[name] = value
+        return phases
+
+    # called by HTTPClient
+
+    def _mark_sent(self, queue_wait: float) -> None:
+        self.queue_wait = queue_wait
+        self._sent = time.perf_counter()
+
+    def _mark_headers(self, status: int) -> None:
+        self._received = time.perf_counter()
+        self.status = status
+        self.ttfb = self._received - self._sent
+
+    def _mark_read(self) -> None:
+        self._read = time.perf_counter()
+        self.body_read = self._read - self._received
+
+    def _mark_decoded(self) -> None:
+        self.decode = time.perf_counter() - self._read
+
+    def _finish(self, error: Optional[BaseException]) -> None:
+        if error is not None:
+            self.error = type(error).__name__
+        self.total = time.perf_counter() - self._started
+
+
+async def _on_connection_queued_start(
+    session: aiohttp.ClientSession, ctx: SimpleNamespace, params: aiohttp.TraceConnectionQueuedStartParams
+) -> None:
+    trace = ctx.trace_request_ctx
+    if isinstance(trace, RequestTrace):
+        trace._pool_started = time.perf_counter()
+
+
+async def _on_connection_queued_end(
+    session: aiohttp.ClientSession, ctx: SimpleNamespace, params: aiohttp.TraceConnectionQueuedEndParams
+) -> None:
+    trace = ctx.trace_request_ctx
+    if isinstance(trace, RequestTrace) and trace._pool_started:
+        trace.pool_wait = time.perf_counter() - trace._pool_started
+
+
+async def _on_connection_create_start(
+    session: aiohttp.ClientSession, ctx: SimpleNamespace, params: aiohttp.TraceConnectionCreateStartParams
+) -> None:
+    trace = ctx.trace_request_ctx
+    if isinstance(trace, RequestTrace):
+        trace._connect_started = time.perf_counter()
+
+
+async def _on_connection_create_end(
+    session: aiohttp.ClientSession, ctx: SimpleNamespace, params: aiohttp.TraceConnectionCreateEndParams
+) -> None:
+    trace = ctx.trace_request_ctx
+    if isinstance(trace, RequestTrace) and trace._connect_started:
+        trace.connect = time.perf_counter() - trace._connect_started
+
+
+class Instrumentation:
+    """The hooks :class:`HTTPClient` calls while it makes requests.
+
+    Every hook does nothing by default, subclass this and override the ones
+    you need, or use :class:`MetricsCollector`. Hooks are called synchronously
+    from the request and should return quickly. An exception raised by a hook
+    is logged and otherwise ignored.
+
+    ``pool_wait`` and ``connect`` are only measured when the connection pool's
+    session carries the :meth:`trace_config` of an instrumentation.
+    :class:`Client` arranges that for the connection pool it creates, a
+    connection pool passed in needs it explicitly:
+
+    .. code-block:: python3
+
+        metrics = valorantx.MetricsCollector()
+        pool = ConnectionPool(trace_configs=[metrics.trace_config()])
+        client = valorantx.Client(connection_pool=pool, instrumentation=metrics)
+    """
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Returns an :class:`aiohttp.TraceConfig` that measures the connection pool wait and the connect time.
+
+        Returns
+        -------
+        :class:`aiohttp.TraceConfig`
+            The trace config to give to the :class:`ConnectionPool`.
+        """
+        config = aiohttp.TraceConfig()
+        config.on_connection_queued_start.append(_on_connection_queued_start)
+        config.on_connection_queued_end.append(_on_connection_queued_end)
+        config.on_connection_create_start.append(_on_connection_create_start)
+        config.on_connection_create_end.append(_on_connection_create_end)
+        return config
+
+    def on_request(self, trace: RequestTrace) -> None:
+        """Called when an attempt of a request finished, successful or not.
+
+        Parameters
+        ----------
+        trace: :class:`RequestTrace`
+            The timings of the attempt.
+        """
+        pass
+
+    def on_retry(self, trace: RequestTrace, reason: str, delay: float) -> None:
+        """Called when an attempt failed and the request is going to be retried.
+
+        Parameters
+        ----------
+        trace: :class:`RequestTrace`
+            The attempt that failed.
+        reason: :class:`str`
+            Why the request is retried: ``server_error``, ``connection_error``, ``ratelimited`` or ``reauth``.
+        delay: :class:`float`
+            The seconds until the next attempt. Rate limited retries wait
+            for the route's rate limit bucket, the others sleep.
+        """
+        pass
+
+    def on_reauth(self, trace: RequestTrace, renewed: bool) -> None:
+        """Called when the server rejected the access token and a renewal was attempted.
+
+        Parameters
+        ----------
+        trace: :class:`RequestTrace`
+            The attempt the token was rejected in.
+        renewed: :class:`bool`
+            Whether newer tokens are available for the next attempt.
+        """
+        pass
+
+    def on_ratelimit(self, trace: RequestTrace, retry_after: float) -> None:
+        """Called when a request was rate limited.
+
+        Parameters
+        ----------
+        trace: :class:`RequestTrace`
+            The attempt that received the 429.
+        retry_after: :class:`float`
+            The seconds the route's rate limit bucket is blocked for.
+        """
+        pass
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    labels = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    if extra:
+        labels = f'{labels},{extra}' if labels else extra
+    return '{' + labels + '}' if labels else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class _Histogram:
+    __slots__ = ('counts', 'sum', 'count')
+
+    def __init__(self, size: int) -> None:
+        # one count per bucket and one for +Inf, not cumulative
+        self.counts: List[int] = [0] * (size + 1)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+
+class MetricsCollector(Instrumentation):
+    """An :class:`Instrumentation` that aggregates the requests into histograms and counters.
+
+    Every metric is labelled with the route template and the region, so the
+    amount of series is bounded by the amount of routes in use, not by the
+    amount of players or matches.
+
+    :meth:`to_prometheus` exports them in the Prometheus text format:
+
+    - ``valorantx_http_request_duration_seconds`` histogram, labelled by
+      ``phase``: ``queue``, ``pool``, ``connect``, ``ttfb``, ``body``,
+      ``decode`` and ``total``, see :class:`RequestTrace`.
+    - ``valorantx_http_requests_total`` counter, labelled by ``status``,
+      the response status or ``error`` when no response was received.
+    - ``valorantx_http_retries_total`` counter, labelled by ``reason``.
+    - ``valorantx_http_reauth_total`` counter, labelled by ``result``.
+    - ``valorantx_http_ratelimited_total`` counter.
+    - ``valorantx_http_ratelimit_sleep_seconds_total`` counter.
+
+    Parameters
+    ----------
+    buckets: Iterable[:class:`float`]
+        The upper bounds of the histogram buckets, in seconds.
+    namespace: :class:`str`
+        The prefix of every metric name.
+    """
+
+    CONTENT_TYPE: ClassVar[str] = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def __init__(self, *, buckets: Iterable[float] = DEFAULT_BUCKETS, namespace: str = 'valorantx') -> None:
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.namespace: str = namespace
+        # clients on other threads may share a collector
+        self._lock: threading.Lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str, str], _Histogram] = {}
+        self._requests: Dict[Tuple[str, str, str], int] = {}
+        self._retries: Dict[Tuple[str, str, str], int] = {}
+        self._reauths: Dict[Tuple[str, str, str], int] = {}
+        self._ratelimited: Dict[Tuple[str, str], int] = {}
+        self._ratelimit_sleep: Dict[Tuple[str, str], float] = {}
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} routes={len({key[:2] for key in self._requests})}>'
+
+    def _observe(self, key: Tuple[str, str, str], value: float) -> None:
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = _Histogram(len(self.buckets))
+        histogram.counts[bisect.bisect_left(self.buckets, value)] += 1
+        histogram.sum += value
+        histogram.count += 1
+
+    def on_request(self, trace: RequestTrace) -> None:
+        status = 'error' if trace.status is None else str(trace.status)
+        with self._lock:
+            for phase, value in trace.phases().items():
+                self._observe((trace.route, trace.region, phase), value)
+            key = (trace.route, trace.region, status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+
+    def on_retry(self, trace: RequestTrace, reason: str, delay: float) -> None:
+        key = (trace.route, trace.region, reason)
+        with self._lock:
+            self._retries[key] = self._retries.get(key, 0) + 1
+
+    def on_reauth(self, trace: RequestTrace, renewed: bool) -> None:
+        key = (trace.route, trace.region, 'renewed' if renewed else 'failed')
+        with self._lock:
+            self._reauths[key] = self._reauths.get(key, 0) + 1
+
+    def on_ratelimit(self, trace: RequestTrace, retry_after: float) -> None:
+        key = (trace.route, trace.region)
+        with self._lock:
+            self._ratelimited[key] = self._ratelimited.get(key, 0) + 1
+            self._ratelimit_sleep[key] = self._ratelimit_sleep.get(key, 0.0) + retry_after
+
+    def clear(self) -> None:
+        """Resets every metric."""
+        with self._lock:
+            self._histograms.clear()
+            self._requests.clear()
+            self._retries.clear()
+            self._reauths.clear()
+            self._ratelimited.clear()
+            self._ratelimit_sleep.clear()
+
+    def slowest_routes(self, limit: int = 10, *, phase: str = 'total') -> List[Tuple[str, str, float]]:
+        """Returns the routes with the highest mean duration of a phase.
+
+        Parameters
+        ----------
+        limit: :class:`int`
+            The amount of routes to return.
+        phase: :class:`str`
+            The phase to rank by, see :class:`RequestTrace`.
+
+        Returns
+        -------
+        List[Tuple[:class:`str`, :class:`str`, :class:`float`]]
+            The route template, the region and the mean duration in seconds, slowest first.
+        """
+        with self._lock:
+            means = [
+                (route, region, histogram.sum / histogram.count)
+                for (route, region, name), histogram in self._histograms.items()
+                if name == phase and histogram.count
+            ]
+        means.sort(key=lambda item: item[2], reverse=True)
+        return means[:limit]
+
+    def to_prometheus(self) -> str:
+        """Exports every metric in the Prometheus text exposition format.
+
+        Serve it with the :attr:`CONTENT_TYPE` content type.
+
+        Returns
+        -------
+        :class:`str`
+            The metrics.
+        """
+        ns = self.namespace
+        lines: List[str] = []
+
+        def counter(name: str, help: str, labels: Sequence[str], values: Dict[Any, Any]) -> None:
+            lines.append(f'# HELP {ns}_{name} {help}')
+            lines.append(f'# TYPE {ns}_{name} counter')
+            for key, value in sorted(values.items()):
+                lines.append(f'{ns}_{name}{_format_labels(labels, key)} {_format_value(value)}')
+
+        with self._lock:
+            name = f'{ns}_http_request_duration_seconds'
+            lines.append(f'# HELP {name} Duration of the phases of the HTTP requests.')
+            lines.append(f'# TYPE {name} histogram')
+            labels = ('route', 'region', 'phase')
+            for key, histogram in sorted(self._histograms.items()):
+                cumulative = 0
+                for bound, count in zip((*self.buckets, float('inf')), histogram.counts):
+                    cumulative += count
+                    le = 'le="%s"' % _format_value(bound)
+                    lines.append(f'{name}_bucket{_format_labels(labels, key, le)} {cumulative}')
+                lines.append(f'{name}_sum{_format_labels(labels, key)} {_format_value(histogram.sum)}')
+                lines.append(f'{name}_count{_format_labels(labels, key)} {histogram.count}')
+
+            counter('http_requests_total', 'HTTP request attempts.', ('route', 'region', 'status'), self._requests)
+            counter('http_retries_total', 'HTTP requests retried.', ('route', 'region', 'reason'), self._retries)
+            counter(
+                'http_reauth_total',
+                'Access token renewals after the server rejected it.',
+                ('route', 'region', 'result'),
+                self._reauths,
+            )
+            counter('http_ratelimited_total', 'HTTP responses with status 429.', ('route', 'region'), self._ratelimited)
+            counter(
+                'http_ratelimit_sleep_seconds_total',
+                'Seconds routes were blocked by rate limits.',
+                ('route', 'region'),
+                self._ratelimit_sleep,
+            )
+
+        return '\n'.join(lines) + '\n'
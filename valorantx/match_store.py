@@ -0,0 +1,351 @@
+# Copyright (c) 2023-present STACiA
+# Licensed under the MIT
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import threading
+import zlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, TypeVar, Union
+
+from . import utils
+
+if TYPE_CHECKING:
+    from .types.match import MatchDetails as MatchDetailsPayload
+
+    T = TypeVar('T')
+
+# fmt: off
+__all__ = (
+    'MatchStore',
+    'MatchStoreBackend',
+    'MatchStoreStats',
+    'SQLiteMatchStoreBackend',
+)
+# fmt: on
+
+
+class MatchStoreStats:
+    """Represents the hit/miss counters of a :class:`MatchStore`.
+
+    Attributes
+    ----------
+    memory_hits: :class:`int`
+        The amount of lookups answered by the in-memory tier.
+    disk_hits: :class:`int`
+        The amount of lookups answered by the backend.
+    misses: :class:`int`
+        The amount of lookups that were not stored at all.
+    writes: :class:`int`
+        The amount of payloads written to the store.
+    evictions: :class:`int`
+        The amount of payloads dropped from the in-memory tier.
+    """
+
+    __slots__ = ('memory_hits', 'disk_hits', 'misses', 'writes', 'evictions')
+
+    def __init__(self) -> None:
+        self.memory_hits: int = 0
+        self.disk_hits: int = 0
+        self.misses: int = 0
+        self.writes: int = 0
+        self.evictions: int = 0
+
+    def __repr__(self) -> str:
+        attrs = [(attr, getattr(self, attr)) for attr in self.__slots__]
+        joined = ' '.join('%s=%r' % t for t in attrs)
+        return f'<{self.__class__.__name__} {joined}>'
+
+    @property
+    def hits(self) -> int:
+        """:class:`int`: The amount of lookups answered by any tier."""
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def lookups(self) -> int:
+        """:class:`int`: The total amount of lookups."""
+        return self.hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        """:class:`float`: The fraction of lookups that were a hit."""
+        lookups = self.lookups
+        return self.hits / lookups if lookups else 0.0
+
+    def reset(self) -> None:
+        """Resets all counters to zero."""
+        for attr in self.__slots__:
+            setattr(self, attr, 0)
+
+    def to_dict(self) -> Dict[str, Union[int, float]]:
+        """Returns the counters as a :class:`dict`."""
+        payload: Dict[str, Union[int, float]] = {attr: getattr(self, attr) for attr in self.__slots__}
+        payload['hits'] = self.hits
+        payload['hit_ratio'] = self.hit_ratio
+        return payload
+
+
+class MatchStoreBackend:
+    """The base class of a persistent tier for :class:`MatchStore`.
+
+    A backend only deals with opaque compressed blobs keyed by match ID.
+    Subclass it to keep match details somewhere other than SQLite.
+    """
+
+    async def get(self, match_id: str) -> Optional[bytes]:
+        """|coro|
+
+        Gets the stored blob for the given match.
+
+        Parameters
+        ----------
+        match_id: :class:`str`
+            The match ID to look up.
+
+        Returns
+        -------
+        Optional[:class:`bytes`]
+            The stored blob, or ``None`` if the match is not stored.
+        """
+        raise NotImplementedError
+
+    async def set(self, match_id: str, blob: bytes) -> None:
+        """|coro|
+
+        Stores the blob for the given match.
+
+        Parameters
+        ----------
+        match_id: :class:`str`
+            The match ID to store the blob under.
+        blob: :class:`bytes`
+            The compressed payload.
+        """
+        raise NotImplementedError
+
+    async def delete(self, match_id: str) -> None:
+        """|coro|
+
+        Deletes the given match from the backend.
+
+        Parameters
+        ----------
+        match_id: :class:`str`
+            The match ID to delete.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """|coro|
+
+        Releases the resources held by the backend.
+        """
+        pass
+
+
+class SQLiteMatchStoreBackend(MatchStoreBackend):
+    """A :class:`MatchStoreBackend` that keeps match details in a local SQLite file.
+
+    Queries run in the default executor so the event loop is never blocked on disk.
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The path of the database file. It is created if it does not exist.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike[str]]) -> None:
+        self.path: str = os.fspath(path)
+        self._lock: threading.Lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} path={self.path!r}>'
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS match_details (match_id TEXT PRIMARY KEY, data BLOB NOT NULL)')
+            self._conn = conn
+        return self._conn
+
+    def _get(self, match_id: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._connect().execute('SELECT data FROM match_details WHERE match_id = ?', (match_id,)).fetchone()
+        return row[0] if row is not None else None
+
+    def _set(self, match_id: str, blob: bytes) -> None:
+        with self._lock:
+            self._connect().execute(
+                'INSERT OR REPLACE INTO match_details (match_id, data) VALUES (?, ?)', (match_id, blob)
+            )
+
+    def _delete(self, match_id: str) -> None:
+        with self._lock:
+            self._connect().execute('DELETE FROM match_details WHERE match_id = ?', (match_id,))
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    async def get(self, match_id: str) -> Optional[bytes]:
+        return await self._run(self._get, match_id)
+
+    async def set(self, match_id: str, blob: bytes) -> None:
+        await self._run(self._set, match_id, blob)
+
+    async def delete(self, match_id: str) -> None:
+        await self._run(self._delete, match_id)
+
+    async def close(self) -> None:
+        await self._run(self._close)
+
+
+class MatchStore:
+    """A two-tier store for the raw payloads of completed matches.
+
+    A finished match never changes, so once its details are stored
+    :meth:`Client.fetch_match_details` can skip the network entirely.
+    Payloads are kept zlib-compressed in a bounded in-memory LRU tier and,
+    if a backend is given, in a persistent tier behind it.
+
+    Parameters
+    ----------
+    backend: Optional[:class:`MatchStoreBackend`]
+        The persistent tier. If ``None`` only the in-memory tier is used.
+    max_size: :class:`int`
+        The maximum amount of matches kept in memory. ``0`` disables the in-memory tier.
+    compression_level: :class:`int`
+        The zlib compression level used for stored payloads.
+
+    Attributes
+    ----------
+    stats: :class:`MatchStoreStats`
+        The hit/miss counters of this store.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[MatchStoreBackend] = None,
+        *,
+        max_size: int = 128,
+        compression_level: int = 6,
+    ) -> None:
+        if max_size < 0:
+            raise ValueError('max_size must be at least 0')
+        self.backend: Optional[MatchStoreBackend] = backend
+        self.max_size: int = max_size
+        self.compression_level: int = compression_level
+        self.stats: MatchStoreStats = MatchStoreStats()
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} backend={self.backend!r} size={len(self._memory)} max_size={self.max_size}>'
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def __contains__(self, match_id: str) -> bool:
+        return match_id in self._memory
+
+    def _compress(self, data: MatchDetailsPayload) -> bytes:
+        return zlib.compress(utils._to_json(data).encode('utf-8'), self.compression_level)
+
+    def _decompress(self, blob: bytes) -> MatchDetailsPayload:
+        return utils._from_json(zlib.decompress(blob))
+
+    def _remember(self, match_id: str, blob: bytes) -> None:
+        if not self.max_size:
+            return
+        self._memory[match_id] = blob
+        self._memory.move_to_end(match_id)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def get(self, match_id: str) -> Optional[MatchDetailsPayload]:
+        """|coro|
+
+        Gets the stored payload for the given match.
+
+        Parameters
+        ----------
+        match_id: :class:`str`
+            The match ID to look up.
+
+        Returns
+        -------
+        Optional[Dict[:class:`str`, Any]]
+            The raw match details payload, or ``None`` if the match is not stored.
+        """
+        blob = self._memory.get(match_id)
+        if blob is not None:
+            self._memory.move_to_end(match_id)
+            self.stats.memory_hits += 1
+            return self._decompress(blob)
+
+        if self.backend is not None:
+            blob = await self.backend.get(match_id)
+            if blob is not None:
+                self.stats.disk_hits += 1
+                self._remember(match_id, blob)
+                return self._decompress(blob)
+
+        self.stats.misses += 1
+        return None
+
+    async def set(self, match_id: str, data: MatchDetailsPayload) -> None:
+        """|coro|
+
+        Stores the payload for the given match.
+
+        Parameters
+        ----------
+        match_id: :class:`str`
+            The match ID to store the payload under.
+        data: Dict[:class:`str`, Any]
+            The raw match details payload.
+        """
+        blob = self._compress(data)
+        self._remember(match_id, blob)
+        if self.backend is not None:
+            await self.backend.set(match_id, blob)
+        self.stats.writes += 1
+
+    async def delete(self, match_id: str) -> None:
+        """|coro|
+
+        Deletes the given match from every tier.
+
+        Parameters
+        ----------
+        match_id: :class:`str`
+            The match ID to delete.
+        """
+        self._memory.pop(match_id, None)
+        if self.backend is not None:
+            await self.backend.delete(match_id)
+
+    def clear_memory(self) -> None:
+        """Clears the in-memory tier. The backend is left untouched."""
+        self._memory.clear()
+
+    async def close(self) -> None:
+        """|coro|
+
+        Clears the in-memory tier and closes the backend.
+        """
+        self._memory.clear()
+        if self.backend is not None:
+            await self.backend.close()
@@ -4,6 +4,7 @@ from .agents import *
 from .buddies import *
 from .bundles import *
 from .ceremonies import *
+from .columns import *
 from .competitive_tiers import *
 from .config import *
 from .content import *
@@ -16,6 +17,7 @@ from .esports import *
 from .events import *
 from .gamemodes import *
 from .gear import *
+from .leaderboard import *
 from .level_borders import *
 from .loadout import *
 from .maps import *
@@ -8,6 +8,8 @@ from valorant.models.abc import GridPosition as GridPosition, ShopData as ShopDa
 from ..enums import VALORANT_POINT_UUID
 
 if TYPE_CHECKING:
+    from typing_extensions import Self
+
     from ..types.store import (
         BonusStoreOffer as BonusStoreOfferPayload,
         BundleItemOffer as BundleItemOfferPayload,
@@ -28,6 +30,14 @@ class Item:
     def __init__(self) -> None:
         self._cost = 0
 
+    @classmethod
+    def _copy(cls, item: Self) -> Self:
+        # valorant.py models have no copy of their own, the subclasses extend this one
+        self = cls.__new__(cls)  # bypass __init__
+        self._uuid = item._uuid
+        self.__dict__.update(item.__dict__)
+        return self
+
     @property
     def cost(self) -> int:
         return self._cost
@@ -23,6 +23,8 @@ __all__ = (
 
 
 class SourceXP:
+    __slots__ = ('id', 'amount')
+
     def __init__(self, data: XPSourcePayload) -> None:
         self.id: str = data['ID']
         self.amount: int = data['Amount']
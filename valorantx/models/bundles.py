@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import datetime
 import logging
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
 from valorant.models.bundles import Bundle as BundleValorantAPI
 
@@ -15,6 +15,7 @@ from .sprays import SprayBundle
 from .weapons import SkinLevelBundle
 
 if TYPE_CHECKING:
+    from typing_extensions import Self
     from valorant.types.bundles import Bundle as BundleValorantAPIPayload
 
     from ..types.store import Bundle_ as BundlePayload
@@ -95,6 +96,13 @@ class FeaturedBundle:
     def __repr__(self) -> str:
         return self._bundle.__repr__()
 
+    @classmethod
+    def from_data(cls, state: CacheState, data: BundlePayload) -> Optional[Self]:
+        bundle = state.get_bundle(data['DataAssetID'])
+        if bundle is None:
+            return None
+        return cls(bundle, data)  # type: ignore
+
     @property
     def discounted_cost(self) -> int:
         return self._total_discounted_cost
@@ -0,0 +1,203 @@
+# Copyright (c) 2023-present STACiA
+# Licensed under the MIT
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
+if TYPE_CHECKING:
+    from .match import MatchDetails, MatchPlayer
+
+    Columns = Dict[str, Any]
+
+# fmt: off
+__all__ = (
+    'MatchColumns',
+)
+# fmt: on
+
+
+def _require_numpy() -> None:
+    if not HAS_NUMPY:
+        raise RuntimeError(
+            'numpy is required for columnar match tables, install it with `pip install valorantx[analytics]`'
+        )
+
+
+class MatchColumns:
+    """Represents the rounds of a :class:`MatchDetails` as columnar NumPy tables.
+
+    Players and teams are integer coded by their position in :attr:`players`
+    and :attr:`teams`. A missing player, such as the killer of a fall death, is ``-1``.
+    Every table is a :class:`dict` of equally long one-dimensional arrays.
+
+    Attributes
+    ----------
+    players: Tuple[:class:`str`, ...]
+        The puuid of each player, indexed by player code.
+    teams: Tuple[:class:`str`, ...]
+        The ID of each team, indexed by team code.
+    player_teams: :class:`numpy.ndarray`
+        The team code of each player, indexed by player code.
+    kills: Dict[:class:`str`, :class:`numpy.ndarray`]
+        One row per kill: ``round``, ``game_time``, ``round_time``, ``killer``,
+        ``victim``, ``victim_x`` and ``victim_y``.
+    assists: Dict[:class:`str`, :class:`numpy.ndarray`]
+        One row per assist: ``kill`` (the row in :attr:`kills`), ``round`` and ``assistant``.
+    damage: Dict[:class:`str`, :class:`numpy.ndarray`]
+        One row per damage event: ``round``, ``dealer``, ``receiver``, ``damage``,
+        ``head_shots``, ``body_shots`` and ``leg_shots``.
+    economy: Dict[:class:`str`, :class:`numpy.ndarray`]
+        One row per player per round: ``round``, ``player``, ``score``,
+        ``loadout_value``, ``remaining`` and ``spent``.
+    locations: Dict[:class:`str`, :class:`numpy.ndarray`]
+        One row per player location recorded at a kill: ``kill`` (the row in
+        :attr:`kills`), ``player``, ``x``, ``y`` and ``view_radians``.
+    """
+
+    def __init__(self, match: MatchDetails) -> None:
+        _require_numpy()
+        self.match_id: str = match.id
+        self.players: Tuple[str, ...] = tuple(player.puuid for player in match.players)
+        self.teams: Tuple[str, ...] = tuple(team.id for team in match.teams)
+        self._player_codes: Dict[str, int] = {puuid: index for index, puuid in enumerate(self.players)}
+        team_codes = {team_id: index for index, team_id in enumerate(self.teams)}
+        self.player_teams: Any = np.array(
+            [team_codes.get(player.team_id, -1) for player in match.players], dtype=np.int16
+        )
+
+        kills: Dict[str, List[Any]] = {
+            k: [] for k in ('round', 'game_time', 'round_time', 'killer', 'victim', 'victim_x', 'victim_y')
+        }
+        assists: Dict[str, List[int]] = {k: [] for k in ('kill', 'round', 'assistant')}
+        damage: Dict[str, List[int]] = {
+            k: [] for k in ('round', 'dealer', 'receiver', 'damage', 'head_shots', 'body_shots', 'leg_shots')
+        }
+        economy: Dict[str, List[int]] = {
+            k: [] for k in ('round', 'player', 'score', 'loadout_value', 'remaining', 'spent')
+        }
+        locations: Dict[str, List[Any]] = {k: [] for k in ('kill', 'player', 'x', 'y', 'view_radians')}
+
+        code = self._code
+        for round_result in match.round_results:
+            round_number = round_result.round_number
+            for stat in round_result.player_stats:
+                player = code(stat.subject)
+                economy['round'].append(round_number)
+                economy['player'].append(player)
+                economy['score'].append(stat.score)
+                economy['loadout_value'].append(stat.economy.loadout_value)
+                economy['remaining'].append(stat.economy.remaining)
+                economy['spent'].append(stat.economy.spent)
+
+                for kill in stat.kills:
+                    row = len(kills['round'])
+                    kills['round'].append(round_number)
+                    kills['game_time'].append(kill.game_time)
+                    kills['round_time'].append(kill.round_time)
+                    kills['killer'].append(code(kill._killer_uuid))
+                    kills['victim'].append(code(kill._victim_uuid))
+                    kills['victim_x'].append(kill.victim_location.x)
+                    kills['victim_y'].append(kill.victim_location.y)
+                    for assistant in kill._assistants_list:
+                        assists['kill'].append(row)
+                        assists['round'].append(round_number)
+                        assists['assistant'].append(code(assistant))
+                    for location in kill.player_locations:
+                        locations['kill'].append(row)
+                        locations['player'].append(code(location.subject))
+                        locations['x'].append(location.location.x)
+                        locations['y'].append(location.location.y)
+                        locations['view_radians'].append(location.view_radians)
+
+                for dmg in stat.damage:
+                    damage['round'].append(round_number)
+                    damage['dealer'].append(player)
+                    damage['receiver'].append(code(dmg._receiver_uuid))
+                    damage['damage'].append(dmg.damage)
+                    damage['head_shots'].append(dmg.head_shots)
+                    damage['body_shots'].append(dmg.body_shots)
+                    damage['leg_shots'].append(dmg.leg_shots)
+
+        self.kills: Columns = self._to_arrays(kills, {'victim_x': np.float32, 'victim_y': np.float32})
+        self.assists: Columns = self._to_arrays(assists)
+        self.damage: Columns = self._to_arrays(damage)
+        self.economy: Columns = self._to_arrays(economy)
+        self.locations: Columns = self._to_arrays(
+            locations, {'x': np.float32, 'y': np.float32, 'view_radians': np.float32}
+        )
+
+    def __repr__(self) -> str:
+        attrs = [
+            ('match_id', self.match_id),
+            ('players', len(self.players)),
+            ('kills', len(self.kills['round'])),
+            ('damage', len(self.damage['round'])),
+        ]
+        joined = ' '.join('%s=%r' % t for t in attrs)
+        return f'<{self.__class__.__name__} {joined}>'
+
+    def _code(self, puuid: str) -> int:
+        return self._player_codes.get(puuid, -1)
+
+    @staticmethod
+    def _to_arrays(columns: Dict[str, List[Any]], dtypes: Optional[Dict[str, Any]] = None) -> Columns:
+        dtypes = dtypes or {}
+        return {name: np.asarray(values, dtype=dtypes.get(name, np.int32)) for name, values in columns.items()}
+
+    def player_index(self, player: MatchPlayer) -> int:
+        """Gets the player code of the given player.
+
+        Parameters
+        ----------
+        player: :class:`MatchPlayer`
+            The player to look up.
+
+        Returns
+        -------
+        :class:`int`
+            The player code, or ``-1`` if the player is not in this match.
+        """
+        return self._code(player.puuid)
+
+    def _matrix(self, rows: Any, columns: Any, weights: Any = None) -> Any:
+        size = len(self.players)
+        matrix = np.zeros((size, size), dtype=np.int32)
+        mask = (rows >= 0) & (columns >= 0)
+        np.add.at(matrix, (rows[mask], columns[mask]), 1 if weights is None else weights[mask])
+        return matrix
+
+    def kill_matrix(self) -> Any:
+        """:class:`numpy.ndarray`: A ``(players, players)`` matrix of how often row killed column."""
+        return self._matrix(self.kills['killer'], self.kills['victim'])
+
+    def damage_matrix(self) -> Any:
+        """:class:`numpy.ndarray`: A ``(players, players)`` matrix of the damage row dealt to column."""
+        return self._matrix(self.damage['dealer'], self.damage['receiver'], self.damage['damage'])
+
+    def first_kills(self) -> Any:
+        """:class:`numpy.ndarray`: The row in :attr:`kills` of the first kill of each round that had one."""
+        kills = self.kills
+        if not len(kills['round']):
+            return np.zeros(0, dtype=np.intp)
+        order = np.lexsort((kills['round_time'], kills['round']))
+        rounds = kills['round'][order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = rounds[1:] != rounds[:-1]
+        return order[first]
+
+    def average_damage_per_round(self) -> Any:
+        """:class:`numpy.ndarray`: The average damage per round of each player, indexed by player code."""
+        known = self.damage['dealer'] >= 0
+        total = np.bincount(
+            self.damage['dealer'][known], weights=self.damage['damage'][known], minlength=len(self.players)
+        )
+        rounds = max(len(np.unique(self.economy['round'])), 1)
+        return total / rounds
@@ -0,0 +1,512 @@
+# Copyright (c) 2023-present STACiA
+# Licensed under the MIT
+
+from __future__ import annotations
+
+import bisect
+import os
+import sys
+import uuid
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from .. import utils
+
+if TYPE_CHECKING:
+    from ..types.mmr import LeaderboardPlayer as LeaderboardPlayerPayload
+
+# fmt: off
+__all__ = (
+    'LeaderboardEntry',
+    'LeaderboardTable',
+)
+# fmt: on
+
+_BANNED = 1
+_ANONYMIZED = 2
+_EMPTY_PUUID = bytes(16)
+_CHECKPOINT_MAGIC = b'VXLB'
+_CHECKPOINT_FORMAT = 2
+# format 1 did not record the page size
+_CHECKPOINT_FORMATS = frozenset({1, 2})
+
+
+class LeaderboardEntry:
+    """Represents one player of a :class:`LeaderboardTable`.
+
+    Entries are created on access from the table's arrays and are not kept by it.
+
+    Attributes
+    ----------
+    rank: :class:`int`
+        The leaderboard rank, starting at 1.
+    puuid: :class:`str`
+        The puuid of the player, an empty string if anonymized.
+    game_name: :class:`str`
+        The game name of the player, an empty string if anonymized.
+    tag_line: :class:`str`
+        The tag line of the player, an empty string if anonymized.
+    ranked_rating: :class:`int`
+        The ranked rating of the player.
+    number_of_wins: :class:`int`
+        The amount of competitive wins of the player.
+    competitive_tier: :class:`int`
+        The competitive tier of the player.
+    """
+
+    __slots__ = (
+        'rank',
+        'puuid',
+        'game_name',
+        'tag_line',
+        'ranked_rating',
+        'number_of_wins',
+        'competitive_tier',
+        '_flags',
+    )
+
+    def __init__(
+        self,
+        rank: int,
+        puuid: str,
+        game_name: str,
+        tag_line: str,
+        ranked_rating: int,
+        number_of_wins: int,
+        competitive_tier: int,
+        flags: int,
+    ) -> None:
+        self.rank: int = rank
+        self.puuid: str = puuid
+        self.game_name: str = game_name
+        self.tag_line: str = tag_line
+        self.ranked_rating: int = ranked_rating
+        self.number_of_wins: int = number_of_wins
+        self.competitive_tier: int = competitive_tier
+        self._flags: int = flags
+
+    def __repr__(self) -> str:
+        attrs = [
+            ('rank', self.rank),
+            ('puuid', self.puuid),
+            ('riot_id', self.riot_id),
+            ('ranked_rating', self.ranked_rating),
+        ]
+        joined = ' '.join('%s=%r' % t for t in attrs)
+        return f'<{self.__class__.__name__} {joined}>'
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, LeaderboardEntry) and other.rank == self.rank and other.puuid == self.puuid
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    def __hash__(self) -> int:
+        return hash((self.rank, self.puuid))
+
+    @property
+    def riot_id(self) -> str:
+        """:class:`str`: The game name and tag line as ``name#tag``."""
+        return f'{self.game_name}#{self.tag_line}'
+
+    def is_banned(self) -> bool:
+        """:class:`bool`: Whether the player is banned."""
+        return bool(self._flags & _BANNED)
+
+    def is_anonymized(self) -> bool:
+        """:class:`bool`: Whether the player hides their name on the leaderboard."""
+        return bool(self._flags & _ANONYMIZED)
+
+
+class LeaderboardTable:
+    """A compact, array-backed store of a competitive leaderboard.
+
+    Every column is a typed :class:`array.array` or :class:`bytearray` indexed
+    by ``rank - 1``. Puuids are kept as 16 raw bytes and names in one UTF-8
+    blob, so a full shard of hundreds of thousands of players costs a few
+    dozen bytes per player instead of one :class:`dict` each. Lookups by rank
+    are constant time, lookups by puuid or name scan the packed bytes.
+
+    Pages can be added in any order, the table remembers which ones it holds
+    so an interrupted crawl can be resumed, see :meth:`Client.iter_leaderboard`.
+
+    Parameters
+    ----------
+    season_id: :class:`str`
+        The season the leaderboard belongs to.
+    region: :class:`str`
+        The shard the leaderboard belongs to.
+    page_size: Optional[:class:`int`]
+        The amount of players per page the pages are requested with.
+
+    Attributes
+    ----------
+    total: Optional[:class:`int`]
+        The amount of players on the leaderboard, ``None`` until the first page is added.
+    pages: Set[:class:`int`]
+        The start index of each page added so far.
+    page_size: Optional[:class:`int`]
+        The amount of players per page, ``None`` if unknown. The start indexes in
+        :attr:`pages` only tell which ranks are covered with this page size.
+    """
+
+    def __init__(self, season_id: str, region: str, page_size: Optional[int] = None) -> None:
+        self.season_id: str = season_id
+        self.region: str = region
+        self.page_size: Optional[int] = page_size
+        self.total: Optional[int] = None
+        self.pages: Set[int] = set()
+        self._size: int = 0
+        self._filled: bytearray = bytearray()
+        self._ranked_rating: array[int] = array('I')
+        self._wins: array[int] = array('I')
+        self._tier: array[int] = array('B')
+        self._flags: array[int] = array('B')
+        self._puuids: bytearray = bytearray()
+        # 'name#tag\n' per player, a row points at its name with its offset
+        self._names: bytearray = bytearray(b'\n')
+        self._name_offsets: array[int] = array('I')
+        # casefolded '\nname#tag' per player in insertion order, for searching
+        self._search: bytearray = bytearray(b'\n')
+        self._search_offsets: array[int] = array('I')
+        self._search_rows: array[int] = array('I')
+
+    def __repr__(self) -> str:
+        attrs = [
+            ('season_id', self.season_id),
+            ('region', self.region),
+            ('players', len(self)),
+            ('total', self.total),
+        ]
+        joined = ' '.join('%s=%r' % t for t in attrs)
+        return f'<{self.__class__.__name__} {joined}>'
+
+    def __len__(self) -> int:
+        return self._size - self._filled.count(0)
+
+    def __iter__(self) -> Iterator[LeaderboardEntry]:
+        for row in range(self._size):
+            if self._filled[row]:
+                yield self._entry(row)
+
+    def __contains__(self, rank: int) -> bool:
+        row = rank - 1
+        return 0 <= row < self._size and bool(self._filled[row])
+
+    @property
+    def memory_usage(self) -> int:
+        """:class:`int`: The approximate amount of bytes held by the columns."""
+        columns = (
+            self._filled,
+            self._ranked_rating,
+            self._wins,
+            self._tier,
+            self._flags,
+            self._puuids,
+            self._names,
+            self._name_offsets,
+            self._search,
+            self._search_offsets,
+            self._search_rows,
+        )
+        return sum(sys.getsizeof(column) for column in columns)
+
+    def is_complete(self) -> bool:
+        """:class:`bool`: Whether every player of the leaderboard is in the table."""
+        return self.total is not None and len(self) >= self.total
+
+    def missing_pages(self, page_size: int, start_index: int = 0, stop_index: Optional[int] = None) -> List[int]:
+        """Returns the start index of every page not added yet.
+
+        Parameters
+        ----------
+        page_size: :class:`int`
+            The amount of players per page.
+        start_index: :class:`int`
+            The first index to consider.
+        stop_index: Optional[:class:`int`]
+            The index to stop at, defaults to :attr:`total`.
+
+        Raises
+        ------
+        ValueError
+            The total is not known yet, or the pages already added have another size.
+
+        Returns
+        -------
+        List[:class:`int`]
+            The start indexes to fetch.
+        """
+        if self.page_size is not None and page_size != self.page_size:
+            # a start index added with another size covers other ranks, resuming would leave gaps
+            raise ValueError(f'the pages of this table have {self.page_size} players, not {page_size}')
+        stop = self.total if stop_index is None else stop_index
+        if stop is None:
+            raise ValueError('the total amount of players is not known yet')
+        return [start for start in range(start_index, stop, page_size) if start not in self.pages]
+
+    def _grow(self, size: int) -> None:
+        extra = size - self._size
+        if extra <= 0:
+            return
+        self._filled.extend(bytes(extra))
+        self._ranked_rating.extend(array('I', [0]) * extra)
+        self._wins.extend(array('I', [0]) * extra)
+        self._tier.extend(array('B', [0]) * extra)
+        self._flags.extend(array('B', [0]) * extra)
+        self._puuids.extend(bytes(16 * extra))
+        self._name_offsets.extend(array('I', [0]) * extra)
+        self._size = size
+
+    def add(self, player: LeaderboardPlayerPayload) -> int:
+        """Adds or replaces one player.
+
+        Parameters
+        ----------
+        player: Dict[:class:`str`, Any]
+            A player of a leaderboard response.
+
+        Returns
+        -------
+        :class:`int`
+            The rank of the player.
+        """
+        rank: int = player['leaderboardRank']
+        row = rank - 1
+        if row < 0:
+            raise ValueError(f'invalid leaderboard rank {rank!r}')
+        if row >= self._size:
+            self._grow(max(row + 1, self._size * 2, 1024))
+
+        self._filled[row] = 1
+        self._ranked_rating[row] = player.get('rankedRating') or 0
+        self._wins[row] = player.get('numberOfWins') or 0
+        self._tier[row] = player.get('competitiveTier') or 0
+        flags = 0
+        if player.get('IsBanned'):
+            flags |= _BANNED
+        if player.get('IsAnonymized'):
+            flags |= _ANONYMIZED
+        self._flags[row] = flags
+
+        puuid = player.get('puuid') or ''
+        self._puuids[row * 16 : row * 16 + 16] = uuid.UUID(puuid).bytes if puuid else _EMPTY_PUUID
+
+        riot_id = f'{player.get("gameName") or ""}#{player.get("tagLine") or ""}'
+        if riot_id == '#':
+            self._name_offsets[row] = 0
+        else:
+            self._name_offsets[row] = len(self._names)
+            self._names += riot_id.encode('utf-8') + b'\n'
+            self._search_offsets.append(len(self._search))
+            self._search_rows.append(row)
+            self._search += riot_id.casefold().encode('utf-8') + b'\n'
+        return rank
+
+    def add_page(self, start_index: int, players: List[LeaderboardPlayerPayload], total: Optional[int] = None) -> None:
+        """Adds the players of one page and marks the page as added.
+
+        Parameters
+        ----------
+        start_index: :class:`int`
+            The start index the page was requested with.
+        players: List[Dict[:class:`str`, Any]]
+            The players of the page.
+        total: Optional[:class:`int`]
+            The ``totalPlayers`` of the response.
+        """
+        for player in players:
+            self.add(player)
+        self.mark_page(start_index, total)
+
+    def mark_page(self, start_index: int, total: Optional[int] = None) -> None:
+        """Marks the page starting at ``start_index`` as added, e.g. after its players were streamed in with :meth:`add`."""
+        self.pages.add(start_index)
+        if total is not None:
+            self.total = total
+
+    def _name(self, row: int) -> Tuple[str, str]:
+        offset = self._name_offsets[row]
+        if not offset:
+            return '', ''
+        end = self._names.index(b'\n', offset)
+        game_name, _, tag_line = self._names[offset:end].decode('utf-8').rpartition('#')
+        return game_name, tag_line
+
+    def _entry(self, row: int) -> LeaderboardEntry:
+        raw_puuid = bytes(self._puuids[row * 16 : row * 16 + 16])
+        game_name, tag_line = self._name(row)
+        return LeaderboardEntry(
+            rank=row + 1,
+            puuid=str(uuid.UUID(bytes=raw_puuid)) if raw_puuid != _EMPTY_PUUID else '',
+            game_name=game_name,
+            tag_line=tag_line,
+            ranked_rating=self._ranked_rating[row],
+            number_of_wins=self._wins[row],
+            competitive_tier=self._tier[row],
+            flags=self._flags[row],
+        )
+
+    def get(self, rank: int) -> Optional[LeaderboardEntry]:
+        """Gets the player at the given rank.
+
+        Parameters
+        ----------
+        rank: :class:`int`
+            The leaderboard rank, starting at 1.
+
+        Returns
+        -------
+        Optional[:class:`LeaderboardEntry`]
+            The player, or ``None`` if that rank was not added.
+        """
+        if rank not in self:
+            return None
+        return self._entry(rank - 1)
+
+    def find_by_puuid(self, puuid: str) -> Optional[LeaderboardEntry]:
+        """Finds a player by puuid.
+
+        Parameters
+        ----------
+        puuid: :class:`str`
+            The puuid to look up.
+
+        Returns
+        -------
+        Optional[:class:`LeaderboardEntry`]
+            The player, or ``None`` if not found.
+        """
+        needle = uuid.UUID(puuid).bytes
+        index = self._puuids.find(needle)
+        while index != -1:
+            # a match that is not aligned spans two puuids
+            if not index % 16 and self._filled[index // 16]:
+                return self._entry(index // 16)
+            index = self._puuids.find(needle, index + 1)
+        return None
+
+    def search(self, game_name: str, tag_line: Optional[str] = None) -> List[LeaderboardEntry]:
+        """Finds players by name, ignoring case.
+
+        Parameters
+        ----------
+        game_name: :class:`str`
+            The game name to look up.
+        tag_line: Optional[:class:`str`]
+            The tag line. If not given every player with that game name is returned.
+
+        Returns
+        -------
+        List[:class:`LeaderboardEntry`]
+            The players found, by rank.
+        """
+        needle = '\n' + game_name.casefold() + '#'
+        if tag_line is not None:
+            needle += tag_line.casefold() + '\n'
+        encoded = needle.encode('utf-8')
+
+        rows: Set[int] = set()
+        index = self._search.find(encoded)
+        while index != -1:
+            position = bisect.bisect_left(self._search_offsets, index + 1)
+            row = self._search_rows[position]
+            # a player re-added with a new name leaves its old name behind
+            game, tag = self._name(row)
+            if game.casefold() == game_name.casefold() and (tag_line is None or tag.casefold() == tag_line.casefold()):
+                rows.add(row)
+            index = self._search.find(encoded, index + 1)
+        return [self._entry(row) for row in sorted(rows)]
+
+    # checkpoints
+
+    def _columns(self) -> List[Tuple[str, Union[bytearray, array[int]]]]:
+        return [
+            ('filled', self._filled),
+            ('ranked_rating', self._ranked_rating),
+            ('wins', self._wins),
+            ('tier', self._tier),
+            ('flags', self._flags),
+            ('puuids', self._puuids),
+            ('names', self._names),
+            ('name_offsets', self._name_offsets),
+            ('search', self._search),
+            ('search_offsets', self._search_offsets),
+            ('search_rows', self._search_rows),
+        ]
+
+    def save(self, path: Union[str, os.PathLike[str]]) -> None:
+        """Writes the table to a file atomically, see :meth:`load`.
+
+        Parameters
+        ----------
+        path: Union[:class:`str`, :class:`os.PathLike`]
+            The file to write.
+        """
+        columns = self._columns()
+        header: Dict[str, Any] = {
+            'format': _CHECKPOINT_FORMAT,
+            'byteorder': sys.byteorder,
+            'season_id': self.season_id,
+            'region': self.region,
+            'page_size': self.page_size,
+            'total': self.total,
+            'pages': sorted(self.pages),
+            'size': self._size,
+            'columns': [(name, len(column)) for name, column in columns],
+        }
+        encoded = utils._to_json(header).encode('utf-8')
+
+        path = os.fspath(path)
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as fp:
+            fp.write(_CHECKPOINT_MAGIC)
+            fp.write(len(encoded).to_bytes(4, 'little'))
+            fp.write(encoded)
+            for _, column in columns:
+                fp.write(column if isinstance(column, bytearray) else column.tobytes())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike[str]]) -> LeaderboardTable:
+        """Reads a table written by :meth:`save`.
+
+        Parameters
+        ----------
+        path: Union[:class:`str`, :class:`os.PathLike`]
+            The file to read.
+
+        Raises
+        ------
+        ValueError
+            The file is not a leaderboard checkpoint of a supported format.
+
+        Returns
+        -------
+        :class:`LeaderboardTable`
+            The table.
+        """
+        with open(path, 'rb') as fp:
+            if fp.read(4) != _CHECKPOINT_MAGIC:
+                raise ValueError('not a leaderboard checkpoint')
+            length = int.from_bytes(fp.read(4), 'little')
+            header = utils._from_json(fp.read(length))
+            if header.get('format') not in _CHECKPOINT_FORMATS:
+                raise ValueError(f'unsupported leaderboard checkpoint format {header.get("format")!r}')
+
+            self = cls(header['season_id'], header['region'], header.get('page_size'))
+            self.total = header['total']
+            self.pages = set(header['pages'])
+            self._size = header['size']
+            columns = dict(self._columns())
+            for name, count in header['columns']:
+                column = columns[name]
+                if isinstance(column, bytearray):
+                    column.clear()
+                    column.extend(fp.read(count))
+                else:
+                    del column[:]
+                    column.frombytes(fp.read(count * column.itemsize))
+                    if header['byteorder'] != sys.byteorder:
+                        column.byteswap()
+        return self
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-import asyncio
 import contextlib
 import datetime
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .. import utils
 from ..enums import AbilitySlot
+from .columns import MatchColumns
 from .user import User
 
 if TYPE_CHECKING:
@@ -56,10 +56,13 @@ __all__ = (
     'Damage',
     'Economy',
     'FinishingDamage',
+    'HeadToHead',
+    'HeadToHeadStats',
     'Kill',
     'Location',
     'MatchDetails',
     'MatchHistory',
+    'MatchHistoryEntry',
     'MatchInfo',
     'MatchPlayer',
     'PlayerLocation',
@@ -111,14 +114,85 @@ class MatchHistory:
     #         if match_details is not None:
     #             yield match_details
 
-    async def fetch_details(self) -> None:
-        """:class:`List[MatchDetails]`: Fetches the match details for each match in the history."""
-        future_tasks = [
-            asyncio.ensure_future(self._client.fetch_match_details(match['MatchID'])) for match in self._history
-        ]
-        results = await asyncio.gather(*future_tasks)
-        for match in results:
-            self._match_details[match.id] = match
+    async def fetch_details(self, *, concurrency: int = 5, lazy: bool = False) -> None:
+        """|coro|
+
+        Fetches the match details for each match in the history.
+
+        Parameters
+        ----------
+        concurrency: :class:`int`
+            The maximum amount of matches fetched at once.
+        lazy: :class:`bool`
+            Whether to defer building the round results of each match until they are first accessed.
+        """
+        match_ids = [match['MatchID'] for match in self._history]
+        details: Dict[str, MatchDetails] = {}
+        try:
+            async for match in self._client.fetch_match_details_many(match_ids, concurrency=concurrency, lazy=lazy):
+                details[match.id] = match  # type: ignore # return_exceptions is False
+        finally:
+            # keep what was fetched, in history order
+            for match_id in match_ids:
+                if match_id in details:
+                    self._match_details[match_id] = details[match_id]
+
+
+class MatchHistoryEntry:
+    """Represents a single match in a player's match history.
+
+    Attributes
+    ----------
+    subject: :class:`str`
+        The puuid of the player this history belongs to.
+    id: :class:`str`
+        The ID of the match.
+    queue_id: :class:`str`
+        The queue the match was played in.
+    game_start_millis: :class:`int`
+        The time the match started, in milliseconds since the epoch.
+    """
+
+    def __init__(self, client: Client, subject: str, data: HistoryPayload) -> None:
+        self._client = client
+        self.subject: str = subject
+        self.id: str = data['MatchID']
+        self.queue_id: str = str(data['QueueID'])
+        self.game_start_millis: int = data['GameStartTime']
+
+    def __repr__(self) -> str:
+        return f'<MatchHistoryEntry id={self.id!r} queue_id={self.queue_id!r} started_at={self.started_at!r}>'
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, MatchHistoryEntry) and self.id == other.id
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    @property
+    def started_at(self) -> datetime.datetime:
+        """:class:`datetime.datetime`: The time this match started."""
+        return datetime.datetime.fromtimestamp(self.game_start_millis / 1000)
+
+    async def fetch_details(self, *, lazy: bool = False) -> MatchDetails:
+        """|coro|
+
+        Fetches the match details for this match.
+
+        Parameters
+        ----------
+        lazy: :class:`bool`
+            Whether to defer building the round results until they are first accessed.
+
+        Returns
+        -------
+        :class:`MatchDetails`
+            The match details for this match.
+        """
+        return await self._client.fetch_match_details(self.id, lazy=lazy)
 
 
 class MatchInfo:
@@ -272,31 +346,170 @@ class Party:
         return [player for player in self.match.players if player.party == self]
 
 
+class HeadToHeadStats:
+    """Represents what one player did to another player in a match.
+
+    Attributes
+    ----------
+    kills: :class:`int`
+        The amount of times the player killed the target.
+    assists: :class:`int`
+        The amount of times the player assisted on a kill of the target.
+    damages: :class:`int`
+        The damage the player dealt to the target.
+    head_shots: :class:`int`
+        The head shots the player landed on the target.
+    body_shots: :class:`int`
+        The body shots the player landed on the target.
+    leg_shots: :class:`int`
+        The leg shots the player landed on the target.
+    """
+
+    __slots__ = ('kills', 'assists', 'damages', 'head_shots', 'body_shots', 'leg_shots')
+
+    def __init__(self) -> None:
+        self.kills: int = 0
+        self.assists: int = 0
+        self.damages: int = 0
+        self.head_shots: int = 0
+        self.body_shots: int = 0
+        self.leg_shots: int = 0
+
+    def __repr__(self) -> str:
+        attrs = [(attr, getattr(self, attr)) for attr in self.__slots__]
+        joined = ' '.join('%s=%r' % t for t in attrs)
+        return f'<{self.__class__.__name__} {joined}>'
+
+    def __add__(self, other: HeadToHeadStats) -> HeadToHeadStats:
+        result = HeadToHeadStats()
+        for attr in self.__slots__:
+            setattr(result, attr, getattr(self, attr) + getattr(other, attr))
+        return result
+
+
+class HeadToHead:
+    """Represents the head-to-head matrix of a match.
+
+    Every kill, assist and damage event is counted once, keyed by the puuid
+    of the player that did it and the puuid of the player it was done to.
+    """
+
+    def __init__(self, match: MatchDetails) -> None:
+        self._match: MatchDetails = match
+        self._matrix: Dict[Tuple[str, str], HeadToHeadStats] = {}
+
+        for kill in match.kills:
+            victim = kill._victim_uuid
+            if kill._killer_uuid:
+                self._entry(kill._killer_uuid, victim).kills += 1
+            for assistant in kill._assistants_list:
+                self._entry(assistant, victim).assists += 1
+
+        for round_result in match.round_results:
+            for stat in round_result.player_stats:
+                for dmg in stat.damage:
+                    entry = self._entry(stat.subject, dmg._receiver_uuid)
+                    entry.damages += dmg.damage
+                    entry.head_shots += dmg.head_shots
+                    entry.body_shots += dmg.body_shots
+                    entry.leg_shots += dmg.leg_shots
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} match={self._match.id!r} pairs={len(self._matrix)}>'
+
+    def _entry(self, player_id: str, target_id: str) -> HeadToHeadStats:
+        key = (player_id, target_id)
+        entry = self._matrix.get(key)
+        if entry is None:
+            entry = self._matrix[key] = HeadToHeadStats()
+        return entry
+
+    def get(self, player: MatchPlayer, target: MatchPlayer) -> HeadToHeadStats:
+        """Gets what the player did to the target.
+
+        Parameters
+        ----------
+        player: :class:`MatchPlayer`
+            The player that dealt the kills and damage.
+        target: :class:`MatchPlayer`
+            The player that received them.
+
+        Returns
+        -------
+        :class:`HeadToHeadStats`
+            The head-to-head stats. Empty if the player never engaged the target.
+        """
+        return self._matrix.get((player.puuid, target.puuid)) or HeadToHeadStats()
+
+    def total(self, players: Iterable[MatchPlayer], targets: Iterable[MatchPlayer]) -> HeadToHeadStats:
+        """Sums what a group of players did to a group of targets.
+
+        Parameters
+        ----------
+        players: Iterable[:class:`MatchPlayer`]
+            The players that dealt the kills and damage.
+        targets: Iterable[:class:`MatchPlayer`]
+            The players that received them.
+
+        Returns
+        -------
+        :class:`HeadToHeadStats`
+            The summed head-to-head stats.
+        """
+        target_ids = [target.puuid for target in targets]
+        result = HeadToHeadStats()
+        for player in players:
+            for target_id in target_ids:
+                entry = self._matrix.get((player.puuid, target_id))
+                if entry is not None:
+                    result += entry
+        return result
+
+    def team(self, team: Team, opponent: Team) -> HeadToHeadStats:
+        """Sums what the members of a team did to the members of another team.
+
+        Parameters
+        ----------
+        team: :class:`Team`
+            The team that dealt the kills and damage.
+        opponent: :class:`Team`
+            The team that received them.
+
+        Returns
+        -------
+        :class:`HeadToHeadStats`
+            The summed head-to-head stats.
+        """
+        return self.total(team.members, opponent.members)
+
+
 class OpponentStats:
     def __init__(self, match: MatchDetails, player: MatchPlayer, player_opponent: MatchPlayer) -> None:
         self.match: MatchDetails = match
         self.player: MatchPlayer = player  # me (the player)
         self.opponent: MatchPlayer = player_opponent
 
+        head_to_head = match.head_to_head
+        dealt = head_to_head.get(player, player_opponent)
+        received = head_to_head.get(player_opponent, player)
+
         # player stats
-        self.kills: int = 0
-        self.assists: int = 0
-        self.deaths: int = 0
-        self.damages: int = 0
-        self.head_shots: int = 0
-        self.body_shots: int = 0
-        self.leg_shots: int = 0
+        self.kills: int = dealt.kills
+        self.assists: int = dealt.assists
+        self.deaths: int = received.kills
+        self.damages: int = dealt.damages
+        self.head_shots: int = dealt.head_shots
+        self.body_shots: int = dealt.body_shots
+        self.leg_shots: int = dealt.leg_shots
 
         # player opponent stats
-        self.opponent_kills: int = 0
-        self.opponent_assists: int = 0
-        self.opponent_deaths: int = 0
-        self.opponent_damages: int = 0
-        self.opponent_head_shots: int = 0
-        self.opponent_body_shots: int = 0
-        self.opponent_leg_shots: int = 0
-
-        self.__fill_stats()
+        self.opponent_kills: int = received.kills
+        self.opponent_assists: int = received.assists
+        self.opponent_deaths: int = dealt.kills
+        self.opponent_damages: int = received.damages
+        self.opponent_head_shots: int = received.head_shots
+        self.opponent_body_shots: int = received.body_shots
+        self.opponent_leg_shots: int = received.leg_shots
 
     def __repr__(self) -> str:
         attrs = [
@@ -318,49 +531,10 @@ class OpponentStats:
         """:class:`str`: Returns the player's KDA."""
         return f'{self.kills}/{self.deaths}/{self.assists}'
 
-    def __fill_stats(self) -> None:
-        for kill in self.match.kills:
-            if kill.killer == self.player and kill.victim == self.opponent:
-                self.kills += 1
-                self.opponent_deaths += 1
-
-            if kill.killer == self.opponent and kill.victim == self.player:
-                self.opponent_kills += 1
-                self.deaths += 1
-
-            if kill.killer is not None:
-                if kill.killer.team != self.player.team:
-                    if kill.victim == self.player:
-                        for assist in kill.assistants:
-                            if assist == self.opponent:
-                                self.opponent_assists += 1
-
-            else:
-                if kill.victim == self.opponent:
-                    for assist in kill.assistants:
-                        if assist == self.player:
-                            self.assists += 1
-
-        for round_result in self.match.round_results:
-            for stat in round_result.player_stats:
-                if stat.player == self.player:
-                    for dmg in stat.damage:
-                        if dmg.receiver == self.opponent:
-                            self.head_shots += dmg.head_shots
-                            self.body_shots += dmg.body_shots
-                            self.leg_shots += dmg.leg_shots
-                            self.damages += dmg.damage
-
-                if stat.player == self.opponent:
-                    for dmg in stat.damage:
-                        if dmg.receiver == self.player:
-                            self.opponent_head_shots += dmg.head_shots
-                            self.opponent_body_shots += dmg.body_shots
-                            self.opponent_leg_shots += dmg.leg_shots
-                            self.opponent_damages += dmg.damage
-
 
 class Location:
+    __slots__ = ('x', 'y')
+
     def __init__(self, data: LocationPayload) -> None:
         self.x: int = data['x']
         self.y: int = data['y']
@@ -376,6 +550,8 @@ class Location:
 
 
 class SpikePlant:
+    __slots__ = ('match', '_planter_id', 'site', 'round_time', 'location', 'player_locations', '_planter')
+
     def __init__(self, match: MatchDetails, data: RoundResultPayload) -> None:
         self.match: MatchDetails = match
         self._planter_id: Optional[str] = data.get('bombPlanter', None)
@@ -417,6 +593,8 @@ class SpikePlant:
 
 
 class SpikeDefuse:
+    __slots__ = ('match', '_defuser_id', 'round_time', 'location', 'player_locations', '_defuser')
+
     def __init__(self, match: MatchDetails, data: RoundResultPayload) -> None:
         self.match: MatchDetails = match
         self._defuser_id: Optional[str] = data.get('bombDefuser', None)
@@ -453,6 +631,8 @@ class SpikeDefuse:
 
 
 class Spike:
+    __slots__ = ('plant', 'defuse')
+
     def __init__(self, match: MatchDetails, data: RoundResultPayload) -> None:
         self.plant: Optional[SpikePlant] = None
         self.defuse: Optional[SpikeDefuse] = None
@@ -495,6 +675,8 @@ class Spike:
 
 
 class PlayerLocation:
+    __slots__ = ('subject', 'view_radians', 'location')
+
     def __init__(self, data: PlayerLocationPayload) -> None:
         self.subject: str = data['subject']
         self.view_radians: float = data['viewRadians']
@@ -517,6 +699,8 @@ class PlayerLocation:
 
 
 class FinishingDamage:
+    __slots__ = ('match', 'type', '_item_uuid', '_is_secondary_fire_mode')
+
     def __init__(self, match: MatchDetails, data: FinishingDamagePayload) -> None:
         self.match: MatchDetails = match
         self.type: str = data.get('damageType')
@@ -549,6 +733,21 @@ class FinishingDamage:
 
 
 class Kill:
+    __slots__ = (
+        'match',
+        'game_time',
+        'round_time',
+        '_killer_uuid',
+        '_victim_uuid',
+        'victim_location',
+        '_assistants_list',
+        'player_locations',
+        'finishing_damage',
+        '_killer',
+        '_victim',
+        '_assistants',
+    )
+
     def __init__(self, match: MatchDetails, data: RoundPlayerStatKillPayload) -> None:
         self.match: MatchDetails = match
         self.game_time: int = data['gameTime']
@@ -597,6 +796,8 @@ class Kill:
 
 
 class Damage:
+    __slots__ = ('match', '_receiver_uuid', 'damage', 'head_shots', 'body_shots', 'leg_shots', '_receiver')
+
     def __init__(self, match: MatchDetails, data: RoundPlayerDamagePayload) -> None:
         self.match: MatchDetails = match
         self._receiver_uuid: str = data['receiver']
@@ -624,6 +825,8 @@ class Damage:
 
 
 class Economy:
+    __slots__ = ('match', 'loadout_value', '_weapon', '_armor', 'remaining', 'spent')
+
     def __init__(self, match: MatchDetails, data: EconomyPayload) -> None:
         self.match: MatchDetails = match
         self.loadout_value: int = data.get('loadoutValue', 0)
@@ -670,6 +873,8 @@ class Economy:
 
 
 class RoundDamage:
+    __slots__ = ('match', '_receiver_uuid', 'damage', 'round')
+
     def __init__(self, match: MatchDetails, data: RoundDamagePayload) -> None:
         self.match: MatchDetails = match
         self._receiver_uuid: str = data.get('receiver')
@@ -692,6 +897,19 @@ class RoundDamage:
 
 
 class RoundPlayerStat:
+    __slots__ = (
+        '_match',
+        'subject',
+        'kills',
+        'damage',
+        'score',
+        'economy',
+        'ability',
+        'was_afk',
+        'was_penalized',
+        'stayed_in_spawn',
+    )
+
     def __init__(self, match: MatchDetails, data: RoundPlayerStatsPayload) -> None:
         self._match: MatchDetails = match
         self.subject: str = data.get('subject')
@@ -762,6 +980,8 @@ class RoundPlayerStat:
 
 
 class RoundPlayerEconomy(Economy):
+    __slots__ = ('subject', 'player')
+
     def __init__(self, match: MatchDetails, data: RoundPlayerEconomyPayload) -> None:
         super().__init__(match, data)
         self.subject: str = data['subject']
@@ -791,6 +1011,8 @@ class RoundPlayerEconomy(Economy):
 
 
 class RoundPlayerScore:
+    __slots__ = ('_match', 'subject', 'score')
+
     def __init__(self, match: MatchDetails, data: RoundPlayerScorePayload) -> None:
         self._match: MatchDetails = match
         self.subject: str = data['subject']
@@ -814,6 +1036,19 @@ class RoundPlayerScore:
 
 
 class RoundResult:
+    __slots__ = (
+        '_match',
+        'round_number',
+        'round_result',
+        'round_ceremony',
+        'winning_team',
+        'spike',
+        'round_result_code',
+        'player_stats',
+        'player_economies',
+        'player_scores',
+    )
+
     def __init__(self, match: MatchDetails, data: RoundResultPayload) -> None:
         self._match = match
         self.round_number: int = data['roundNum']
@@ -907,6 +1142,8 @@ class PlatformInfo:
 
 
 class AbilityCasts:
+    __slots__ = ('agent', '_grenade_casts', '_ability1_casts', '_ability2_casts', '_ultimate_casts')
+
     def __init__(self, agent: Agent, data: AbilityCastsPayload) -> None:
         self.agent: Agent = agent
         self._grenade_casts: int = data['grenadeCasts']
@@ -971,6 +1208,26 @@ class AbilityCasts:
 
 
 class PlayerStats:
+    # counters derived from the round results, see MatchDetails._load_rounds
+    _ROUND_STATS = (
+        'first_kills',
+        'first_deaths',
+        'plants',
+        'defuses',
+        'damages',
+        'head_shots',
+        'body_shots',
+        'leg_shots',
+        'multi_kills',
+        'ace',
+        'head_shot_percent',
+        'body_shot_percent',
+        'leg_shot_percent',
+        'afk_time',
+        'penalized_time',
+        'stayed_in_spawn',
+    )
+
     def __init__(self, agent: Optional[Agent], data: PlayerStatsPayload) -> None:
         self.agent: Optional[Agent] = agent
         self.score: int = data['score']
@@ -982,6 +1239,22 @@ class PlayerStats:
         self.ability_casts: Optional[AbilityCasts] = None
         if data.get('abilityCasts') is not None and self.agent is not None:
             self.ability_casts = AbilityCasts(self.agent, data['abilityCasts'])
+        self._round_loader: Optional[Callable[[], None]] = None
+
+    def __getattr__(self, name: str) -> Any:
+        # the round counters of a lazy match are only set once its rounds are built
+        if name in self._ROUND_STATS and self._round_loader is not None:
+            self._round_loader()
+            return getattr(self, name)
+        raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {name!r}')
+
+    def _defer_round_stats(self, loader: Callable[[], None]) -> None:
+        for name in self._ROUND_STATS:
+            self.__dict__.pop(name, None)
+        self._round_loader = loader
+
+    def _reset_round_stats(self) -> None:
+        self._round_loader = None
         self.first_kills: int = 0
         self.first_deaths: int = 0
         self.plants: int = 0
@@ -1067,9 +1340,8 @@ class MatchPlayer(User):  # Player
         self._character_id = data['characterId']
         self.agent: Optional[Agent] = match._client.valorant_api.get_agent(self._character_id)
         self.stats: PlayerStats = PlayerStats(self.agent, data['stats'])
-        self.round_damage: List[RoundDamage] = []
-        if data['roundDamage'] is not None:
-            self.round_damage = [RoundDamage(match, damage) for damage in data['roundDamage']]
+        self._round_damage_data: Optional[List[RoundDamagePayload]] = data['roundDamage']
+        self._round_damage: Optional[List[RoundDamage]] = None
         self.competitive_tier: Optional[Tier] = match._client.valorant_api.get_tier(
             season_id=match.match_info.season_id, tier=data['competitiveTier']
         )
@@ -1094,10 +1366,17 @@ class MatchPlayer(User):  # Player
 
     def init(self) -> None:
         self.team = self._match.get_team(self.team_id)
-        self.stats._update()
         if self._match.winning_team is not None and self.team == self._match.winning_team:
             self._is_winner = True
 
+    @property
+    def round_damage(self) -> List[RoundDamage]:
+        """:class:`List[RoundDamage]`: The damage this player dealt per round."""
+        if self._round_damage is None:
+            self._round_damage = [RoundDamage(self._match, damage) for damage in self._round_damage_data or []]
+            self._round_damage_data = None
+        return self._round_damage
+
     def is_winner(self) -> bool:
         """:class:`bool`: whether the player is on the winning team"""
         return self._is_winner
@@ -1120,7 +1399,21 @@ class MatchPlayer(User):  # Player
 
 
 class MatchDetails:
-    def __init__(self, client: Client, data: MatchDetailsPayload) -> None:
+    """Represents the details of a match.
+
+    Parameters
+    ----------
+    client: :class:`Client`
+        The client that fetched this match.
+    data: Dict[:class:`str`, Any]
+        The raw match details payload.
+    lazy: :class:`bool`
+        Whether to defer building the round results, kills and the round-derived
+        player stats until one of them is first accessed. The match info, players,
+        teams and scoreboard are always built up front.
+    """
+
+    def __init__(self, client: Client, data: MatchDetailsPayload, *, lazy: bool = False) -> None:
         self._client = client
         self.match_info: MatchInfo = MatchInfo(client, data['matchInfo'])
         self._players: Dict[str, MatchPlayer] = {
@@ -1129,13 +1422,13 @@ class MatchDetails:
         self.bots: List[Any] = data['bots']
         self.coaches: Dict[str, Coach] = {coach['subject']: Coach(self, coach) for coach in data['coaches']}
         self._teams: Dict[str, Team] = {team['teamId']: Team(team, self) for team in data['teams']}
-        self.round_results: List[RoundResult] = [
-            RoundResult(self, round_result) for round_result in data['roundResults']
-        ]
-        self.kills: List[Kill] = []
-        for round_result in self.round_results:
-            for player in round_result.player_stats:
-                self.kills.extend(player.kills)
+        self._round_results_data: Optional[List[RoundResultPayload]] = data['roundResults']
+        self._round_results: Optional[List[RoundResult]] = None
+        self._kills: Optional[List[Kill]] = None
+        self._head_to_head: Optional[HeadToHead] = None
+        self.match_info._is_surrendered = any(
+            round_result['roundResultCode'].lower() == 'surrendered' for round_result in data['roundResults']
+        )
         self.winning_team: Optional[Team] = None  # Union[Team, MatchPlayer]
         for team in self.teams:
             if team.is_won():
@@ -1144,11 +1437,45 @@ class MatchDetails:
         self._player_mvp: Optional[MatchPlayer] = None
         self._player_team_mvp: Optional[MatchPlayer] = None
 
+        if lazy:
+            for player in self.players:
+                player.stats._defer_round_stats(self._load_rounds)
+        else:
+            self._load_rounds()
         self._player_init()
 
     def __repr__(self) -> str:
         return f'<MatchDetails id={self.match_info.match_id!r} map={self.match_info.map!r} started_at={self.match_info.started_at!r} >'
 
+    def _load_rounds(self) -> None:
+        data = self._round_results_data
+        if data is None:
+            return
+
+        for player in self.players:
+            player.stats._reset_round_stats()
+
+        # building the rounds fills in the round counters of the players' stats
+        try:
+            round_results = [RoundResult(self, round_result) for round_result in data]
+        except BaseException:
+            # the half-filled counters are dropped, the next access builds the rounds again
+            for player in self.players:
+                player.stats._defer_round_stats(self._load_rounds)
+            raise
+
+        kills: List[Kill] = []
+        for round_result in round_results:
+            for player in round_result.player_stats:
+                kills.extend(player.kills)
+
+        for player in self.players:
+            player.stats._update()
+
+        self._round_results = round_results
+        self._kills = kills
+        self._round_results_data = None
+
     def _player_init(self) -> None:
         for player in self.players:
             player.init()
@@ -1172,6 +1499,25 @@ class MatchDetails:
         """:class:`datetime.datetime`: The time this match started."""
         return datetime.datetime.fromtimestamp(self.match_info.game_start_millis / 1000)
 
+    @property
+    def round_results(self) -> List[RoundResult]:
+        """:class:`List[RoundResult]`: The results of each round in this match."""
+        self._load_rounds()
+        return self._round_results  # type: ignore # set by _load_rounds
+
+    @property
+    def kills(self) -> List[Kill]:
+        """:class:`List[Kill]`: Every kill in this match, in round order."""
+        self._load_rounds()
+        return self._kills  # type: ignore # set by _load_rounds
+
+    @property
+    def head_to_head(self) -> HeadToHead:
+        """:class:`HeadToHead`: The head-to-head matrix of this match, built on first access."""
+        if self._head_to_head is None:
+            self._head_to_head = HeadToHead(self)
+        return self._head_to_head
+
     # players
 
     @property
@@ -1217,6 +1563,22 @@ class MatchDetails:
 
     # helpers
 
+    def to_columns(self) -> MatchColumns:
+        """Builds columnar NumPy tables of the kills, assists, damage, economy and
+        player locations of this match. Requires :mod:`numpy`.
+
+        Returns
+        -------
+        :class:`MatchColumns`
+            The columnar tables of this match.
+
+        Raises
+        ------
+        RuntimeError
+            numpy is not installed.
+        """
+        return MatchColumns(self)
+
     def is_draw(self) -> bool:
         blue_team = self.get_team('Blue')
         red_team = self.get_team('Red')
@@ -100,7 +100,7 @@ class SeasonalInfo:
 
         competitive_season: Optional[CompetitiveSeason] = None
 
-        competitive_season = self._client.valorant_api.get_competitive_season_season_id(self.season_id)
+        competitive_season = self._client.valorant_api.get_competitive_season_by_season_id(self.season_id)
         if competitive_season is None:
             return None
 
@@ -77,6 +77,17 @@ class PartyPlayer:
 
 
 class PlayerIdentity:
+    __slots__ = (
+        '_client',
+        'Subject',
+        'player_card_id',
+        'player_title_id',
+        'account_level',
+        'preferred_level_border_id',
+        'incognito',
+        'hide_account_level',
+    )
+
     def __init__(self, client: Client, data: PlayerIdentityPayload) -> None:
         self._client = client
         self.Subject: str = data['Subject']
@@ -101,6 +112,8 @@ class PlayerIdentity:
 
 
 class Ping:
+    __slots__ = ('ping', 'game_pod_id')
+
     def __init__(self, data: PingPayload) -> None:
         self.ping: int = data['Ping']
         self.game_pod_id: str = data['GamePodID']
@@ -115,6 +128,24 @@ class Ping:
 
 
 class PartyMember:
+    __slots__ = (
+        '_client',
+        '_party',
+        '_game_name',
+        '_tag_line',
+        'subject',
+        '_competitive_tier',
+        'identity',
+        'seasonal_badge_info',
+        '_is_owner',
+        'queue_eligible_remaining_account_levels',
+        'pings',
+        '_is_ready',
+        '_is_moderator',
+        'use_broadcast_hud',
+        'platform_type',
+    )
+
     def __init__(self, party: Party, data: MemberPayload) -> None:
         self._client = party._client
         self._party = party
@@ -154,7 +185,7 @@ class PartyMember:
         if season_act is MISSING:
             return None
 
-        competitive_season = self._client.valorant_api.get_competitive_season_season_id(str(season_act.id))
+        competitive_season = self._client.valorant_api.get_competitive_season_by_season_id(str(season_act.id))
         if competitive_season is None:
             return None
 
@@ -512,8 +543,10 @@ class Party:
         if len(self.members) == 0:
             return
         puuids = [member.id for member in self.members if member.game_name is None or member.tag_line is None]
-        name_service = await self._client.fetch_player_name_by_puuid(puuid=puuids)
-        for name in name_service:
+        if not puuids:
+            return
+        names = await self._client.resolve_player_names(puuids)
+        for name in names.values():
             member = self.get_member(name.subject)
             if member is not None:
                 member.update_riot_id(name.game_name, name.tag_line)
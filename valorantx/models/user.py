@@ -91,15 +91,8 @@ class User(ClientUser):
         return f'<User puuid={self.puuid!r} game_name={self.game_name!r} tag_line={self.tag_line!r} region={self.region!r}>'
 
     async def refresh_identities(self) -> None:
-        match_history = await self._client.fetch_match_history(puuid=self.puuid, end=1, with_details=True)
-        for match in match_history:
-            for player in match.players:
-                if player.puuid != self.puuid:
-                    continue
-                self.game_name = player.game_name
-                self.tag_line = player.tag_line
-                # self.player_card = player.player_card
-                # self.player_title = player.player_title
-                # self.level_border = player.level_border
-                # self.account_level = player.account_level
-                # self.last_update = match.started_at
+        name = await self._client.resolve_player_name(self.puuid)
+        if name is None:
+            return
+        self.game_name = name.game_name
+        self.tag_line = name.tag_line
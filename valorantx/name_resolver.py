@@ -0,0 +1,235 @@
+# Copyright (c) 2023-present STACiA
+# Licensed under the MIT
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+from .models.name_service import NameService
+
+if TYPE_CHECKING:
+    from .client import Client
+
+# fmt: off
+__all__ = (
+    'NameResolver',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+
+
+class NameResolver:
+    """Resolves puuids into Riot IDs with as few name service requests as possible.
+
+    Lookups made within ``window`` seconds of each other are sent together in
+    one ``PUT /name-service/v2/players``, split into chunks of ``batch_size``
+    puuids. A puuid already being looked up is not sent again, and the
+    results are cached for ``ttl`` seconds, so resolving the ten players of a
+    match costs one request and resolving them again costs none.
+
+    Every :class:`Client` has one, see :meth:`Client.resolve_player_names`.
+
+    Parameters
+    ----------
+    client: :class:`Client`
+        The client whose session makes the requests.
+    ttl: :class:`float`
+        The amount of seconds a resolved name is cached for.
+    window: :class:`float`
+        The amount of seconds lookups are collected for before they are sent.
+    batch_size: :class:`int`
+        The most puuids sent in one request.
+    max_size: :class:`int`
+        The most names kept in the cache, the least recently resolved are dropped first.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        *,
+        ttl: float = 300.0,
+        window: float = 0.02,
+        batch_size: int = 100,
+        max_size: int = 10000,
+    ) -> None:
+        if batch_size < 1 or max_size < 1:
+            raise ValueError('batch_size and max_size must be at least 1')
+        self._client: Client = client
+        self.ttl: float = ttl
+        self.window: float = window
+        self.batch_size: int = batch_size
+        self.max_size: int = max_size
+        # puuid -> (expires at, name)
+        self._cache: OrderedDict[str, Tuple[float, NameService]] = OrderedDict()
+        # puuid -> the result of a lookup queued or in flight
+        self._pending: Dict[str, asyncio.Future[Optional[NameService]]] = {}
+        self._queue: List[str] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    def __repr__(self) -> str:
+        attrs = [
+            ('ttl', self.ttl),
+            ('window', self.window),
+            ('cached', len(self._cache)),
+            ('pending', len(self._pending)),
+        ]
+        joined = ' '.join('%s=%r' % t for t in attrs)
+        return f'<{self.__class__.__name__} {joined}>'
+
+    def get(self, puuid: str) -> Optional[NameService]:
+        """Returns the cached name of the given puuid, ``None`` if it is not cached or expired."""
+        entry = self._cache.get(puuid)
+        if entry is None:
+            return None
+        expires_at, name = entry
+        if expires_at <= time.monotonic():
+            del self._cache[puuid]
+            return None
+        return name
+
+    def invalidate(self, puuid: str) -> None:
+        """Drops the cached name of the given puuid, e.g. after the player changed their Riot ID."""
+        self._cache.pop(puuid, None)
+
+    def clear(self) -> None:
+        """Drops every cached name and cancels the lookups in progress.
+
+        Callers waiting for a cancelled lookup get a :exc:`RuntimeError`.
+        """
+        self._cache.clear()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for task in self._tasks:
+            task.cancel()
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._queue.clear()
+
+    async def resolve(self, puuid: str) -> Optional[NameService]:
+        """|coro|
+
+        Resolves the name of one player.
+
+        Parameters
+        ----------
+        puuid: :class:`str`
+            The puuid of the player.
+
+        Returns
+        -------
+        Optional[:class:`NameService`]
+            The name of the player, ``None`` if the name service does not know the puuid.
+        """
+        names = await self.resolve_many((puuid,))
+        return names.get(puuid)
+
+    async def resolve_many(self, puuids: Iterable[str]) -> Dict[str, NameService]:
+        """|coro|
+
+        Resolves the names of several players.
+
+        Parameters
+        ----------
+        puuids: Iterable[:class:`str`]
+            The puuids of the players.
+
+        Raises
+        ------
+        HTTPException
+            Looking the names up failed.
+        RuntimeError
+            :meth:`clear` was called while the names were being looked up.
+
+        Returns
+        -------
+        Dict[:class:`str`, :class:`NameService`]
+            The names by puuid. Puuids the name service does not know are missing.
+        """
+        resolved: Dict[str, NameService] = {}
+        waiting: Dict[str, asyncio.Future[Optional[NameService]]] = {}
+        for puuid in dict.fromkeys(puuids):
+            name = self.get(puuid)
+            if name is not None:
+                resolved[puuid] = name
+            else:
+                waiting[puuid] = self._enqueue(puuid)
+
+        if not waiting:
+            return resolved
+
+        # the futures are shared with other callers, wait without cancelling them
+        await asyncio.wait(waiting.values())
+        for puuid, future in waiting.items():
+            if future.cancelled():
+                # clear() cancelled the lookup, not this caller, a CancelledError would be mistaken for its own
+                raise RuntimeError('name resolver was cleared')
+            name = future.result()
+            if name is not None:
+                resolved[puuid] = name
+        return resolved
+
+    def _enqueue(self, puuid: str) -> asyncio.Future[Optional[NameService]]:
+        future = self._pending.get(puuid)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = self._pending[puuid] = loop.create_future()
+        # a caller that gave up must not leave the exception unretrieved
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._queue.append(puuid)
+        if len(self._queue) >= self.batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        queue, self._queue = self._queue, []
+        for index in range(0, len(queue), self.batch_size):
+            task = asyncio.get_running_loop().create_task(self._fetch(queue[index : index + self.batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, puuids: List[str]) -> None:
+        _log.debug('resolving the names of %s player(s)', len(puuids))
+        try:
+            data = await self._client.http.get_name_service_players(puuids)
+        except asyncio.CancelledError:
+            for puuid in puuids:
+                future = self._pending.pop(puuid, None)
+                if future is not None:
+                    future.cancel()
+            raise
+        except Exception as e:
+            for puuid in puuids:
+                future = self._pending.pop(puuid, None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+
+        expires_at = time.monotonic() + self.ttl
+        names: Dict[str, NameService] = {}
+        for payload in data:
+            name = NameService(data=payload)
+            names[name.subject] = name
+            self._cache[name.subject] = (expires_at, name)
+            self._cache.move_to_end(name.subject)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+        for puuid in puuids:
+            future = self._pending.pop(puuid, None)
+            if future is not None and not future.done():
+                future.set_result(names.get(puuid))
@@ -0,0 +1,284 @@
+# Copyright (c) 2023-present STACiA
+# Licensed under the MIT
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
+
+from .client import Client
+from .enums import Locale, Region
+from .http import ConnectionPool
+from .utils import MISSING
+from .valorant_api_client import Client as ValorantAPIClient
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+# fmt: off
+__all__ = (
+    'ClientPool',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+
+
+class ClientPool:
+    """Serves many accounts from one asset cache and one connection pool.
+
+    Every :class:`Client` created by the pool keeps its own Riot tokens and
+    headers, but borrows the pool's connection pool and the valorant-api asset
+    cache of its locale. The catalogue is downloaded and parsed once per
+    locale instead of once per account.
+
+    Parameters
+    ----------
+    connection_pool: Optional[:class:`ConnectionPool`]
+        The connection pool shared by every client. One is created if not given.
+    asset_snapshot_path: Optional[Union[:class:`str`, :class:`os.PathLike`]]
+        A directory to keep one asset cache snapshot per locale in.
+        See the ``asset_snapshot_path`` parameter of :class:`Client`.
+    **options: Any
+        Extra keyword arguments passed to every :class:`Client`,
+        such as ``re_authorize``, ``max_ratelimit_timeout``, ``instrumentation``
+        or ``retry_policy``. A retry policy passed here is shared, so is its retry budget.
+    """
+
+    def __init__(
+        self,
+        *,
+        connection_pool: Optional[ConnectionPool] = None,
+        asset_snapshot_path: Optional[Union[str, os.PathLike[str]]] = None,
+        **options: Any,
+    ) -> None:
+        self._owns_connection_pool: bool = connection_pool is None
+        if connection_pool is None:
+            instrumentation = options.get('instrumentation')
+            trace_configs = [instrumentation.trace_config()] if instrumentation is not None else []
+            connection_pool = ConnectionPool(trace_configs=trace_configs)
+        self.connection_pool: ConnectionPool = connection_pool
+        self.asset_snapshot_path: Optional[str] = (
+            os.fspath(asset_snapshot_path) if asset_snapshot_path is not None else None
+        )
+        self._options: Dict[str, Any] = options
+        self._valorant_apis: Dict[Locale, asyncio.Task[ValorantAPIClient]] = {}
+        self._clients: List[Client] = []
+        self._closed: bool = False
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} clients={len(self._clients)} locales={len(self._valorant_apis)}>'
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if not self.is_closed():
+            await self.close()
+
+    @property
+    def clients(self) -> List[Client]:
+        """List[:class:`Client`]: The clients created by this pool that are not closed yet."""
+        return list(self._clients)
+
+    def is_closed(self) -> bool:
+        """:class:`bool`: Whether the pool is closed."""
+        return self._closed
+
+    async def _init_valorant_api(self, locale: Locale) -> ValorantAPIClient:
+        snapshot_path = None
+        if self.asset_snapshot_path is not None:
+            snapshot_path = os.path.join(self.asset_snapshot_path, f'valorant-api-{locale}.snapshot')
+        valorant_api = ValorantAPIClient(self.connection_pool, locale, snapshot_path=snapshot_path)
+        await valorant_api.init()
+        _log.debug('shared asset cache ready for locale %s', locale)
+        return valorant_api
+
+    async def fetch_valorant_api(self, locale: Locale = Locale.american_english) -> ValorantAPIClient:
+        """|coro|
+
+        Gets the shared asset cache of the given locale, loading it on first use.
+
+        Concurrent calls for the same locale wait for the same load.
+
+        Parameters
+        ----------
+        locale: :class:`Locale`
+            The locale of the asset cache.
+
+        Returns
+        -------
+        :class:`valorantx.valorant_api_client.Client`
+            The shared, ready asset cache.
+        """
+        if self._closed:
+            raise RuntimeError('ClientPool is closed')
+
+        task = self._valorant_apis.get(locale)
+        if task is None or (task.done() and task.exception() is not None):
+            loop = asyncio.get_running_loop()
+            task = self._valorant_apis[locale] = loop.create_task(self._init_valorant_api(locale))
+        return await asyncio.shield(task)
+
+    async def create_client(
+        self,
+        *,
+        region: Region = MISSING,
+        locale: Locale = Locale.american_english,
+        **options: Any,
+    ) -> Client:
+        """|coro|
+
+        Creates a client that shares this pool's connection pool and asset cache.
+        The client still has to be authorized.
+
+        Parameters
+        ----------
+        region: :class:`Region`
+            The region of the account.
+        locale: :class:`Locale`
+            The locale of the client.
+        **options: Any
+            Keyword arguments passed to :class:`Client`, overriding the pool's defaults.
+
+        Returns
+        -------
+        :class:`Client`
+            The new client.
+        """
+        valorant_api = await self.fetch_valorant_api(locale)
+        kwargs = {**self._options, **options}
+        client = Client(
+            region=region,
+            locale=locale,
+            connection_pool=self.connection_pool,
+            valorant_api=valorant_api,
+            **kwargs,
+        )
+        self._clients.append(client)
+        return client
+
+    async def authorize(
+        self,
+        username: str,
+        password: str,
+        *,
+        region: Region = MISSING,
+        locale: Locale = Locale.american_english,
+        **options: Any,
+    ) -> Client:
+        """|coro|
+
+        Creates a client and authorizes it with the given username and password.
+
+        Parameters
+        ----------
+        username: :class:`str`
+            The username of the account to authorize.
+        password: :class:`str`
+            The password of the account to authorize.
+        region: :class:`Region`
+            The region of the account.
+        locale: :class:`Locale`
+            The locale of the client.
+        **options: Any
+            Keyword arguments passed to :class:`Client`, overriding the pool's defaults.
+
+        Returns
+        -------
+        :class:`Client`
+            The authorized client.
+        """
+        client = await self.create_client(region=region, locale=locale, **options)
+        try:
+            await client.authorize(username, password)
+        except BaseException:
+            await self.remove(client)
+            raise
+        return client
+
+    async def authorize_from_data(
+        self,
+        auth_data: Dict[str, Any],
+        *,
+        region: Region = MISSING,
+        locale: Locale = Locale.american_english,
+        **options: Any,
+    ) -> Client:
+        """|coro|
+
+        Creates a client and authorizes it with the given auth data.
+
+        Parameters
+        ----------
+        auth_data: Dict[:class:`str`, Any]
+            The data of the account to authorize.
+        region: :class:`Region`
+            The region of the account.
+        locale: :class:`Locale`
+            The locale of the client.
+        **options: Any
+            Keyword arguments passed to :class:`Client`, overriding the pool's defaults.
+
+        Returns
+        -------
+        :class:`Client`
+            The authorized client.
+        """
+        client = await self.create_client(region=region, locale=locale, **options)
+        try:
+            await client.authorize_from_data(auth_data)
+        except BaseException:
+            await self.remove(client)
+            raise
+        return client
+
+    async def remove(self, client: Client) -> None:
+        """|coro|
+
+        Closes a client and removes it from the pool.
+        The shared asset cache and connection pool stay open.
+
+        Parameters
+        ----------
+        client: :class:`Client`
+            The client to remove.
+        """
+        try:
+            self._clients.remove(client)
+        except ValueError:
+            pass
+        if not client.is_closed():
+            await client.close()
+
+    async def close(self) -> None:
+        """|coro|
+
+        Closes every client, the shared asset caches and, if the pool created it, the connection pool.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        for client in list(self._clients):
+            await self.remove(client)
+
+        for task in self._valorant_apis.values():
+            if not task.done():
+                task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            if not task.cancelled() and task.exception() is None:
+                await task.result().close()
+        self._valorant_apis.clear()
+
+        if self._owns_connection_pool:
+            await self.connection_pool.close()
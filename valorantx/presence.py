@@ -0,0 +1,265 @@
+# Copyright (c) 2023-present STACiA
+# Licensed under the MIT
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterator, Literal, Optional, TypeVar
+
+from .errors import HTTPException, NotFound
+from .models.coregame import CoreGameMatch
+from .models.party import Party
+from .models.pregame import PreGameMatch, PreGameMatchPlayer
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .types.pregame import Match as PreGameMatchPayload, MatchPlayer as PreGameMatchPlayerPayload
+
+    T = TypeVar('T')
+
+# fmt: off
+__all__ = (
+    'PresencePoller',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+
+Phase = Literal['idle', 'matchmaking', 'pregame', 'ingame']
+
+# party states that can turn into a match without passing through agent select, e.g. custom games
+_GAME_STARTING_STATES = frozenset({'MATCHMADE_GAME_STARTING', 'CUSTOM_GAME_STARTING'})
+
+
+def _pregame_players(data: PreGameMatchPayload) -> Iterator[PreGameMatchPlayerPayload]:
+    teams = list(data.get('Teams') or ())
+    for key in ('AllyTeam', 'EnemyTeam'):
+        team = data.get(key)
+        if team is not None and team not in teams:
+            teams.append(team)
+    for team in teams:
+        yield from team.get('Players') or ()
+
+
+class PresencePoller:
+    """Polls the party, pregame and coregame state of a :class:`Client` and dispatches events on change.
+
+    The interval adapts to the current phase: fast during agent select, slower
+    while queueing and in game, slowest while idle. Only the endpoints that can
+    change in the current phase are polled, and a payload is only parsed into a
+    model when its ``Version`` moved.
+
+    The following events are dispatched through :meth:`Client.dispatch`:
+
+    - ``on_party_update(before, after)``, ``before`` is ``None`` for the first party seen and
+      ``after`` is ``None`` once the player is no longer in a party.
+    - ``on_pregame_start(match)`` and ``on_pregame_update(before, after)``.
+    - ``on_agent_select(match, player)`` and ``on_agent_lock(match, player)``.
+    - ``on_match_start(match)`` and ``on_match_end(match)`` with a :class:`CoreGameMatch`.
+
+    Parameters
+    ----------
+    client: :class:`Client`
+        The authorized client to poll for.
+    idle_interval: :class:`float`
+        The seconds between polls while in the menus.
+    matchmaking_interval: :class:`float`
+        The seconds between polls while the party is in queue.
+    pregame_interval: :class:`float`
+        The seconds between polls during agent select.
+    ingame_interval: :class:`float`
+        The seconds between polls while in a match.
+    error_interval: :class:`float`
+        The most seconds to back off for after failed polls.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        *,
+        idle_interval: float = 10.0,
+        matchmaking_interval: float = 3.0,
+        pregame_interval: float = 1.0,
+        ingame_interval: float = 20.0,
+        error_interval: float = 60.0,
+    ) -> None:
+        self.client: Client = client
+        self.intervals: Dict[Phase, float] = {
+            'idle': idle_interval,
+            'matchmaking': matchmaking_interval,
+            'pregame': pregame_interval,
+            'ingame': ingame_interval,
+        }
+        self.error_interval: float = error_interval
+        self.phase: Phase = 'idle'
+        self.party: Optional[Party] = None
+        self.pregame: Optional[PreGameMatch] = None
+        self.coregame: Optional[CoreGameMatch] = None
+        self._party_version: Optional[int] = None
+        self._pregame_version: Optional[int] = None
+        self._pregame_selections: Dict[str, Any] = {}
+        self._checked_coregame: bool = False
+        self._failures: int = 0
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} phase={self.phase!r} running={self.is_running()!r}>'
+
+    def is_running(self) -> bool:
+        """:class:`bool`: Whether the poller is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Starts polling in the background. Does nothing if already running."""
+        if self.is_running():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run(), name='valorantx: presence')
+
+    def stop(self) -> None:
+        """Stops polling."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                interval = await self.poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._failures += 1
+                interval = min(self.intervals[self.phase] * 2**self._failures, self.error_interval)
+                _log.exception('presence poll failed, retrying in %.1f seconds', interval)
+            else:
+                self._failures = 0
+            await asyncio.sleep(interval)
+
+    async def _get(self, func: Callable[..., Awaitable[T]], *args: Any) -> Optional[T]:
+        try:
+            return await func(*args)
+        except NotFound:
+            return None
+        except HTTPException as e:
+            # the glz endpoints answer 400 RESOURCE_NOT_FOUND when the player is not in that state
+            if e.status == 400 and e.code == 'RESOURCE_NOT_FOUND':
+                return None
+            raise
+
+    async def poll(self) -> float:
+        """|coro|
+
+        Polls once and dispatches the events of what changed.
+
+        Returns
+        -------
+        :class:`float`
+            The seconds to wait before the next poll.
+        """
+        if self.phase == 'ingame' and await self._poll_coregame():
+            return self.intervals['ingame']
+
+        if self.phase == 'pregame':
+            if await self._poll_pregame():
+                return self.intervals['pregame']
+            # agent select is over, either the match started or it was dodged
+            if await self._poll_coregame():
+                return self.intervals['ingame']
+
+        http = self.client.http
+        pregame_player, _ = await asyncio.gather(self._get(http.get_pregame_player), self._poll_party())
+        if pregame_player is not None:
+            self._pregame_version = None
+            self._pregame_selections = {}
+            self.phase = 'pregame'
+            await self._poll_pregame(pregame_player['MatchID'])
+            return self.intervals['pregame']
+
+        state = getattr(self.party, 'state', None)
+        if not self._checked_coregame or state in _GAME_STARTING_STATES:
+            self._checked_coregame = True
+            if await self._poll_coregame():
+                return self.intervals['ingame']
+
+        self.phase = 'matchmaking' if state == 'MATCHMAKING' else 'idle'
+        return self.intervals[self.phase]
+
+    async def _poll_party(self) -> None:
+        http = self.client.http
+        player = await self._get(http.get_party_player)
+        data = None if player is None else await self._get(http.get_party, player['CurrentPartyID'])
+        before = self.party
+        if data is None:
+            # left the party or went offline, its state must not drive the phase any longer
+            if before is not None:
+                self.party = None
+                self._party_version = None
+                self.client.dispatch('party_update', before, None)
+            return
+        if data['Version'] == 0:
+            return
+        if before is not None and before.id == data['ID'] and self._party_version == data['Version']:
+            return
+
+        self._party_version = data['Version']
+        self.party = Party(self.client, data)
+        self.client.dispatch('party_update', before, self.party)
+
+    async def _poll_pregame(self, match_id: Optional[str] = None) -> bool:
+        if match_id is None:
+            if self.pregame is None:
+                return False
+            match_id = self.pregame.id
+
+        data = await self._get(self.client.http.get_pregame_match, match_id)
+        if data is None:
+            self.pregame = None
+            return False
+        if self._pregame_version == data['Version']:
+            return True
+
+        before = self.pregame
+        self._pregame_version = data['Version']
+        self.pregame = match = PreGameMatch(self.client, data)
+        if before is None:
+            self.client.dispatch('pregame_start', match)
+        else:
+            self.client.dispatch('pregame_update', before, match)
+
+        for raw in _pregame_players(data):
+            selection = (raw['CharacterID'], raw['CharacterSelectionState'])
+            previous = self._pregame_selections.get(raw['Subject'])
+            self._pregame_selections[raw['Subject']] = selection
+            if selection == previous or not selection[1]:
+                continue
+            player = PreGameMatchPlayer(self.client, raw)
+            if selection[1] == 'locked':
+                self.client.dispatch('agent_lock', match, player)
+            elif selection[1] == 'selected':
+                self.client.dispatch('agent_select', match, player)
+        return True
+
+    async def _poll_coregame(self) -> bool:
+        http = self.client.http
+        player = await self._get(http.get_coregame_player)
+        current = self.coregame
+        if player is not None and current is not None and player['MatchID'] == current.id:
+            return True
+
+        if current is not None:
+            self.coregame = None
+            self.client.dispatch('match_end', current)
+        if player is None:
+            self.phase = 'idle'
+            return False
+
+        data = await self._get(http.get_coregame_match, player['MatchID'])
+        if data is None:
+            self.phase = 'idle'
+            return False
+        self.pregame = None
+        self.phase = 'ingame'
+        self.coregame = CoreGameMatch(self.client, data)
+        self.client.dispatch('match_start', self.coregame)
+        return True
@@ -0,0 +1,567 @@
+# Copyright (c) 2023-present STACiA
+# Licensed under the MIT
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Tuple, TypeVar, Union
+
+from . import utils
+
+if TYPE_CHECKING:
+    from .http import Route
+
+    T = TypeVar('T')
+
+# fmt: off
+__all__ = (
+    'CachePolicy',
+    'CacheEntry',
+    'DEFAULT_CACHE_POLICIES',
+    'FileResponseCacheBackend',
+    'MemoryResponseCacheBackend',
+    'ResponseCache',
+    'ResponseCacheBackend',
+    'ResponseCacheStats',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+
+
+class CachePolicy:
+    """Represents how long the responses of a route are cached.
+
+    Parameters
+    ----------
+    ttl: :class:`float`
+        The amount of seconds a response is served from the cache without asking the server.
+    stale_while_revalidate: :class:`float`
+        The amount of seconds after ``ttl`` an expired response is still served
+        while a fresh one is fetched in the background. ``0`` disables it.
+    shared: :class:`bool`
+        Whether the response is the same for every account. A response that is
+        not shared is cached per puuid.
+    respect_cache_control: :class:`bool`
+        Whether ``Cache-Control`` response headers override ``ttl`` and ``stale_while_revalidate``.
+    """
+
+    __slots__ = ('ttl', 'stale_while_revalidate', 'shared', 'respect_cache_control')
+
+    def __init__(
+        self,
+        ttl: float,
+        *,
+        stale_while_revalidate: float = 0.0,
+        shared: bool = True,
+        respect_cache_control: bool = True,
+    ) -> None:
+        if ttl < 0 or stale_while_revalidate < 0:
+            raise ValueError('ttl and stale_while_revalidate must be at least 0')
+        self.ttl: float = ttl
+        self.stale_while_revalidate: float = stale_while_revalidate
+        self.shared: bool = shared
+        self.respect_cache_control: bool = respect_cache_control
+
+    def __repr__(self) -> str:
+        attrs = [(attr, getattr(self, attr)) for attr in self.__slots__]
+        joined = ' '.join('%s=%r' % t for t in attrs)
+        return f'<{self.__class__.__name__} {joined}>'
+
+
+# keyed by 'METHOD /path/{template}', the same string as the route's rate limit bucket
+DEFAULT_CACHE_POLICIES: Dict[str, CachePolicy] = {
+    'GET /content-service/v3/content': CachePolicy(3600.0, stale_while_revalidate=86400.0),
+    'GET /v1/config/{config_region}': CachePolicy(3600.0, stale_while_revalidate=86400.0),
+    'GET /store/v1/offers/': CachePolicy(3600.0, stale_while_revalidate=3600.0),
+    'GET /contract-definitions/v3/definitions': CachePolicy(3600.0, stale_while_revalidate=86400.0),
+    'GET /premier/v1/affinities/{premier_region}/premier-seasons': CachePolicy(3600.0, stale_while_revalidate=86400.0),
+    'GET /premier/v1/affinities/{premier_region}/premier-seasons/active': CachePolicy(
+        600.0, stale_while_revalidate=3600.0
+    ),
+    'GET /matchmaking/v1/queues/configs': CachePolicy(300.0, stale_while_revalidate=300.0),
+}
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parses a ``Cache-Control`` header into a :class:`dict` of lower cased directives."""
+    directives: Dict[str, Optional[str]] = {}
+    if not value:
+        return directives
+    for part in value.split(','):
+        name, sep, arg = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = arg.strip('"') if sep else None
+    return directives
+
+
+def _parse_seconds(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+class CacheEntry:
+    """Represents a cached response.
+
+    Attributes
+    ----------
+    data: Any
+        The decoded response payload. It is shared between callers and must not be mutated.
+    stored_at: :class:`float`
+        The UNIX time the response was stored at.
+    expires_at: :class:`float`
+        The UNIX time the response stops being fresh.
+    stale_until: :class:`float`
+        The UNIX time the response stops being served while it is revalidated.
+    """
+
+    __slots__ = ('data', 'stored_at', 'expires_at', 'stale_until')
+
+    def __init__(self, data: Any, stored_at: float, expires_at: float, stale_until: float) -> None:
+        self.data: Any = data
+        self.stored_at: float = stored_at
+        self.expires_at: float = expires_at
+        self.stale_until: float = stale_until
+
+    def __repr__(self) -> str:
+        attrs = [(attr, getattr(self, attr)) for attr in ('stored_at', 'expires_at', 'stale_until')]
+        joined = ' '.join('%s=%r' % t for t in attrs)
+        return f'<{self.__class__.__name__} {joined}>'
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """:class:`bool`: Whether the response can be served without asking the server."""
+        return (time.time() if now is None else now) < self.expires_at
+
+    def is_usable(self, now: Optional[float] = None) -> bool:
+        """:class:`bool`: Whether the response can be served at all, fresh or stale."""
+        return (time.time() if now is None else now) < self.stale_until
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {attr: getattr(self, attr) for attr in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> CacheEntry:
+        return cls(data['data'], data['stored_at'], data['expires_at'], data['stale_until'])
+
+
+class ResponseCacheBackend:
+    """The base class of the storage of a :class:`ResponseCache`.
+
+    Subclass it to keep responses somewhere other than memory or a local directory.
+    """
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        """|coro|
+
+        Gets the entry stored under the given key.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The cache key.
+
+        Returns
+        -------
+        Optional[:class:`CacheEntry`]
+            The stored entry, or ``None`` if nothing is stored.
+        """
+        raise NotImplementedError
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        """|coro|
+
+        Stores the entry under the given key.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The cache key.
+        entry: :class:`CacheEntry`
+            The entry to store.
+        """
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        """|coro|
+
+        Deletes the entry stored under the given key.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The cache key.
+        """
+        raise NotImplementedError
+
+    async def clear(self) -> None:
+        """|coro|
+
+        Deletes every entry.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """|coro|
+
+        Releases the resources held by the backend.
+        """
+        pass
+
+
+class MemoryResponseCacheBackend(ResponseCacheBackend):
+    """A :class:`ResponseCacheBackend` that keeps entries in a bounded in-memory LRU.
+
+    Parameters
+    ----------
+    max_size: :class:`int`
+        The maximum amount of entries kept.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1')
+        self.max_size: int = max_size
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} size={len(self._entries)} max_size={self.max_size}>'
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class FileResponseCacheBackend(ResponseCacheBackend):
+    """A :class:`ResponseCacheBackend` that keeps one JSON file per entry in a local directory.
+
+    Several processes can point at the same directory, a response fetched by
+    one of them is then served to all. Files are written atomically and disk
+    access runs in the default executor.
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The directory to keep the entries in. It is created if it does not exist.
+    """
+
+    SUFFIX = '.json'
+
+    def __init__(self, path: Union[str, os.PathLike[str]]) -> None:
+        self.path: str = os.fspath(path)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} path={self.path!r}>'
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, hashlib.sha1(key.encode('utf-8')).hexdigest() + self.SUFFIX)
+
+    def _get(self, key: str) -> Optional[CacheEntry]:
+        try:
+            with open(self._file(key), 'rb') as fp:
+                return CacheEntry.from_dict(utils._from_json(fp.read()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            _log.warning('ignoring unreadable response cache file for %r: %s', key, e)
+            return None
+
+    def _set(self, key: str, entry: CacheEntry) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        file = self._file(key)
+        tmp = f'{file}.{os.getpid()}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as fp:
+            fp.write(utils._to_json(entry.to_dict()))
+        os.replace(tmp, file)
+
+    def _delete(self, key: str) -> None:
+        try:
+            os.remove(self._file(key))
+        except FileNotFoundError:
+            pass
+
+    def _clear(self) -> None:
+        try:
+            names = os.listdir(self.path)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name.endswith(self.SUFFIX):
+                try:
+                    os.remove(os.path.join(self.path, name))
+                except FileNotFoundError:
+                    pass
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        return await self._run(self._get, key)
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        await self._run(self._set, key, entry)
+
+    async def delete(self, key: str) -> None:
+        await self._run(self._delete, key)
+
+    async def clear(self) -> None:
+        await self._run(self._clear)
+
+
+class ResponseCacheStats:
+    """Represents the counters of a :class:`ResponseCache`.
+
+    Attributes
+    ----------
+    hits: :class:`int`
+        The amount of lookups answered with a fresh response.
+    stale_hits: :class:`int`
+        The amount of lookups answered with an expired response while it was revalidated.
+    misses: :class:`int`
+        The amount of lookups that had to wait for the server.
+    writes: :class:`int`
+        The amount of responses stored.
+    revalidations: :class:`int`
+        The amount of background revalidations started.
+    """
+
+    __slots__ = ('hits', 'stale_hits', 'misses', 'writes', 'revalidations')
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.stale_hits: int = 0
+        self.misses: int = 0
+        self.writes: int = 0
+        self.revalidations: int = 0
+
+    def __repr__(self) -> str:
+        attrs = [(attr, getattr(self, attr)) for attr in self.__slots__]
+        joined = ' '.join('%s=%r' % t for t in attrs)
+        return f'<{self.__class__.__name__} {joined}>'
+
+    @property
+    def hit_ratio(self) -> float:
+        """:class:`float`: The fraction of lookups answered from the cache, fresh or stale."""
+        served = self.hits + self.stale_hits
+        lookups = served + self.misses
+        return served / lookups if lookups else 0.0
+
+    def reset(self) -> None:
+        """Resets all counters to zero."""
+        for attr in self.__slots__:
+            setattr(self, attr, 0)
+
+    def to_dict(self) -> Dict[str, Union[int, float]]:
+        """Returns the counters as a :class:`dict`."""
+        payload: Dict[str, Union[int, float]] = {attr: getattr(self, attr) for attr in self.__slots__}
+        payload['hit_ratio'] = self.hit_ratio
+        return payload
+
+
+class ResponseCache:
+    """A cache for the responses of slow-changing endpoints.
+
+    Only routes with a :class:`CachePolicy` are cached, every other request goes
+    straight to the server. A response is served from the cache while it is
+    fresh; once it expired it is still served for ``stale_while_revalidate``
+    seconds while :class:`HTTPClient` fetches a new one in the background.
+
+    One cache can be passed to many clients, see :class:`ClientPool`, so one
+    account's fetch serves every other account. With a
+    :class:`FileResponseCacheBackend` it is even shared between processes.
+
+    Parameters
+    ----------
+    backend: Optional[:class:`ResponseCacheBackend`]
+        Where entries are kept. Defaults to a :class:`MemoryResponseCacheBackend`.
+    policies: Optional[Mapping[:class:`str`, Optional[:class:`CachePolicy`]]]
+        Policies keyed by ``'METHOD /path/{template}'``, merged over
+        :data:`DEFAULT_CACHE_POLICIES` if ``use_default_policies`` is ``True``.
+        A ``None`` policy disables caching for that route.
+    use_default_policies: :class:`bool`
+        Whether to start from :data:`DEFAULT_CACHE_POLICIES`.
+
+    Attributes
+    ----------
+    stats: :class:`ResponseCacheStats`
+        The counters of this cache.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[ResponseCacheBackend] = None,
+        *,
+        policies: Optional[Mapping[str, Optional[CachePolicy]]] = None,
+        use_default_policies: bool = True,
+    ) -> None:
+        self.backend: ResponseCacheBackend = backend or MemoryResponseCacheBackend()
+        self.policies: Dict[str, CachePolicy] = dict(DEFAULT_CACHE_POLICIES) if use_default_policies else {}
+        for name, policy in (policies or {}).items():
+            self.set_policy(name, policy)
+        self.stats: ResponseCacheStats = ResponseCacheStats()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} backend={self.backend!r} policies={len(self.policies)}>'
+
+    def set_policy(self, route: str, policy: Optional[CachePolicy]) -> None:
+        """Sets or, if ``policy`` is ``None``, removes the policy of a route.
+
+        Parameters
+        ----------
+        route: :class:`str`
+            The route as ``'METHOD /path/{template}'``, e.g. ``'GET /content-service/v3/content'``.
+        policy: Optional[:class:`CachePolicy`]
+            The policy of the route.
+        """
+        if policy is None:
+            self.policies.pop(route, None)
+        else:
+            self.policies[route] = policy
+
+    def get_policy(self, route: Route) -> Optional[CachePolicy]:
+        """Returns the policy of the given route, ``None`` if it is not cached."""
+        return self.policies.get(route.key[2])
+
+    @staticmethod
+    def make_key(route: Route, policy: CachePolicy, puuid: Optional[str], kwargs: Mapping[str, Any]) -> str:
+        """Returns the cache key of a request."""
+        key = f'{route.method} {route.url}'
+        if kwargs:
+            key += ' ' + utils._to_json(kwargs)
+        if not policy.shared:
+            key += f' @{puuid}'
+        return key
+
+    async def get(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """|coro|
+
+        Looks up a response and counts the lookup.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The cache key.
+
+        Returns
+        -------
+        Tuple[Optional[:class:`CacheEntry`], :class:`bool`]
+            The usable entry, or ``None`` on a miss, and whether it is fresh.
+        """
+        entry = await self.backend.get(key)
+        now = time.time()
+        if entry is not None:
+            if entry.is_fresh(now):
+                self.stats.hits += 1
+                return entry, True
+            if entry.is_usable(now):
+                self.stats.stale_hits += 1
+                return entry, False
+        self.stats.misses += 1
+        return None, False
+
+    async def set(
+        self,
+        key: str,
+        data: Any,
+        policy: CachePolicy,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[CacheEntry]:
+        """|coro|
+
+        Stores a response according to its policy and ``Cache-Control`` header.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The cache key.
+        data: Any
+            The decoded response payload.
+        policy: :class:`CachePolicy`
+            The policy of the route.
+        headers: Optional[Mapping[:class:`str`, :class:`str`]]
+            The response headers.
+
+        Returns
+        -------
+        Optional[:class:`CacheEntry`]
+            The stored entry, or ``None`` if the response must not be cached.
+        """
+        ttl = policy.ttl
+        stale = policy.stale_while_revalidate
+        age = 0.0
+
+        if policy.respect_cache_control and headers is not None:
+            directives = parse_cache_control(headers.get('Cache-Control'))
+            if 'no-store' in directives or 'no-cache' in directives:
+                return None
+            if policy.shared and 'private' in directives:
+                return None
+            max_age = _parse_seconds(directives.get('s-maxage') or directives.get('max-age'))
+            if max_age is not None:
+                ttl = max_age
+            swr = _parse_seconds(directives.get('stale-while-revalidate'))
+            if swr is not None:
+                stale = swr
+            age = _parse_seconds(headers.get('Age')) or 0.0
+
+        if ttl + stale - age <= 0:
+            return None
+
+        now = time.time()
+        expires_at = now + ttl - age
+        entry = CacheEntry(data, now, expires_at, expires_at + stale)
+        await self.backend.set(key, entry)
+        self.stats.writes += 1
+        return entry
+
+    async def delete(self, key: str) -> None:
+        """|coro|
+
+        Deletes a response.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The cache key.
+        """
+        await self.backend.delete(key)
+
+    async def clear(self) -> None:
+        """|coro|
+
+        Deletes every response.
+        """
+        await self.backend.clear()
+
+    async def close(self) -> None:
+        """|coro|
+
+        Closes the backend.
+        """
+        await self.backend.close()
@@ -0,0 +1,480 @@
+# Copyright (c) 2023-present STACiA
+# Licensed under the MIT
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Deque, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+import aiohttp
+
+from .errors import CircuitOpen
+from .utils import MISSING
+
+if TYPE_CHECKING:
+    from .http import Route
+
+# fmt: off
+__all__ = (
+    'CircuitBreaker',
+    'DEFAULT_RETRY_STATUSES',
+    'RetryBudget',
+    'RetryPolicy',
+)
+# fmt: on
+
+_log = logging.getLogger(__name__)
+
+# the statuses of a server that failed to answer, not of one that refused the request
+DEFAULT_RETRY_STATUSES: FrozenSet[int] = frozenset({500, 502, 504, 524})
+
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+
+class RetryBudget:
+    """Limits the amount of retries to a fraction of the requests, across every request sharing it.
+
+    A failing server gets at most ``ratio`` times more requests because of
+    retries instead of ``max_attempts`` times more, plus ``min_per_second``
+    retries per second so a client that sends few requests can still retry.
+
+    Parameters
+    ----------
+    ratio: :class:`float`
+        The amount of retries allowed per request sent.
+    min_per_second: :class:`float`
+        The amount of retries per second always allowed.
+    window: :class:`float`
+        The amount of seconds requests and retries are remembered for.
+    """
+
+    __slots__ = ('ratio', 'min_per_second', 'window', '_requests', '_retries', '_lock')
+
+    def __init__(self, *, ratio: float = 0.2, min_per_second: float = 1.0, window: float = 10.0) -> None:
+        if ratio < 0 or min_per_second < 0 or window <= 0:
+            raise ValueError('ratio and min_per_second must be at least 0 and window greater than 0')
+        self.ratio: float = ratio
+        self.min_per_second: float = min_per_second
+        self.window: float = window
+        self._requests: Deque[float] = collections.deque()
+        self._retries: Deque[float] = collections.deque()
+        # a policy may be shared by clients running on different threads
+        self._lock: threading.Lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        attrs = [('ratio', self.ratio), ('min_per_second', self.min_per_second), ('remaining', self.remaining)]
+        joined = ' '.join('%s=%r' % t for t in attrs)
+        return f'<{self.__class__.__name__} {joined}>'
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window
+        for events in (self._requests, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+
+    @property
+    def remaining(self) -> int:
+        """:class:`int`: The amount of retries currently allowed."""
+        with self._lock:
+            self._prune(time.monotonic())
+            allowed = self.min_per_second * self.window + self.ratio * len(self._requests)
+            return max(0, int(allowed) - len(self._retries))
+
+    def deposit(self) -> None:
+        """Records a request, which earns ``ratio`` retries."""
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            self._requests.append(now)
+
+    def withdraw(self) -> bool:
+        """Spends one retry.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the retry is allowed. Nothing is spent when it is not.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            allowed = self.min_per_second * self.window + self.ratio * len(self._requests)
+            if len(self._retries) + 1 > allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+
+class CircuitBreaker:
+    """Tracks the health of one host and stops sending requests to it while it is down.
+
+    The breaker starts ``closed``. It opens when ``failure_threshold``
+    requests in a row failed, or when at least ``minimum_requests`` requests
+    finished in the last ``window`` seconds and at least ``failure_rate`` of
+    them failed. While ``open``, requests to the host raise :exc:`CircuitOpen`
+    at once instead of going through timeouts and retries.
+
+    After ``recovery_time`` seconds the breaker is ``half_open`` and lets
+    ``half_open_probes`` requests through at a time, the others still fail
+    fast. A successful probe closes the breaker, a failed one opens it again.
+
+    A failure is a connection error, a response with one of the
+    :attr:`RetryPolicy.statuses` or a body that could not be read, any other
+    response is a success once its body was read. Each attempt counts once.
+
+    Parameters
+    ----------
+    host: :class:`str`
+        The host, e.g. ``pd.ap.a.pvp.net``.
+    failure_threshold: :class:`int`
+        The amount of failures in a row that opens the breaker.
+    failure_rate: :class:`float`
+        The fraction of failed requests in the window that opens the breaker.
+    minimum_requests: :class:`int`
+        The amount of requests the window needs before ``failure_rate`` applies.
+    window: :class:`float`
+        The amount of seconds requests are remembered for.
+    recovery_time: :class:`float`
+        The amount of seconds the breaker stays open.
+    half_open_probes: :class:`int`
+        The amount of requests allowed at a time while half-open.
+
+    Attributes
+    ----------
+    failures: :class:`int`
+        The amount of failures since the last success.
+    """
+
+    __slots__ = (
+        'host',
+        'failure_threshold',
+        'failure_rate',
+        'minimum_requests',
+        'window',
+        'recovery_time',
+        'half_open_probes',
+        'failures',
+        '_outcomes',
+        '_failed',
+        '_state',
+        '_opened_at',
+        '_probes',
+        '_lock',
+    )
+
+    def __init__(
+        self,
+        host: str,
+        *,
+        failure_threshold: int = 5,
+        failure_rate: float = 0.5,
+        minimum_requests: int = 20,
+        window: float = 30.0,
+        recovery_time: float = 30.0,
+        half_open_probes: int = 1,
+    ) -> None:
+        if failure_threshold < 1 or minimum_requests < 1 or half_open_probes < 1:
+            raise ValueError('failure_threshold, minimum_requests and half_open_probes must be at least 1')
+        if not 0 < failure_rate <= 1:
+            raise ValueError('failure_rate must be greater than 0 and at most 1')
+        if window <= 0 or recovery_time < 0:
+            raise ValueError('window must be greater than 0 and recovery_time at least 0')
+        self.host: str = host
+        self.failure_threshold: int = failure_threshold
+        self.failure_rate: float = failure_rate
+        self.minimum_requests: int = minimum_requests
+        self.window: float = window
+        self.recovery_time: float = recovery_time
+        self.half_open_probes: int = half_open_probes
+        self.failures: int = 0
+        # (finished at, failed) of the requests in the window
+        self._outcomes: Deque[Tuple[float, bool]] = collections.deque()
+        self._failed: int = 0
+        self._state: str = 'closed'
+        self._opened_at: float = 0.0
+        self._probes: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        attrs = [('host', self.host), ('state', self.state), ('error_rate', round(self.error_rate, 3))]
+        joined = ' '.join('%s=%r' % t for t in attrs)
+        return f'<{self.__class__.__name__} {joined}>'
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window
+        outcomes = self._outcomes
+        while outcomes and outcomes[0][0] < cutoff:
+            if outcomes.popleft()[1]:
+                self._failed -= 1
+
+    def _refresh(self, now: float) -> None:
+        if self._state == 'open' and now - self._opened_at >= self.recovery_time:
+            self._state = 'half_open'
+            self._probes = 0
+            _log.info('%s is half-open, probing it with up to %s request(s)', self.host, self.half_open_probes)
+
+    def _open(self, now: float) -> None:
+        self._state = 'open'
+        self._opened_at = now
+        _log.warning(
+            '%s is considered down, failing requests to it for %.2f seconds (%s failure(s) in a row, error rate %.2f)',
+            self.host,
+            self.recovery_time,
+            self.failures,
+            self._failed / len(self._outcomes) if self._outcomes else 0.0,
+        )
+
+    @property
+    def state(self) -> str:
+        """:class:`str`: ``closed``, ``open`` or ``half_open``."""
+        with self._lock:
+            self._refresh(time.monotonic())
+            return self._state
+
+    @property
+    def error_rate(self) -> float:
+        """:class:`float`: The fraction of the requests in the window that failed."""
+        with self._lock:
+            self._prune(time.monotonic())
+            return self._failed / len(self._outcomes) if self._outcomes else 0.0
+
+    @property
+    def retry_after(self) -> float:
+        """:class:`float`: The amount of seconds until the breaker is half-open, ``0`` when it is not open."""
+        with self._lock:
+            now = time.monotonic()
+            self._refresh(now)
+            if self._state != 'open':
+                return 0.0
+            return self._opened_at + self.recovery_time - now
+
+    def is_open(self) -> bool:
+        """:class:`bool`: Whether the host is considered down and requests to it fail fast."""
+        return self.state == 'open'
+
+    def acquire(self) -> bool:
+        """Allows one request to the host.
+
+        Every call that returns must be followed by a call to :meth:`release`
+        once the request finished.
+
+        Raises
+        ------
+        CircuitOpen
+            The breaker is open, or half-open and enough probes are in flight.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the request is a half-open probe.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refresh(now)
+            if self._state == 'open':
+                raise CircuitOpen(self.host, self._opened_at + self.recovery_time - now)
+            if self._state == 'half_open':
+                if self._probes >= self.half_open_probes:
+                    # the probes in flight decide, it is not known when
+                    raise CircuitOpen(self.host, 0.0)
+                self._probes += 1
+                return True
+            return False
+
+    def release(self, probe: bool) -> None:
+        """Marks a request allowed by :meth:`acquire` as finished.
+
+        Parameters
+        ----------
+        probe: :class:`bool`
+            What :meth:`acquire` returned.
+        """
+        if probe:
+            with self._lock:
+                self._probes = max(0, self._probes - 1)
+
+    def record_success(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            self._outcomes.append((now, False))
+            self.failures = 0
+            if self._state == 'half_open':
+                # the failures that opened it are history
+                self._state = 'closed'
+                self._outcomes.clear()
+                self._failed = 0
+                _log.info('%s recovered', self.host)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            self._outcomes.append((now, True))
+            self._failed += 1
+            self.failures += 1
+            if self._state == 'half_open':
+                self._open(now)
+            elif self._state == 'closed':
+                if self.failures >= self.failure_threshold or (
+                    len(self._outcomes) >= self.minimum_requests
+                    and self._failed >= self.failure_rate * len(self._outcomes)
+                ):
+                    self._open(now)
+
+
+class RetryPolicy:
+    """Decides which failed requests :class:`HTTPClient` retries and how long it waits before.
+
+    The delays use decorrelated jitter, each one is random between
+    ``base_delay`` and three times the previous one, capped at ``max_delay``,
+    so the retries of many requests that failed together spread out
+    instead of hitting the server again at the same moment.
+
+    A request that may have changed something on the server, one whose
+    method is not idempotent, e.g. ``POST``, is only retried when it was
+    certainly not processed: the connection could not be made or the server
+    answered 429. :attr:`idempotent_routes` overrides the method per route.
+
+    Parameters
+    ----------
+    max_attempts: :class:`int`
+        The maximum amount of attempts of one request, the first one included.
+    base_delay: :class:`float`
+        The shortest delay before a retry, in seconds.
+    max_delay: :class:`float`
+        The longest delay before a retry, in seconds.
+    statuses: Iterable[:class:`int`]
+        The response statuses that are retried.
+    idempotent_routes: Optional[Mapping[:class:`str`, :class:`bool`]]
+        Whether a route is idempotent, keyed by ``'METHOD /path/{template}'``,
+        the same string as the route's rate limit bucket. Routes not in it
+        are idempotent when their method is.
+    budget: Optional[:class:`RetryBudget`]
+        The retry budget shared by every request using this policy.
+        ``None`` disables it. Defaults to a new :class:`RetryBudget`.
+    circuit_breaker: Optional[Callable[[:class:`str`], :class:`CircuitBreaker`]]
+        Creates the circuit breaker of a host, e.g. a :func:`functools.partial`
+        of :class:`CircuitBreaker` with other thresholds. ``None`` disables
+        circuit breaking. Defaults to :class:`CircuitBreaker`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 20.0,
+        statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        idempotent_routes: Optional[Mapping[str, bool]] = None,
+        budget: Optional[RetryBudget] = MISSING,
+        circuit_breaker: Optional[Callable[[str], CircuitBreaker]] = CircuitBreaker,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1')
+        if base_delay < 0 or max_delay < base_delay:
+            raise ValueError('base_delay must be at least 0 and max_delay at least base_delay')
+        self.max_attempts: int = max_attempts
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+        self.statuses: FrozenSet[int] = frozenset(statuses)
+        self.idempotent_routes: Dict[str, bool] = dict(idempotent_routes or {})
+        self.budget: Optional[RetryBudget] = RetryBudget() if budget is MISSING else budget
+        self.circuit_breaker: Optional[Callable[[str], CircuitBreaker]] = circuit_breaker
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def __repr__(self) -> str:
+        attrs = [
+            ('max_attempts', self.max_attempts),
+            ('base_delay', self.base_delay),
+            ('max_delay', self.max_delay),
+            ('budget', self.budget),
+        ]
+        joined = ' '.join('%s=%r' % t for t in attrs)
+        return f'<{self.__class__.__name__} {joined}>'
+
+    @property
+    def circuit_breakers(self) -> List[CircuitBreaker]:
+        """List[:class:`CircuitBreaker`]: The circuit breaker of every host requested so far."""
+        return list(self._breakers.values())
+
+    def get_circuit_breaker(self, host: str) -> Optional[CircuitBreaker]:
+        """Returns the circuit breaker of the given host, creating it if needed.
+
+        ``None`` when circuit breaking is disabled.
+        """
+        try:
+            return self._breakers[host]
+        except KeyError:
+            if self.circuit_breaker is None:
+                return None
+            breaker = self._breakers[host] = self.circuit_breaker(host)
+            return breaker
+
+    def is_idempotent(self, route: Route) -> bool:
+        """Whether sending the route twice has the same effect as sending it once."""
+        idempotent = self.idempotent_routes.get(route.key[2])
+        if idempotent is None:
+            return route.method in IDEMPOTENT_METHODS
+        return idempotent
+
+    def is_retryable_status(self, route: Route, status: int) -> bool:
+        """Whether a response with the given status is retried, attempts and budget permitting."""
+        return status in self.statuses and self.is_idempotent(route)
+
+    def is_retryable_error(self, route: Route, error: BaseException) -> bool:
+        """Whether a request that failed with the given exception is retried, attempts and budget permitting."""
+        if isinstance(error, (aiohttp.ClientSSLError, aiohttp.ClientConnectorCertificateError)):
+            return False
+        if isinstance(error, aiohttp.ClientConnectorError):
+            # the connection could not be made, nothing was sent
+            return True
+        if not self.is_idempotent(route):
+            return False
+        return isinstance(
+            error,
+            (
+                aiohttp.ServerDisconnectedError,
+                aiohttp.ClientOSError,
+                aiohttp.ClientPayloadError,
+                ConnectionResetError,
+                asyncio.TimeoutError,
+            ),
+        )
+
+    def backoff(self, previous: float) -> float:
+        """Returns the delay before the next retry given the previous delay, ``0`` for the first retry."""
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+    def next_delay(self, route: Route, attempt: int, previous: float) -> Optional[float]:
+        """Returns the delay before retrying a failed attempt, ``None`` if it is not retried.
+
+        The caller already checked the failure is retryable. The request is not
+        retried when it ran out of attempts, when the host's circuit breaker is
+        open or when the retry budget is spent.
+
+        Parameters
+        ----------
+        route: :class:`Route`
+            The route of the request.
+        attempt: :class:`int`
+            The attempt that failed, starting at ``0``.
+        previous: :class:`float`
+            The delay before the attempt that failed, ``0`` for the first one.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        breaker = self.get_circuit_breaker(route.host)
+        if breaker is not None and breaker.is_open():
+            _log.debug('not retrying %s %s, %s is considered down', route.method, route.url, route.host)
+            return None
+        if self.budget is not None and not self.budget.withdraw():
+            _log.debug('not retrying %s %s, the retry budget is spent', route.method, route.url)
+            return None
+        return self.backoff(previous)
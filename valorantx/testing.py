@@ -0,0 +1,588 @@
+# Copyright (c) 2023-present STACiA
+# Licensed under the MIT
+
+"""Offline HTTP replay for valorantx, used by the test and benchmark suites.
+
+Every request valorantx makes, in-game API, valorant-api.com, Riot auth
+helpers and :meth:`HTTPClient.read_from_url`, goes through the session of its
+:class:`ConnectionPool`. The pools in this module hand out a session that
+answers from a :class:`Cassette` instead of the network:
+
+- :class:`ReplayConnectionPool` answers in process, nothing touches a socket.
+- :class:`FakeRiotServer` serves a cassette over HTTP on localhost and
+  :meth:`FakeRiotServer.connection_pool` rewrites the PVP, glz, shared and
+  valorant-api URLs to it, so the whole aiohttp client stack is exercised.
+- :class:`RecordingConnectionPool` passes requests through to the real
+  servers and records the responses into a cassette for later replay.
+
+A cassette matches a request on its method, URL and query string, in any
+parameter order. When a request was recorded more than once the responses
+are replayed in order and the last one repeats.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import gzip
+import os
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from typing import Any, AsyncIterator, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import aiohttp
+import yarl
+from aiohttp import web
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from . import utils
+from .http import ConnectionPool
+
+# fmt: off
+__all__ = (
+    'Cassette',
+    'CassetteMiss',
+    'FakeRiotServer',
+    'Interaction',
+    'RecordingConnectionPool',
+    'ReplayConnectionPool',
+    'ReplayResponse',
+    'ReplaySession',
+)
+# fmt: on
+
+MISSING = utils.MISSING
+
+CASSETTE_FORMAT = 1
+
+# hosts whose traffic carries credentials, never written to a cassette
+AUTH_HOSTS = frozenset({
+    'auth.riotgames.com',
+    'entitlements.auth.riotgames.com',
+    'riot-geo.pas.si.riotgames.com',
+})
+
+# response headers that describe the original transfer, not the payload
+_HOP_BY_HOP = frozenset({'content-length', 'content-encoding', 'transfer-encoding', 'connection', 'set-cookie'})
+
+RequestKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+class CassetteMiss(LookupError):
+    """Raised when a replayed request was never recorded."""
+
+    def __init__(self, method: str, url: str) -> None:
+        self.method: str = method
+        self.url: str = url
+        super().__init__(f'no recorded response for {method} {url}')
+
+
+def _query_value(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+def request_key(method: str, url: Union[str, yarl.URL], params: Optional[Mapping[str, Any]] = None) -> RequestKey:
+    """Returns the key a request is matched on: method, URL without query and the sorted query."""
+    url = yarl.URL(url)
+    query = [(k, v) for k, v in url.query.items()]
+    if params:
+        query.extend((k, _query_value(v)) for k, v in params.items() if v is not None)
+    return method.upper(), str(url.with_query(None)), tuple(sorted(query))
+
+
+class Interaction:
+    """One recorded request and its response."""
+
+    __slots__ = ('method', 'url', 'status', 'headers', 'body')
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        status: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        body: bytes = b'',
+    ) -> None:
+        self.method: str = method.upper()
+        self.url: str = url
+        self.status: int = status
+        self.headers: Dict[str, str] = dict(headers or {})
+        self.body: bytes = body
+
+    def __repr__(self) -> str:
+        return f'<Interaction method={self.method!r} url={self.url!r} status={self.status!r} size={len(self.body)}>'
+
+    @property
+    def key(self) -> RequestKey:
+        return request_key(self.method, self.url)
+
+    def json(self) -> Any:
+        return utils._from_json(self.body)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {'method': self.method, 'url': self.url, 'status': self.status, 'headers': self.headers}
+        if 'json' in self.headers.get('Content-Type', ''):
+            data['json'] = self.json()
+        else:
+            try:
+                data['text'] = self.body.decode('utf-8')
+            except UnicodeDecodeError:
+                data['base64'] = base64.b64encode(self.body).decode('ascii')
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Interaction:
+        if 'json' in data:
+            body = utils._to_json(data['json']).encode('utf-8')
+        elif 'base64' in data:
+            body = base64.b64decode(data['base64'])
+        else:
+            body = data.get('text', '').encode('utf-8')
+        return cls(data['method'], data['url'], data['status'], data.get('headers'), body)
+
+
+class Cassette:
+    """An ordered collection of recorded interactions.
+
+    Parameters
+    ----------
+    interactions: Sequence[:class:`Interaction`]
+        The interactions to start with.
+    """
+
+    def __init__(self, interactions: Sequence[Interaction] = ()) -> None:
+        self._interactions: Dict[RequestKey, List[Interaction]] = {}
+        # how often each key was replayed, to walk through repeated recordings
+        self._plays: Dict[RequestKey, int] = {}
+        for interaction in interactions:
+            self.append(interaction)
+
+    def __repr__(self) -> str:
+        return f'<Cassette interactions={len(self)}>'
+
+    def __len__(self) -> int:
+        return sum(len(recorded) for recorded in self._interactions.values())
+
+    def __iter__(self) -> Iterator[Interaction]:
+        for recorded in self._interactions.values():
+            yield from recorded
+
+    def append(self, interaction: Interaction) -> None:
+        self._interactions.setdefault(interaction.key, []).append(interaction)
+
+    def add_json(
+        self,
+        method: str,
+        url: str,
+        data: Any,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        status: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Interaction:
+        """Records a JSON response for the given request and returns it."""
+        if params:
+            url = str(yarl.URL(url).update_query({k: _query_value(v) for k, v in params.items() if v is not None}))
+        headers = {'Content-Type': 'application/json; charset=utf-8', **(headers or {})}
+        interaction = Interaction(method, url, status, headers, utils._to_json(data).encode('utf-8'))
+        self.append(interaction)
+        return interaction
+
+    def find(self, method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> Optional[Interaction]:
+        """Returns the next response for the given request, ``None`` if it was never recorded."""
+        key = request_key(method, url, params)
+        recorded = self._interactions.get(key)
+        if not recorded:
+            return None
+        plays = self._plays.get(key, 0)
+        self._plays[key] = plays + 1
+        return recorded[min(plays, len(recorded) - 1)]
+
+    def search(self, fragment: str, *, method: str = 'GET') -> List[Interaction]:
+        """Returns every interaction whose URL contains ``fragment``."""
+        return [i for i in self if i.method == method and fragment in i.url]
+
+    def rewind(self) -> None:
+        """Replays repeated recordings from the first one again."""
+        self._plays.clear()
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike[str]]) -> Cassette:
+        """Loads a cassette saved with :meth:`save`, gzip compressed or not."""
+        with open(path, 'rb') as f:
+            raw = f.read()
+        if raw[:2] == b'\x1f\x8b':
+            raw = gzip.decompress(raw)
+        data = utils._from_json(raw)
+        if data.get('format') != CASSETTE_FORMAT:
+            raise ValueError(f'unsupported cassette format {data.get("format")!r}')
+        return cls([Interaction.from_dict(i) for i in data['interactions']])
+
+    def save(self, path: Union[str, os.PathLike[str]]) -> None:
+        """Saves the cassette as JSON, gzip compressed if the path ends with ``.gz``."""
+        data = {'format': CASSETTE_FORMAT, 'interactions': [i.to_dict() for i in self]}
+        raw = utils._to_json(data).encode('utf-8')
+        if os.fspath(path).endswith('.gz'):
+            raw = gzip.compress(raw)
+        with open(path, 'wb') as f:
+            f.write(raw)
+
+
+# in process replay
+
+
+class _ReplayStream:
+    def __init__(self, body: bytes) -> None:
+        self._body: bytes = body
+        self._pos: int = 0
+
+    async def read(self, n: int = -1) -> bytes:
+        end = len(self._body) if n < 0 else self._pos + n
+        chunk = self._body[self._pos : end]
+        self._pos += len(chunk)
+        return chunk
+
+    async def iter_chunked(self, n: int) -> AsyncIterator[bytes]:
+        while self._pos < len(self._body):
+            yield await self.read(n)
+
+    async def iter_any(self) -> AsyncIterator[bytes]:
+        yield await self.read()
+
+
+class ReplayResponse:
+    """The subset of :class:`aiohttp.ClientResponse` valorantx uses, answered from an :class:`Interaction`."""
+
+    def __init__(self, method: str, url: str, interaction: Interaction, cookies: Optional[SimpleCookie] = None) -> None:
+        self.method: str = method
+        self.url: yarl.URL = yarl.URL(url)
+        self.status: int = interaction.status
+        try:
+            self.reason: str = HTTPStatus(interaction.status).phrase
+        except ValueError:
+            self.reason = ''
+        self.headers: CIMultiDictProxy[str] = CIMultiDictProxy(CIMultiDict(interaction.headers))
+        if cookies is None:
+            cookies = SimpleCookie(interaction.headers.get('Set-Cookie', ''))
+        self.cookies: SimpleCookie = cookies
+        self.content: _ReplayStream = _ReplayStream(interaction.body)
+        self._body: bytes = interaction.body
+
+    def __repr__(self) -> str:
+        return f'<ReplayResponse({self.url}) [{self.status} {self.reason}]>'
+
+    async def __aenter__(self) -> ReplayResponse:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.release()
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get('Content-Type', 'application/octet-stream').partition(';')[0]
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: Optional[str] = None) -> str:
+        return self._body.decode(encoding or 'utf-8')
+
+    async def json(self, *, loads: Any = utils._from_json, **kwargs: Any) -> Any:
+        return loads(self._body)
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise aiohttp.ClientResponseError(
+                None,  # type: ignore
+                (),
+                status=self.status,
+                message=self.reason,
+                headers=self.headers,
+            )
+
+    def release(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class _SessionMethods:
+    def request(self, method: str, url: Union[str, yarl.URL], **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    def get(self, url: Union[str, yarl.URL], **kwargs: Any) -> Any:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: Union[str, yarl.URL], **kwargs: Any) -> Any:
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url: Union[str, yarl.URL], **kwargs: Any) -> Any:
+        return self.request('PUT', url, **kwargs)
+
+    def delete(self, url: Union[str, yarl.URL], **kwargs: Any) -> Any:
+        return self.request('DELETE', url, **kwargs)
+
+
+class ReplaySession(_SessionMethods):
+    """Answers requests from a :class:`Cassette`, in place of an :class:`aiohttp.ClientSession`.
+
+    Parameters
+    ----------
+    cassette: :class:`Cassette`
+        The recorded responses.
+    strict: :class:`bool`
+        Whether a request that was never recorded raises :exc:`CassetteMiss`.
+        Otherwise it is answered with a Riot style 404.
+    """
+
+    def __init__(self, cassette: Cassette, *, strict: bool = True) -> None:
+        self.cassette: Cassette = cassette
+        self.strict: bool = strict
+        self.requests: List[Tuple[str, str]] = []
+        self._closed: bool = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def close(self) -> None:
+        self._closed = True
+
+    def request(self, method: str, url: Union[str, yarl.URL], **kwargs: Any) -> ReplayResponse:
+        url = str(yarl.URL(url).update_query(_encode_params(kwargs.get('params'))))
+        self.requests.append((method.upper(), url))
+        interaction = self.cassette.find(method, url)
+        if interaction is None:
+            if self.strict:
+                raise CassetteMiss(method.upper(), url)
+            interaction = _not_found(method, url)
+        return ReplayResponse(method.upper(), url, interaction)
+
+
+def _encode_params(params: Optional[Mapping[str, Any]]) -> Dict[str, str]:
+    if not params:
+        return {}
+    return {k: _query_value(v) for k, v in params.items() if v is not None}
+
+
+def _not_found(method: str, url: str) -> Interaction:
+    body = {'httpStatus': 404, 'errorCode': 'RESOURCE_NOT_FOUND', 'message': 'no recorded response'}
+    return Interaction(method, url, 404, {'Content-Type': 'application/json'}, utils._to_json(body).encode('utf-8'))
+
+
+class ReplayConnectionPool(ConnectionPool):
+    """A :class:`ConnectionPool` whose session replays a :class:`Cassette`.
+
+    Pass it as the ``connection_pool`` of a :class:`Client` or :class:`ClientPool`.
+
+    Parameters
+    ----------
+    cassette: :class:`Cassette`
+        The recorded responses.
+    strict: :class:`bool`
+        See :class:`ReplaySession`.
+    """
+
+    def __init__(self, cassette: Cassette, *, strict: bool = True) -> None:
+        super().__init__()
+        self.cassette: Cassette = cassette
+        self.strict: bool = strict
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is MISSING or self._session.closed:
+            self._session = ReplaySession(self.cassette, strict=self.strict)  # type: ignore
+        return self._session
+
+
+# recording
+
+
+class _RecordedRequest:
+    def __init__(self, session: _RecordingSession, method: str, url: Union[str, yarl.URL], kwargs: Any) -> None:
+        self._session: _RecordingSession = session
+        self._method: str = method.upper()
+        self._url: str = str(yarl.URL(url).update_query(_encode_params(kwargs.get('params'))))
+        kwargs.pop('params', None)
+        self._kwargs: Dict[str, Any] = kwargs
+
+    async def __aenter__(self) -> ReplayResponse:
+        async with self._session.session.request(self._method, self._url, **self._kwargs) as response:
+            body = await response.read()
+            headers = {str(k): v for k, v in response.headers.items() if k.lower() not in _HOP_BY_HOP}
+            interaction = Interaction(self._method, self._url, response.status, headers, body)
+        if yarl.URL(self._url).host not in AUTH_HOSTS:
+            self._session.cassette.append(interaction)
+        # the cookies are not recorded, but the account they were sent for still keeps them
+        return ReplayResponse(self._method, self._url, interaction, response.cookies)
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+
+class _RecordingSession(_SessionMethods):
+    def __init__(self, session: aiohttp.ClientSession, cassette: Cassette) -> None:
+        self.session: aiohttp.ClientSession = session
+        self.cassette: Cassette = cassette
+
+    @property
+    def closed(self) -> bool:
+        return self.session.closed
+
+    async def close(self) -> None:
+        await self.session.close()
+
+    def request(self, method: str, url: Union[str, yarl.URL], **kwargs: Any) -> _RecordedRequest:
+        return _RecordedRequest(self, method, url, kwargs)
+
+
+class RecordingConnectionPool(ConnectionPool):
+    """A :class:`ConnectionPool` that records every response it receives into a :class:`Cassette`.
+
+    Responses from the Riot auth hosts are passed through but never recorded,
+    and ``Set-Cookie`` headers are dropped. Save the cassette with :meth:`Cassette.save`.
+
+    Parameters
+    ----------
+    cassette: Optional[:class:`Cassette`]
+        The cassette to record into. A new one is created if not given.
+    **options: Any
+        Keyword arguments passed to :class:`ConnectionPool`.
+    """
+
+    def __init__(self, cassette: Optional[Cassette] = None, **options: Any) -> None:
+        super().__init__(**options)
+        self.cassette: Cassette = cassette if cassette is not None else Cassette()
+        self._recording: Optional[_RecordingSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        session = super().session
+        if self._recording is None or self._recording.session is not session:
+            self._recording = _RecordingSession(session, self.cassette)
+        return self._recording  # type: ignore
+
+
+# local server
+
+
+class _RedirectingSession(_SessionMethods):
+    def __init__(self, session: aiohttp.ClientSession, base_url: yarl.URL) -> None:
+        self.session: aiohttp.ClientSession = session
+        self.base_url: yarl.URL = base_url
+
+    @property
+    def closed(self) -> bool:
+        return self.session.closed
+
+    async def close(self) -> None:
+        await self.session.close()
+
+    def request(self, method: str, url: Union[str, yarl.URL], **kwargs: Any) -> Any:
+        # https://pd.ap.a.pvp.net/x?y -> http://127.0.0.1:port/pd.ap.a.pvp.net/x?y
+        url = yarl.URL(url)
+        target = self.base_url.with_path(f'/{url.host}{url.raw_path}', encoded=True).with_query(url.raw_query_string)
+        kwargs.pop('ssl', None)
+        return self.session.request(method, target, **kwargs)
+
+
+class _ServerConnectionPool(ConnectionPool):
+    def __init__(self, base_url: yarl.URL, **options: Any) -> None:
+        super().__init__(**options)
+        self.base_url: yarl.URL = base_url
+        self._redirecting: Optional[_RedirectingSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        session = super().session
+        if self._redirecting is None or self._redirecting.session is not session:
+            self._redirecting = _RedirectingSession(session, self.base_url)
+        return self._redirecting  # type: ignore
+
+
+class FakeRiotServer:
+    """Serves a :class:`Cassette` over HTTP on localhost.
+
+    Requests are expected at ``/{original host}{original path}``, which is
+    where the pools from :meth:`connection_pool` send them. Unrecorded
+    requests are answered with a Riot style 404.
+
+    Parameters
+    ----------
+    cassette: :class:`Cassette`
+        The recorded responses.
+    latency: :class:`float`
+        Seconds every response is delayed by, to model the round trip to Riot.
+    host: :class:`str`
+        The address to listen on.
+    port: :class:`int`
+        The port to listen on, ``0`` picks a free one.
+    """
+
+    def __init__(self, cassette: Cassette, *, latency: float = 0.0, host: str = '127.0.0.1', port: int = 0) -> None:
+        self.cassette: Cassette = cassette
+        self.latency: float = latency
+        self.host: str = host
+        self.port: int = port
+        self.requests: int = 0
+        self.misses: List[Tuple[str, str]] = []
+        self._runner: Optional[web.AppRunner] = None
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} url={str(self.url)!r} requests={self.requests}>'
+
+    async def __aenter__(self) -> FakeRiotServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.stop()
+
+    @property
+    def url(self) -> yarl.URL:
+        return yarl.URL.build(scheme='http', host=self.host, port=self.port)
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_route('*', '/{host}/{path:.*}', self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            self.port = site._server.sockets[0].getsockname()[1]  # type: ignore
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def connection_pool(self, **options: Any) -> ConnectionPool:
+        """Returns a :class:`ConnectionPool` that sends every request to this server.
+
+        Parameters
+        ----------
+        **options: Any
+            Keyword arguments passed to :class:`ConnectionPool`.
+        """
+        return _ServerConnectionPool(self.url, **options)
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        self.requests += 1
+        # /pd.ap.a.pvp.net/x?y -> https://pd.ap.a.pvp.net/x?y
+        url = 'https:/' + request.raw_path
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        interaction = self.cassette.find(request.method, url)
+        if interaction is None:
+            self.misses.append((request.method, url))
+            interaction = _not_found(request.method, url)
+
+        headers = {k: v for k, v in interaction.headers.items() if k.lower() not in _HOP_BY_HOP}
+        return web.Response(status=interaction.status, headers=headers, body=interaction.body)
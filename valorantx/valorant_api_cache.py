@@ -3,11 +3,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Optional
+import os
+import zlib
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 from valorant.cache import CacheState as CacheStateValorantAPI
 
+from . import utils
 from .enums import ItemTypeID, Locale
 from .models.buddies import Buddy
 from .models.level_borders import LevelBorder
@@ -26,6 +30,35 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 
+# bump when the snapshot layout changes so old files are refetched instead of misread
+SNAPSHOT_FORMAT = 1
+
+# the catalogue endpoints loaded on init, each one is parsed by the matching `_add_*` method
+SNAPSHOT_ENDPOINTS = (
+    'agents',
+    'buddies',
+    'bundles',
+    'ceremonies',
+    'competitive_tiers',
+    'content_tiers',
+    'contracts',
+    'currencies',
+    'events',
+    'game_modes',
+    'game_mode_equippables',
+    'gear',
+    'level_borders',
+    'maps',
+    'missions',
+    'player_cards',
+    'player_titles',
+    'seasons',
+    'competitive_seasons',
+    'sprays',
+    'themes',
+    'weapons',
+)
+
 # fmt: off
 __all__ = (
     'CacheState',
@@ -49,12 +82,76 @@ class CacheState(CacheStateValorantAPI):
         _player_titles: Dict[str, PlayerTitle]
         _level_borders: Dict[str, LevelBorder]
 
-    def __init__(self, *, locale: Locale, http: HTTPClient) -> None:
+    def __init__(
+        self,
+        *,
+        locale: Locale,
+        http: HTTPClient,
+        snapshot_path: Optional[Union[str, os.PathLike[str]]] = None,
+    ) -> None:
         super().__init__(locale=locale, http=http)
+        self.snapshot_path: Optional[str] = os.fspath(snapshot_path) if snapshot_path is not None else None
 
     async def init(self) -> None:
-        await super().init()
-        # valorant valtracker
+        if self.snapshot_path is None:
+            await super().init()
+            return
+
+        loop = asyncio.get_running_loop()
+        version = await self.http.get_version()
+        snapshot = await loop.run_in_executor(None, self._read_snapshot)
+        if snapshot is not None and snapshot['version'] == version['data'] and snapshot['locale'] == str(self.locale):
+            payloads = snapshot['payloads']
+            _log.info('cache loaded from snapshot %r', self.snapshot_path)
+        else:
+            results = await asyncio.gather(*(getattr(self.http, f'get_{name}')() for name in SNAPSHOT_ENDPOINTS))
+            payloads = dict(zip(SNAPSHOT_ENDPOINTS, results))
+            snapshot = {
+                'format': SNAPSHOT_FORMAT,
+                'locale': str(self.locale),
+                'version': version['data'],
+                'payloads': payloads,
+            }
+            await loop.run_in_executor(None, self._write_snapshot, snapshot)
+            _log.info('cache snapshot %r written for version %s', self.snapshot_path, version['data']['version'])
+
+        for name in SNAPSHOT_ENDPOINTS:
+            getattr(self, f'_add_{name}')(payloads[name])
+        self._add_version(version)
+        _log.info('cache initialized')
+
+    # snapshot
+
+    def _read_snapshot(self) -> Optional[Dict[str, Any]]:
+        assert self.snapshot_path is not None
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                snapshot = utils._from_json(zlib.decompress(f.read()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zlib.error) as e:
+            _log.warning('ignoring unreadable cache snapshot %r: %s', self.snapshot_path, e)
+            return None
+
+        if not isinstance(snapshot, dict) or snapshot.get('format') != SNAPSHOT_FORMAT:
+            return None
+        return snapshot
+
+    def _write_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        assert self.snapshot_path is not None
+        blob = zlib.compress(utils._to_json(snapshot).encode('utf-8'))
+        directory = os.path.dirname(self.snapshot_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # write then rename, so a crash never leaves a torn snapshot behind
+        temp = f'{self.snapshot_path}.tmp'
+        try:
+            with open(temp, 'wb') as f:
+                f.write(blob)
+            os.replace(temp, self.snapshot_path)
+        except OSError as e:
+            _log.warning('could not write cache snapshot %r: %s', self.snapshot_path, e)
 
     # buddies
 
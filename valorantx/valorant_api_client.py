@@ -2,19 +2,23 @@
 # Licensed under the MIT license. Refer to the LICENSE file in the project root for more information.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+import os
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
-from aiohttp import ClientSession
 from valorant.client import Client as ClientValorantAPI
-from valorant.http import HTTPClient
+from valorant.http import HTTPClient as HTTPClientValorantAPI
 from valorant.models.maps import Map
 from valorant.models.seasons import CompetitiveSeason
 
 from .enums import ItemTypeID, Locale
 from .models.store import Offers
+from .utils import MISSING
 from .valorant_api_cache import CacheState
 
 if TYPE_CHECKING:
+    from valorant.models.version import Version
+
+    from .http import ConnectionPool
     from .models import (
         Buddy,
         BuddyLevel,
@@ -37,6 +41,37 @@ __all__ = (
 )
 # fmt: on
 
+# match payloads name the game mode by its blueprint path, which valorant-api.com does not expose
+GAME_MODE_URLS: Dict[str, str] = {
+    '/Game/GameModes/Bomb/BombGameMode.BombGameMode_C': '96bd3920-4f36-d026-2b28-c683eb0bcac5',
+    '/Game/GameModes/Deathmatch/DeathmatchGameMode.DeathmatchGameMode_C': 'a8790ec5-4237-f2f0-e93b-08a8e89865b2',
+    '/Game/GameModes/GunGame/GunGameTeamsGameMode.GunGameTeamsGameMode_C': 'a4ed6518-4741-6dcb-35bd-f884aecdc859',
+    '/Game/GameModes/OneForAll/OneForAll_GameMode.OneForAll_GameMode_C': '4744698a-4513-dc96-9c22-a9aa437e4a58',
+    '/Game/GameModes/QuickBomb/QuickBombGameMode.QuickBombGameMode_C': 'e921d1e6-416b-c31f-1291-74930c330b7b',
+    '/Game/GameModes/SnowballFight/SnowballFightGameMode.SnowballFightGameMode_C': '57038d6d-49b1-3a74-c5ef-3395d9f23a97',
+    '/Game/GameModes/ShootingRange/ShootingRangeGameMode.ShootingRangeGameMode_C': 'e2dc3878-4fe5-d132-28f8-3d8c259efcc6',
+    '/Game/GameModes/NewPlayerExperience/NPEGameMode.NPEGameMode_C': 'd2b4e425-4cab-8d95-eb26-bb9b444551dc',
+    '/Game/GameModes/_Development/Swiftplay_EndOfRoundCredits/Swiftplay_EoRCredits_GameMode.Swiftplay_EoRCredits_GameMode_C': (
+        '5d0f264b-4ebe-cc63-c147-809e1374484b'
+    ),
+}
+
+
+class HTTPClient(HTTPClientValorantAPI):
+    """valorant-api.com HTTP client that borrows its session from a :class:`ConnectionPool`."""
+
+    def __init__(self, connection_pool: ConnectionPool) -> None:
+        super().__init__()
+        self.connection_pool: ConnectionPool = connection_pool
+
+    async def init(self) -> None:
+        # the parent keeps the session in a name mangled attribute
+        self._HTTPClient__session = self.connection_pool.session
+
+    async def close(self) -> None:
+        # the session belongs to the connection pool, which is closed by its owner
+        self._HTTPClient__session = MISSING
+
 
 class Client(ClientValorantAPI):
     if TYPE_CHECKING:
@@ -51,10 +86,29 @@ class Client(ClientValorantAPI):
         player_cards: List[PlayerCard]
         weapons: List[Weapon]
 
-    def __init__(self, session: ClientSession, locale: Locale) -> None:
+    def __init__(
+        self,
+        connection_pool: ConnectionPool,
+        locale: Locale,
+        *,
+        snapshot_path: Optional[Union[str, os.PathLike[str]]] = None,
+    ) -> None:
         super().__init__(locale)
-        self.http: HTTPClient = HTTPClient(session)
-        self.cache: CacheState = CacheState(locale=locale, http=self.http)
+        self.http: HTTPClient = HTTPClient(connection_pool)
+        self.cache: CacheState = CacheState(locale=locale, http=self.http, snapshot_path=snapshot_path)
+        self._indexed_version: Optional[Version] = None
+        self._maps_by_url: Dict[str, Map] = {}
+        self._game_modes_by_url: Dict[str, GameMode] = {}
+        self._competitive_seasons_by_season_id: Dict[str, CompetitiveSeason] = {}
+        self._tiers: Dict[Tuple[str, int], Tier] = {}
+
+    async def init(self) -> None:
+        await super().init()
+        self._ensure_indexes()
+
+    async def reload(self) -> None:
+        await super().reload()
+        self._ensure_indexes()
 
     def insert_cost(self, offers: Offers) -> None:
         for offer in offers.offers:
@@ -101,51 +155,60 @@ class Client(ClientValorantAPI):
 
     # custom
 
+    def _ensure_indexes(self) -> None:
+        # the indexes are keyed on the cache version, so a reload or a fetched version rebuilds them
+        version = self.cache._version
+        if version is MISSING:
+            # the cache was cleared, the indexes must not keep serving its objects
+            if self._indexed_version is not None:
+                self._clear_indexes()
+            return
+        if version is self._indexed_version:
+            return
+        self._build_indexes()
+        self._indexed_version = version
+
+    def _clear_indexes(self) -> None:
+        self._maps_by_url = {}
+        self._game_modes_by_url = {}
+        self._competitive_seasons_by_season_id = {}
+        self._tiers = {}
+        self._indexed_version = None
+
+    def _build_indexes(self) -> None:
+        self._maps_by_url = {map.url: map for map in self.cache.maps}
+
+        self._game_modes_by_url = {}
+        for url, uuid in GAME_MODE_URLS.items():
+            game_mode = self.get_game_mode(uuid)
+            if game_mode is not None:
+                self._game_modes_by_url[url] = game_mode
+
+        self._competitive_seasons_by_season_id = {}
+        self._tiers = {}
+        for competitive_season in self.competitive_seasons:
+            if competitive_season.season is None:
+                continue
+            season_id = competitive_season.season_uuid
+            self._competitive_seasons_by_season_id[season_id] = competitive_season
+            competitive_tiers = competitive_season.competitive_tiers
+            if competitive_tiers is None:
+                continue
+            for tier in competitive_tiers.tiers:
+                self._tiers[(season_id, tier.tier)] = tier
+
     def get_map_by_url(self, url: str, /) -> Optional[Map]:
-        for map in self.cache.maps:
-            if map.url == url:
-                return map
-        return None
+        self._ensure_indexes()
+        return self._maps_by_url.get(url)
 
     def get_game_mode_by_url(self, url: str, /) -> Optional[GameMode]:
-        if url == '/Game/GameModes/Bomb/BombGameMode.BombGameMode_C':
-            return self.get_game_mode('96bd3920-4f36-d026-2b28-c683eb0bcac5')
-        elif url == '/Game/GameModes/Deathmatch/DeathmatchGameMode.DeathmatchGameMode_C':
-            return self.get_game_mode('a8790ec5-4237-f2f0-e93b-08a8e89865b2')
-        elif url == '/Game/GameModes/GunGame/GunGameTeamsGameMode.GunGameTeamsGameMode_C':
-            return self.get_game_mode('a4ed6518-4741-6dcb-35bd-f884aecdc859')
-        elif url == '/Game/GameModes/OneForAll/OneForAll_GameMode.OneForAll_GameMode_C':
-            return self.get_game_mode('4744698a-4513-dc96-9c22-a9aa437e4a58')
-        elif url == '/Game/GameModes/QuickBomb/QuickBombGameMode.QuickBombGameMode_C':
-            return self.get_game_mode('e921d1e6-416b-c31f-1291-74930c330b7b')
-        elif url == '/Game/GameModes/SnowballFight/SnowballFightGameMode.SnowballFightGameMode_C':
-            return self.get_game_mode('57038d6d-49b1-3a74-c5ef-3395d9f23a97')
-        elif url == '/Game/GameModes/ShootingRange/ShootingRangeGameMode.ShootingRangeGameMode_C':
-            return self.get_game_mode('e2dc3878-4fe5-d132-28f8-3d8c259efcc6')
-        elif url == '/Game/GameModes/NewPlayerExperience/NPEGameMode.NPEGameMode_C':
-            return self.get_game_mode('d2b4e425-4cab-8d95-eb26-bb9b444551dc')
-        elif (
-            url
-            == '/Game/GameModes/_Development/Swiftplay_EndOfRoundCredits/Swiftplay_EoRCredits_GameMode.Swiftplay_EoRCredits_GameMode_C'
-        ):
-            return self.get_game_mode('5d0f264b-4ebe-cc63-c147-809e1374484b')
-        return None
+        self._ensure_indexes()
+        return self._game_modes_by_url.get(url)
 
     def get_competitive_season_by_season_id(self, season_id: str, /) -> Optional[CompetitiveSeason]:
-        for ss_com in self.competitive_seasons:
-            if ss_com.season is None:
-                continue
-            if ss_com.season.id == season_id:
-                return ss_com
-        return None
+        self._ensure_indexes()
+        return self._competitive_seasons_by_season_id.get(season_id)
 
     def get_tier(self, season_id: str, tier: int) -> Optional[Tier]:
-        competitive_season = self.get_competitive_season_by_season_id(season_id)
-        if competitive_season is None:
-            return None
-        if competitive_season.competitive_tiers is None:
-            return None
-        for t in competitive_season.competitive_tiers.tiers:
-            if t.tier == tier:
-                return t
-        return None
+        self._ensure_indexes()
+        return self._tiers.get((season_id, tier))